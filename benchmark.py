@@ -0,0 +1,324 @@
+import argparse
+import json
+import os
+import platform
+import random
+import shutil
+import sqlite3
+import statistics
+import sys
+import time
+import tracemalloc
+from typing import Dict, Any, List, Callable
+from database_helper import PokemonDatabase
+from game_ai import TwentyQuestionsAI, pokemon_matches
+from learning import PopularityLearner
+from sharded_catalog import ShardedQuestionsAI
+from simulation import play_simulated_game
+
+DEFAULT_DB = "database_files/database/pokemon_database.db"
+DEFAULT_CATALOG_DIR = ".benchmark_catalogs"
+DEFAULT_SIZES = "real,10k,100k,1M"
+
+# columns that only make sense together are sampled from the same real row,
+# so each group keeps its joint distribution (a Gen 1 Pokemon is from Kanto, Name
+# and Evolves_from keep real evolution chains) while groups mix freely
+COLUMN_GROUPS = [
+    ['Name', 'Lengendary', 'Mythical', 'Baby', 'Fossile', 'Starter', 'Mega_Evolve', 'Gigantamax',
+     'Evolves', 'Evolves_from', 'Evolves_from_stone', 'Evolves_from_trading', 'Sprite_Default'],
+    ['Type_1', 'Type_2'],
+    ['Primay_Color'],
+    ['Region', 'Generation'],
+    ['Gender_Rate', 'Number_of_Legs'],
+    ['Popularity'],
+]
+
+
+def parse_size(size: str) -> int:
+    # '10k' -> 10000, '1M' -> 1000000
+    multipliers = {'k': 1000, 'm': 1000000}
+    suffix = size[-1].lower()
+    if suffix in multipliers:
+        return int(float(size[:-1]) * multipliers[suffix])
+    return int(size)
+
+
+def make_synthetic_catalog(source_db: str, path: str, size: int, seed: int = 0):
+    # writes a mytable with size rows drawn from the real table's distributions
+    source = sqlite3.connect(source_db)
+    source.row_factory = sqlite3.Row
+    schema = source.execute(
+        "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'mytable'"
+    ).fetchone()[0]
+    real_rows = [dict(row) for row in source.execute("SELECT * FROM mytable")]
+    source.close()
+
+    columns = list(real_rows[0].keys())
+    rng = random.Random(seed)
+
+    def rows():
+        for pokemon_id in range(1, size + 1):
+            row = {'ID': pokemon_id}
+            for group in COLUMN_GROUPS:
+                template = rng.choice(real_rows)
+                for column in group:
+                    row[column] = template[column]
+            # keep the species part first so evolution stages can still be derived
+            row['Name'] = f"{row['Name']}-{pokemon_id}"
+            yield tuple(row[column] for column in columns)
+
+    tmp_path = path + '.building'
+    if os.path.exists(tmp_path):
+        os.remove(tmp_path)
+    connection = sqlite3.connect(tmp_path)
+    connection.execute(schema)
+    connection.executemany(
+        f"INSERT INTO mytable({','.join(columns)}) VALUES ({','.join('?' * len(columns))})",
+        rows()
+    )
+    connection.commit()
+    connection.close()
+    os.replace(tmp_path, path)
+
+
+def prepare_catalog(source_db: str, catalog_dir: str, size_name: str, seed: int) -> str:
+    # benchmarks write Popularity, so even the real table is benchmarked on a copy
+    os.makedirs(catalog_dir, exist_ok=True)
+    path = os.path.join(catalog_dir, f"catalog_{size_name}.db")
+    if size_name == 'real':
+        shutil.copyfile(source_db, path)
+    elif not os.path.exists(path):
+        print(f"Generating {size_name} catalog...")
+        make_synthetic_catalog(source_db, path, parse_size(size_name), seed)
+    return path
+
+
+def measure(operation: Callable[[Any], Any], setup: Callable[[], Any], repeat: int) -> Dict[str, float]:
+    # setup runs untimed before every call; memory is a separate traced call
+    # so tracemalloc's overhead doesn't leak into the timings
+    timings = []
+    for _ in range(repeat):
+        state = setup()
+        start = time.perf_counter()
+        operation(state)
+        timings.append((time.perf_counter() - start) * 1000)
+
+    state = setup()
+    tracemalloc.start()
+    operation(state)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    timings.sort()
+    return {
+        'median_ms': statistics.median(timings),
+        'min_ms': timings[0],
+        'p95_ms': timings[min(len(timings) - 1, int(len(timings) * 0.95))],
+        'peak_kb': peak / 1024
+    }
+
+
+def benchmark_catalog(db_path: str, repeat: int, games: int, seed: int,
+                      use_learning: bool = True, parallel_workers: int = 0) -> Dict[str, Dict[str, float]]:
+    db = PokemonDatabase(db_path)
+    rng = random.Random(seed)
+    results = {}
+
+    results['ai_init'] = measure(lambda _: TwentyQuestionsAI(db, use_learning=use_learning), lambda: None, repeat)
+
+    ai = TwentyQuestionsAI(db, use_learning=use_learning)
+    if parallel_workers:
+        ai.enable_parallel_scoring(parallel_workers)
+    targets = list(ai.remaining_pokemon)
+    full_state = ai.remaining_pokemon
+
+    def fresh_ai():
+        ai.reset()
+        return ai
+
+    results['find_best_question'] = measure(lambda a: a.find_best_question(), fresh_ai, repeat)
+
+    def root_question():
+        fresh_ai()
+        question_type, question_detail = ai.find_best_question()
+        target = rng.choice(targets)
+        return question_type, question_detail, pokemon_matches(target, question_type, question_detail)
+
+    results['update_filters'] = measure(lambda q: ai.update_filters(*q), root_question, repeat)
+
+    def random_filters():
+        target = rng.choice(full_state)
+        return {'Region': target['Region'], 'Evolves': target['Evolves']}
+
+    results['filter_pokemon_multi'] = measure(db.filter_pokemon_multi, random_filters, repeat)
+
+    learner = PopularityLearner(db, index=ai.popularity_index)
+
+    def finished_game():
+        target = rng.choice(full_state)
+        candidates = [target] + rng.sample(full_state, min(4, len(full_state)))
+        return target['ID'], candidates, True
+
+    results['update_popularity'] = measure(lambda g: learner.update_popularity(*g), finished_game, repeat)
+
+    # macro: whole self-played games, timed per game
+    game_targets = rng.sample(targets, min(games, len(targets)))
+    per_game = iter(game_targets)
+    results['self_play_game'] = measure(lambda t: play_simulated_game(ai, t),
+                                        lambda: next(per_game, game_targets[0]), len(game_targets))
+
+    ai.close()
+    db.close()
+    return results
+
+
+def benchmark_shards(db_path: str, shard_counts: List[int], games: int, seed: int) -> Dict[str, Dict[str, float]]:
+    # turn latency (find_best_question + update_filters) in-process vs. 1..N shard processes
+    db = PokemonDatabase(db_path)
+    stages = db.get_evolution_stages()
+    db.cursor.execute("SELECT ID FROM mytable")
+    ids = [row[0] for row in db.cursor.fetchall()]
+    targets = []
+    for pokemon_id in random.Random(seed).sample(ids, min(games, len(ids))):
+        target = db.get_pokemon_by_id(pokemon_id)
+        target['Evolution_Stage'] = stages.get(pokemon_id)
+        targets.append(target)
+    del stages, ids
+
+    results = {}
+    for shards in [0] + shard_counts:
+        start = time.perf_counter()
+        ai = ShardedQuestionsAI(db, shards=shards) if shards else TwentyQuestionsAI(db)
+        startup = (time.perf_counter() - start) * 1000
+
+        first_turns = []
+        turns = []
+        for target in targets:
+            ai.reset()
+            while ai.get_remaining_count() > 3 and ai.questions_asked < ai.max_questions:
+                start = time.perf_counter()
+                question_type, question_detail = ai.find_best_question()
+                if question_type is None:
+                    break
+                ai.update_filters(question_type, question_detail,
+                                  pokemon_matches(target, question_type, question_detail))
+                elapsed = (time.perf_counter() - start) * 1000
+                turns.append(elapsed)
+                if ai.questions_asked == 1:
+                    first_turns.append(elapsed)
+        if shards:
+            ai.close()
+
+        turns.sort()
+        results[f"{shards} shards" if shards else "in-process"] = {
+            'startup_ms': startup,
+            'first_turn_ms': statistics.median(first_turns) if first_turns else 0.0,
+            'median_turn_ms': statistics.median(turns) if turns else 0.0,
+            'p95_turn_ms': turns[min(len(turns) - 1, int(len(turns) * 0.95))] if turns else 0.0
+        }
+    db.close()
+    return results
+
+
+def compare(baseline: Dict[str, Any], current: Dict[str, Any], threshold: float) -> List[str]:
+    # every catalog/operation whose median got more than threshold slower than the baseline
+    regressions = []
+    print(f"{'catalog':<8} {'operation':<22} {'baseline':>10} {'current':>10} {'change':>8}")
+    for catalog, operations in current['results'].items():
+        for operation, stats in operations.items():
+            base = baseline['results'].get(catalog, {}).get(operation)
+            if base is None:
+                continue
+            change = stats['median_ms'] / base['median_ms'] - 1 if base['median_ms'] else 0.0
+            flag = ''
+            if change > threshold:
+                flag = '  REGRESSION'
+                regressions.append(f"{catalog}/{operation}")
+            print(f"{catalog:<8} {operation:<22} {base['median_ms']:>8.2f}ms "
+                  f"{stats['median_ms']:>8.2f}ms {change:>+7.1%}{flag}")
+    return regressions
+
+
+def print_results(results: Dict[str, Dict[str, Dict[str, float]]]):
+    print(f"{'catalog':<8} {'operation':<22} {'median':>10} {'p95':>10} {'peak mem':>10}")
+    for catalog, operations in results.items():
+        for operation, stats in operations.items():
+            print(f"{catalog:<8} {operation:<22} {stats['median_ms']:>8.2f}ms "
+                  f"{stats['p95_ms']:>8.2f}ms {stats['peak_kb']:>8.0f}KB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Latency and memory benchmarks on real and synthetic catalogs")
+    parser.add_argument('--db', default=DEFAULT_DB, help="real table, also the source of the distributions")
+    parser.add_argument('--sizes', default=DEFAULT_SIZES,
+                        help="comma separated catalogs: 'real' and/or row counts like 10k, 1M")
+    parser.add_argument('--catalog-dir', default=DEFAULT_CATALOG_DIR,
+                        help="where generated catalogs are kept between runs")
+    parser.add_argument('--repeat', type=int, default=5, help="timed calls per operation")
+    parser.add_argument('--games', type=int, default=10, help="self-played games per catalog")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--no-learning', action='store_true', help="benchmark without the popularity bias")
+    parser.add_argument('--parallel-workers', type=int, default=0,
+                        help="score large candidate sets on a process pool of this many workers")
+    parser.add_argument('--shards', default=None,
+                        help="instead of the suite, compare turn latency for these shard counts, e.g. 1,2,4")
+    parser.add_argument('--save', default=None, help="write the results as a baseline JSON file")
+    parser.add_argument('--compare', default=None, help="baseline JSON to compare against")
+    parser.add_argument('--threshold', type=float, default=0.2,
+                        help="flag operations more than this fraction slower than the baseline")
+    args = parser.parse_args()
+
+    if args.shards:
+        for size_name in args.sizes.split(','):
+            size_name = size_name.strip()
+            db_path = prepare_catalog(args.db, args.catalog_dir, size_name, args.seed)
+            shard_counts = [int(count) for count in args.shards.split(',')]
+            print(f"Sharding {size_name}...")
+            print(f"{'backend':<12} {'startup':>10} {'first turn':>11} {'median turn':>12} {'p95 turn':>10}")
+            for backend, stats in benchmark_shards(db_path, shard_counts, args.games, args.seed).items():
+                print(f"{backend:<12} {stats['startup_ms']:>8.0f}ms {stats['first_turn_ms']:>9.2f}ms "
+                      f"{stats['median_turn_ms']:>10.2f}ms {stats['p95_turn_ms']:>8.2f}ms")
+        return
+    
+    results = {}
+    for size_name in args.sizes.split(','):
+        size_name = size_name.strip()
+        db_path = prepare_catalog(args.db, args.catalog_dir, size_name, args.seed)
+        print(f"Benchmarking {size_name}...")
+        results[size_name] = benchmark_catalog(db_path, args.repeat, args.games, args.seed,
+                                               use_learning=not args.no_learning,
+                                               parallel_workers=args.parallel_workers)
+
+    report = {
+        'meta': {
+            'python': platform.python_version(),
+            'machine': platform.machine(),
+            'repeat': args.repeat,
+            'games': args.games,
+            'seed': args.seed,
+            'use_learning': not args.no_learning,
+            'parallel_workers': args.parallel_workers,
+            'created_at': time.time()
+        },
+        'results': results
+    }
+
+    print_results(results)
+
+    if args.save:
+        with open(args.save, 'w') as f:
+            json.dump(report, f, indent=4)
+        print(f"Baseline saved to {args.save}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        regressions = compare(baseline, report, args.threshold)
+        if regressions:
+            print(f"{len(regressions)} regression(s) beyond {args.threshold:.0%}: {', '.join(regressions)}")
+            sys.exit(1)
+        print(f"No regressions beyond {args.threshold:.0%}")
+
+
+if __name__ == "__main__":
+    main()
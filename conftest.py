@@ -0,0 +1,16 @@
+import sqlite3
+import pytest
+
+DATABASE_PATH = "database_files/database/pokemon_database.db"
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    # scratch copy of the shipped database, tests never write to the original
+    path = str(tmp_path / 'pokemon_database.db')
+    source = sqlite3.connect(f"file:{DATABASE_PATH}?mode=ro", uri=True)
+    target = sqlite3.connect(path)
+    source.backup(target)
+    source.close()
+    target.close()
+    return path
@@ -1,90 +1,232 @@
+import argparse
 import requests
 import json 
+import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from response_cache import ResponseCache, CacheMiss
+from evolution_graph import EvolutionGraph
+from checkpoint import IngestionCheckpoint
+from build_database import build_database
+from rate_limiter import AdaptiveTokenBucket, RetryPolicy, parse_retry_after
 
 # --- Database Schema Key ---
 # We define a list to store all the collected Pokémon data
 pokemon_data_list = []
 
-def call_pokemon_api(pokemon_id):
+API_BASE_URL = "https://pokeapi.co/api/v2/"
+
+# --- Shared HTTP state (see configure_http) ---
+http_session = None
+api_base_url = API_BASE_URL
+response_cache = None
+rate_limiter = None
+retry_policy = RetryPolicy()
+
+
+class HttpStats:
     """
-    Makes a GET request to the core PokéAPI endpoint for a specific Pokémon ID.
-    (https://pokeapi.co/api/v2/pokemon/{id})
+    Thread-safe counters for one ingestion run.
     """
-    base_url = "https://pokeapi.co/api/v2/pokemon/"
-    url = f"{base_url}{pokemon_id}"
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.requests = 0
+        self.cache_hits = 0
+        self.revalidated = 0
+        self.retries = 0
+        self.throttled = 0
+        self.server_errors = 0
+
+    def record_request(self):
+        with self.lock:
+            self.requests += 1
+
+    def record_retry(self, status_code=None):
+        with self.lock:
+            self.retries += 1
+            if status_code == 429:
+                self.throttled += 1
+            elif status_code is not None and status_code >= 500:
+                self.server_errors += 1
+
+    def record_cache_hit(self, revalidated=False):
+        with self.lock:
+            if revalidated:
+                self.revalidated += 1
+            else:
+                self.cache_hits += 1
 
-    try:
-        response = requests.get(url)
-        if response.status_code == 200:
-            return response.json()
-        else:
-            return None
 
-    except requests.exceptions.RequestException:
+http_stats = HttpStats()
+
+
+class SingleFlight:
+    """
+    Run-wide memo for lookups shared between Pokémon (evolution chains, generations).
+    Concurrent callers for the same key wait on the first call instead of repeating it.
+    """
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.results = {}   # key -> Future
+        self.avoided = 0
+
+    def do(self, key, fn):
+        with self.lock:
+            future = self.results.get(key)
+            if future is None:
+                future = Future()
+                self.results[key] = future
+                owner = True
+            else:
+                self.avoided += 1
+                owner = False
+
+        if owner:
+            try:
+                result = fn()
+            except BaseException as e:
+                with self.lock:
+                    del self.results[key]
+                future.set_exception(e)
+                raise
+            if result is None:
+                # don't pin a failed lookup for the rest of the run
+                with self.lock:
+                    del self.results[key]
+            future.set_result(result)
+
+        return future.result()
+
+
+shared_lookups = SingleFlight()
+
+# every evolution chain is parsed once into this graph, indexed by species ID
+evolution_graph = EvolutionGraph()
+
+
+def configure_http(pool_size=10, base_url=API_BASE_URL, cache=None, limiter=None, retries=None):
+    """
+    Creates the pooled session every API call goes through, so connections are reused.
+    base_url lets a whole run point at a local stand-in server instead of PokéAPI.
+    cache is an optional ResponseCache consulted before the network.
+    limiter (AdaptiveTokenBucket) paces requests, retries (RetryPolicy) handles 429/5xx.
+    """
+    global http_session, api_base_url, response_cache, rate_limiter, retry_policy
+
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+
+    http_session = session
+    api_base_url = base_url if base_url.endswith('/') else base_url + '/'
+    response_cache = cache
+    rate_limiter = limiter
+    retry_policy = retries or RetryPolicy()
+
+def resolve_url(url):
+    # URLs inside responses (chains, generations) always point at the real API
+    if api_base_url != API_BASE_URL and url.startswith(API_BASE_URL):
+        return api_base_url + url[len(API_BASE_URL):]
+    return url
+
+def fetch_json(url):
+    """
+    GET a URL through the response cache (if any) and the shared session.
+    Returns the parsed JSON body, or None if the request failed.
+    Cache entries are keyed by the real PokéAPI URL, so they survive a --base-url change.
+    """
+    if http_session is None:
+        configure_http()
+
+    meta, cached_body = (None, None)
+    if response_cache is not None:
+        meta, cached_body = response_cache.load(url)
+        if cached_body is not None and (response_cache.offline or response_cache.is_fresh(meta)):
+            http_stats.record_cache_hit()
+            return json.loads(cached_body)
+        if response_cache.offline:
+            raise CacheMiss(url)
+
+    headers = {}
+    if cached_body is not None and meta.get('etag'):
+        headers['If-None-Match'] = meta['etag']
+
+    response = send_with_retry(resolve_url(url), headers)
+    if response is None:
+        return None
+    if response.status_code == 304 and cached_body is not None:
+        response_cache.touch(url, meta)
+        http_stats.record_cache_hit(revalidated=True)
+        return json.loads(cached_body)
+    if response.status_code == 200:
+        if response_cache is not None:
+            response_cache.store(url, response.content, response.headers.get('ETag'))
+        return response.json()
+    else:
         return None
 
-def call_pokemon_species_api(pokemon_id):
+def send_with_retry(url, headers):
     """
-    Makes a GET request to the Pokémon Species endpoint to get Egg Group data.
-    (https://pokeapi.co/api/v2/pokemon-species/{id})
+    Paced GET with jittered exponential backoff on 429s, 5xx and dropped connections.
+    Returns the final response, or None if the request never got through.
     """
-    base_url = "https://pokeapi.co/api/v2/pokemon-species/" 
-    url = f"{base_url}{pokemon_id}"
+    for attempt in range(retry_policy.max_retries + 1):
+        if rate_limiter is not None:
+            rate_limiter.acquire()
 
-    try:
-        response = requests.get(url)
-        if response.status_code == 200:
-            return response.json()
-        else:
+        http_stats.record_request()
+        try:
+            response = http_session.get(url, headers=headers, timeout=30)
+        except requests.exceptions.RequestException:
+            response = None
+
+        if response is not None and not retry_policy.should_retry(response.status_code):
+            if rate_limiter is not None:
+                rate_limiter.on_success()
+            return response
+
+        if attempt == retry_policy.max_retries:
             return None
 
-    except requests.exceptions.RequestException:
-        return None
+        status_code = response.status_code if response is not None else None
+        retry_after = parse_retry_after(response.headers.get('Retry-After')) if response is not None else None
+        if status_code == 429 and rate_limiter is not None:
+            rate_limiter.on_throttle(retry_after)
+        http_stats.record_retry(status_code)
+        time.sleep(retry_policy.backoff(attempt, retry_after))
+
+    return None
+
+def call_pokemon_api(pokemon_id):
+    """
+    Makes a GET request to the core PokéAPI endpoint for a specific Pokémon ID.
+    (https://pokeapi.co/api/v2/pokemon/{id})
+    """
+    return fetch_json(f"{API_BASE_URL}pokemon/{pokemon_id}")
+
+def call_pokemon_species_api(pokemon_id):
+    """
+    Makes a GET request to the Pokémon Species endpoint to get Egg Group data.
+    (https://pokeapi.co/api/v2/pokemon-species/{id})
+    """
+    return fetch_json(f"{API_BASE_URL}pokemon-species/{pokemon_id}")
 
 
 def call_evolution_chain_api (chain_url):
     if not chain_url:
         return None
     
-    try:
-        response = requests.get(chain_url)
-        if response.status_code == 200:
-            return response.json()
-        else:
-            return None
-    
-    except requests.exceptions.RequestException:
-        return None
+    # each chain is shared by 2-3 species, fetch it once per run
+    return shared_lookups.do(chain_url, lambda: fetch_json(chain_url))
     
 
 def call_pokemon_location_api (pokemon_id):
-    base_url = "https://pokeapi.co/api/v2/pokemon/"
-    url = f"{base_url}{pokemon_id}/encounters"
-
-    try:
-        response = requests.get(url)
-        if response.status_code == 200:
-            return response.json()
-        else:
-            return None
-        
-    except requests.exceptions.RequestException:
-        return None
+    return fetch_json(f"{API_BASE_URL}pokemon/{pokemon_id}/encounters")
 
 def evolution_api (pokemon_id):
-    base_url = "https://pokeapi.co/api/v2/evolution-chain/"
-    url = f"{base_url}{pokemon_id}"
-
-    try:
-        response = requests.get(url)
-        if response.status_code == 200:
-            return response.json()
-        else:
-            return None
-    
-    except requests.exceptions.RequestException:
-        return None
+    return fetch_json(f"{API_BASE_URL}evolution-chain/{pokemon_id}")
 
     
 def generation_name_parser (species_data):
@@ -118,71 +260,18 @@ def region_finder (species_data):
     generation_url = species_data.get('generation', {}).get('url')
     
     if generation_url:
-        try:
-            gen_response = requests.get(generation_url)
-            if gen_response.status_code == 200:
-                gen_data = gen_response.json()
-                # Extract the region name
-                region_name = gen_data.get('main_region', {}).get('name', 'Unknown').capitalize()
-            else:
-                region_name = 'API Error'
-        except requests.exceptions.RequestException:
-            region_name = 'Network Error'
+        # only 9 generations, fetch each once per run
+        gen_data = shared_lookups.do(generation_url, lambda: fetch_json(generation_url))
+        if gen_data:
+            # Extract the region name
+            region_name = gen_data.get('main_region', {}).get('name', 'Unknown').capitalize()
+        else:
+            region_name = 'API Error'
     else:
         region_name = 'N/A'
 
     return region_name
 
-def get_evolution_stone(evolution_chain_data, target_pokemon_name):
-    """
-    Traverses the evolution chain to find the specific stone required for the target Pokémon.
-    Returns: evolution_stone: str | None
-    """
-
-    evolution_stone = None
-    
-    if not evolution_chain_data or 'chain' not in evolution_chain_data:
-        return None
-
-    # Helper function to recursively search the evolution chain
-    def find_details(chain_link, target_name):
-        nonlocal evolution_stone
-        
-        for evolves_to_link in chain_link.get('evolves_to', []):
-            evolved_species = evolves_to_link['species']['name'].capitalize()
-            
-            if evolved_species == target_name:
-                details = evolves_to_link['evolution_details'][0] 
-                
-                evolution_details = evolves_to_link.get('evolution_details', [])
-
-                if not evolution_details:
-                    return 
-                    
-                details = evolution_details[0]
-
-                trigger = details.get('trigger', {}).get('name')
-                
-                # Check for stone evolution logic
-                if trigger == 'use-item':
-                    item_name = details.get('item', {}).get('name')
-                    if item_name:
-                        # Format the stone name (e.g., 'thunder-stone' -> 'Thunder Stone')
-                        evolution_stone = item_name.replace('-', ' ').title()
-                
-                return # Stop the search once the stone is found
-            
-            # Recurse down the chain
-            find_details(evolves_to_link, target_name)
-                
-    # Start the search from the base of the chain
-    find_details(evolution_chain_data['chain'], target_pokemon_name)
-    
-    if (evolution_stone is not None):
-        return True
-    else:
-        return False 
-
 def is_fossile (pokemon_id):
     fossile_id_list = [138,139,140,141,142,345,346,347,348,408,409,410,411,564,565,566,567,696,697,698,699,880,881,882,883]
     return pokemon_id in fossile_id_list   
@@ -210,33 +299,6 @@ def is_starter (pokemon_id):
 
     return starter
 
-def check_if_evolves_further(evolution_chain_data, target_pokemon_name):
-    if not evolution_chain_data or 'chain' not in evolution_chain_data:
-        return False
-    
-# Helper function to recursively search the evolution chain
-    def find_evolution_status(chain_link, target_name):
-        current_species = chain_link['species']['name'].capitalize()
-        
-        # Check the current link
-        if current_species == target_name:
-            # If the 'evolves_to' list is NOT empty, it evolves further.
-            return bool(chain_link.get('evolves_to'))
-
-        # Recurse down the chain
-        for evolves_to_link in chain_link.get('evolves_to', []):
-            result = find_evolution_status(evolves_to_link, target_name)
-            if result is not None:
-                return result
-                
-        return None
-
-    # Start the search from the base of the chain
-    result = find_evolution_status(evolution_chain_data['chain'], target_pokemon_name)
-    
-    # Return True/False, defaulting to False if the Pokémon was not found in the chain
-    return result if result is not None else False
-
 def evolves_by_trading (pokemon_id):
     trade_evolution_list = [186,65,68,76,199,94,208,464,230,212,466,467,233,474,350,477,367,368,526,534,589,617,683,685,709,711]
     return pokemon_id in trade_evolution_list
@@ -245,150 +307,243 @@ def can_gigantamax (pokemon_id):
     gigantamax_list = [6, 12, 25, 52, 68, 94, 99, 131, 133, 143, 569, 809, 826, 834, 839, 841, 842, 844, 849, 851, 858, 861, 869, 879, 884, 3, 9, 812, 815, 818, 892]
     return pokemon_id in gigantamax_list
 
-def main():
-    # Loop through the first 151 Pokémon
-    START_ID = 1
-    END_ID = 1025
-    
-    print(f"--- Starting data collection for Pokémon IDs {START_ID} to {END_ID} ---")
-    
-    for pokemon_id in range(START_ID, END_ID + 1):
-        # Get Core Data (Name, Stats, Types)
-        base_info = call_pokemon_api(pokemon_id)
-                
+def build_pokemon_entry(pokemon_id):
+    """
+    Runs every API call needed for one Pokémon and returns its database entry,
+    or None if the core calls failed. Safe to call from worker threads.
+    """
+    # Get Core Data (Name, Stats, Types)
+    base_info = call_pokemon_api(pokemon_id)
 
-        # Get Species Data
-        species_data = call_pokemon_species_api(pokemon_id)
 
-        if base_info and species_data:
-            # Data obtained from base_info api call
-            name = base_info['name'].capitalize()
-            types = [t['type']['name'].capitalize() for t in base_info['types']]
+    # Get Species Data
+    species_data = call_pokemon_species_api(pokemon_id)
 
-            # Sprites
-            sprites_data = base_info.get('sprites', {})
-            sprite_default = sprites_data.get('front_default')
+    if base_info and species_data:
+        # Data obtained from base_info api call
+        name = base_info['name'].capitalize()
+        types = [t['type']['name'].capitalize() for t in base_info['types']]
 
-            # Data obtained from Pokemon Location Areas
+        # Sprites
+        sprites_data = base_info.get('sprites', {})
+        sprite_default = sprites_data.get('front_default')
 
-            # Data obtained from Pokemon Shapes
+        # Data obtained from Pokemon Location Areas
 
-            # Data obtained from species_data api call
-            egg_groups = [g['name'].capitalize() for g in species_data['egg_groups']]
-            is_lengendary = species_data['is_legendary']
-            is_mythical = species_data['is_mythical']
-            is_baby = species_data['is_baby']
+        # Data obtained from Pokemon Shapes
 
-            parent_species_dict = species_data.get('evolves_from_species')
-            evolves_from_name = parent_species_dict.get('name').capitalize() if parent_species_dict else None
+        # Data obtained from species_data api call
+        egg_groups = [g['name'].capitalize() for g in species_data['egg_groups']]
+        is_lengendary = species_data['is_legendary']
+        is_mythical = species_data['is_mythical']
+        is_baby = species_data['is_baby']
 
-            generation_num = generation_name_parser(species_data)
+        parent_species_dict = species_data.get('evolves_from_species')
+        evolves_from_name = parent_species_dict.get('name').capitalize() if parent_species_dict else None
 
-            primary_color_dict = species_data.get('color')
-            primary_color = primary_color_dict.get('name').capitalize() 
+        generation_num = generation_name_parser(species_data)
 
-            gender_rate = species_data.get('gender_rate')                           # male to female ratio (0 - 8), -1 = genderless
+        primary_color_dict = species_data.get('color')
+        primary_color = primary_color_dict.get('name').capitalize() 
 
-            # Check for mega evolution
-            has_mega = mega_evolution_check(species_data)
+        gender_rate = species_data.get('gender_rate')                           # male to female ratio (0 - 8), -1 = genderless
 
-            # Data obtained from evolution_chain api call
-            chain_dict = species_data.get('evolution_chain')
-            chain_url = chain_dict.get('url') if chain_dict else None
-        
-            evolves_further = False
-            if chain_url: 
-                try:
-                    chain_id = int(chain_url.split('/')[-2])
-                except (IndexError, ValueError):
-                    chain_id = None
-                    
-                chain_data = call_evolution_chain_api(chain_url)
-                
-                if chain_data:
-                    evolves_further = check_if_evolves_further(chain_data, name)
-            else:
-                chain_id = None
-
-            region = region_finder(species_data)
-
-            evolution_stone = None
-            chain_id = None
-
-            if chain_url and evolves_from_name:
-                try:
-                    chain_id = int(chain_url.split('/')[-2])
-                except (IndexError, ValueError):
-                    chain_id = None
-                    
-                chain_data = call_evolution_chain_api(chain_url)
-                
-                if chain_data and pokemon_id < 1010:                     # Bandaid solution
-                    evolution_stone = get_evolution_stone(chain_data, name)
-
-            fossile = is_fossile(pokemon_id)
-            starter = is_starter(pokemon_id)
-            evolves_from_trading = evolves_by_trading(pokemon_id)
-
-            gigantmax = can_gigantamax(pokemon_id)
-            
-            # Leaving empty
-            num_legs = 0
-            popularity = 0
-
-            # Structure the data
-            pokemon_entry = {
-                'ID': pokemon_id,
-                'Name': name,
-                'Type_1': types[0],
-                'Type_2': types[1] if len(types) > 1 else None,
-                'Primay_Color': primary_color,
-
-                'Region': region,   
-                'Generation': generation_num,
-                'Lengendary': is_lengendary,
-                'Mythical' : is_mythical,
-                
-                'Baby': is_baby,
-                'Fossile': fossile,
-                'Starter': starter,
-
-                'Mega_Evolve': has_mega,
-                'Gigantamax': gigantmax,
-                
-                'Gender_Rate': gender_rate/8 if (gender_rate >= 0) else -1,
-                
-                'Evolves': evolves_further,
-                'Evolves_from': evolves_from_name if (evolves_from_name) else None, 
-                'Evolves_from_stone': evolution_stone if (evolution_stone) else False,
-                'Evolves_from_trading': evolves_from_trading,
-                
-                'Sprite_Default': sprite_default,
-
-                'Number of Legs': num_legs,
-                'Popularity': popularity
-            }
-
-            pokemon_data_list.append(pokemon_entry)
-            print(f"{pokemon_id}: {name}")
-
-            # Add some delay to the api inorder to limit the rate
-            #time.sleep(0.01)
+        # Check for mega evolution
+        has_mega = mega_evolution_check(species_data)
 
-        else:
-            print(f"Skipping ID {pokemon_id} due to failed API call.")
+        # Data obtained from evolution_chain api call
+        chain_dict = species_data.get('evolution_chain')
+        chain_url = chain_dict.get('url') if chain_dict else None
 
+        chain_data = call_evolution_chain_api(chain_url)
+        evolution_graph.add_chain(chain_data)
+
+        # O(1) lookups by species ID instead of walking the chain by name
+        evolves_further = evolution_graph.evolves(pokemon_id)
+        evolves_from_name = evolution_graph.evolves_from(pokemon_id) or evolves_from_name
+        evolution_stone = evolution_graph.evolves_from_stone(pokemon_id)
+
+        region = region_finder(species_data)
+
+        fossile = is_fossile(pokemon_id)
+        starter = is_starter(pokemon_id)
+        evolves_from_trading = evolves_by_trading(pokemon_id)
+
+        gigantmax = can_gigantamax(pokemon_id)
+
+        # Leaving empty
+        num_legs = 0
+        popularity = 0
+
+        # Structure the data
+        pokemon_entry = {
+            'ID': pokemon_id,
+            'Name': name,
+            'Type_1': types[0],
+            'Type_2': types[1] if len(types) > 1 else None,
+            'Primay_Color': primary_color,
+
+            'Region': region,   
+            'Generation': generation_num,
+            'Lengendary': is_lengendary,
+            'Mythical' : is_mythical,
+
+            'Baby': is_baby,
+            'Fossile': fossile,
+            'Starter': starter,
+
+            'Mega_Evolve': has_mega,
+            'Gigantamax': gigantmax,
+
+            'Gender_Rate': gender_rate/8 if (gender_rate >= 0) else -1,
+
+            'Evolves': evolves_further,
+            'Evolves_from': evolves_from_name if (evolves_from_name) else None, 
+            'Evolves_from_stone': evolution_stone if (evolution_stone) else False,
+            'Evolves_from_trading': evolves_from_trading,
+
+            'Sprite_Default': sprite_default,
+
+            'Number of Legs': num_legs,
+            'Popularity': popularity
+        }
+
+        return pokemon_entry
+
+    return None
+
+def try_build_pokemon_entry(pokemon_id):
+    """
+    Returns (entry, None) on success or (None, reason) on failure.
+    A CacheMiss in offline mode is not a per-ID failure and still propagates.
+    """
+    try:
+        entry = build_pokemon_entry(pokemon_id)
+    except CacheMiss:
+        raise
+    except Exception as e:
+        return None, f"{type(e).__name__}: {e}"
+    if entry is None:
+        return None, "failed API call"
+    return entry, None
+
+def collect_pokemon(pokemon_ids, workers=1):
+    """
+    Yields (pokemon_id, entry, failure reason) in ID order.
+    With workers > 1 the IDs are fetched on a bounded thread pool sharing one session.
+    """
+    if workers <= 1:
+        for pokemon_id in pokemon_ids:
+            yield (pokemon_id, *try_build_pokemon_entry(pokemon_id))
+        return
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        # map keeps results in submission order, so the output stays deterministic
+        for pokemon_id, result in zip(pokemon_ids, executor.map(try_build_pokemon_entry, pokemon_ids)):
+            yield (pokemon_id, *result)
+
+def main():
+    parser = argparse.ArgumentParser(description="Collect Pokémon data from PokéAPI")
+    parser.add_argument('--start', type=int, default=1)
+    parser.add_argument('--end', type=int, default=1025)
+    parser.add_argument('--workers', type=int, default=8, help="concurrent requests (1 = sequential)")
+    parser.add_argument('--base-url', default=API_BASE_URL, help="point at a local stand-in server")
+    parser.add_argument('--output', default='pokemon_data.json')
+    parser.add_argument('--graph-output', default='evolution_graph.json')
+    parser.add_argument('--cache-dir', default='.api_cache', help="on-disk response cache")
+    parser.add_argument('--no-cache', action='store_true')
+    parser.add_argument('--max-age-hours', type=float, default=None,
+                        help="revalidate cached responses older than this (default: never)")
+    parser.add_argument('--offline', action='store_true',
+                        help="rebuild from the cache only, fail on the first miss")
+    parser.add_argument('--checkpoint', default='pokemon_data.checkpoint.jsonl',
+                        help="finished entries are streamed here so a rerun can resume")
+    parser.add_argument('--refresh-ids', type=lambda value: [int(v) for v in value.split(',')], default=[],
+                        help="comma-separated IDs to fetch again even if checkpointed")
+    parser.add_argument('--max-age-days', type=float, default=None,
+                        help="refetch checkpointed entries older than this")
+    parser.add_argument('--retry-passes', type=int, default=1, help="extra passes over failed IDs")
+    parser.add_argument('--rate', type=float, default=20.0, help="starting requests per second")
+    parser.add_argument('--max-rate', type=float, default=100.0, help="never go faster than this")
+    parser.add_argument('--max-retries', type=int, default=5)
+    parser.add_argument('--build-db', default=None,
+                        help="also load the results straight into this SQLite database")
+    args = parser.parse_args()
+
+    START_ID = args.start
+    END_ID = args.end
+
+    cache = None
+    if not args.no_cache:
+        max_age = args.max_age_hours * 3600 if args.max_age_hours is not None else None
+        cache = ResponseCache(args.cache_dir, max_age=max_age, offline=args.offline)
+    limiter = AdaptiveTokenBucket(rate=args.rate, burst=max(args.workers, 1), max_rate=args.max_rate)
+    configure_http(pool_size=max(args.workers, 1), base_url=args.base_url, cache=cache,
+                   limiter=limiter, retries=RetryPolicy(max_retries=args.max_retries))
+    
+    checkpoint = IngestionCheckpoint(args.checkpoint)
+    max_age = args.max_age_days * 86400 if args.max_age_days is not None else None
+    pending = checkpoint.pending_ids(range(START_ID, END_ID + 1), max_age, args.refresh_ids)
+
+    print(f"--- Starting data collection for Pokémon IDs {START_ID} to {END_ID} ---")
+    print(f"{END_ID - START_ID + 1 - len(pending)} already checkpointed, {len(pending)} to fetch")
+    
+    start_time = time.perf_counter()
+    try:
+        for attempt in range(1 + args.retry_passes):
+            if not pending:
+                break
+            if attempt > 0:
+                print(f"\n--- Retry pass {attempt}: {len(pending)} failed IDs ---")
+
+            for pokemon_id, pokemon_entry, failure in collect_pokemon(pending, args.workers):
+                if pokemon_entry:
+                    checkpoint.record(pokemon_entry, evolution_graph.row(pokemon_id))
+                    print(f"{pokemon_id}: {pokemon_entry['Name']}")
+
+                else:
+                    checkpoint.record_failure(pokemon_id, failure)
+                    print(f"Skipping ID {pokemon_id} ({failure}).")
+
+            pending = [pokemon_id for pokemon_id in pending if pokemon_id in checkpoint.failed]
+    except CacheMiss as e:
+        print(f"\nOffline mode: no cached response for {e}")
+        raise SystemExit(1)
+    finally:
+        checkpoint.close()
+    elapsed = time.perf_counter() - start_time
+
+    pokemon_data_list.extend(checkpoint.entries())
 
-        
     print("\n--- Data Collection Complete ---")
     print(f"Successfully collected data for {len(pokemon_data_list)} Pokémon.")
+    if checkpoint.failed:
+        print(f"{len(checkpoint.failed)} IDs still failing, see '{checkpoint.failed_path}'")
+    print(f"{http_stats.requests} requests in {elapsed:.2f}s "
+          f"({http_stats.requests / elapsed if elapsed else 0:.1f} requests/s, {args.workers} workers)")
+    print(f"Retries: {http_stats.retries} ({http_stats.throttled} throttled, "
+          f"{http_stats.server_errors} server errors), final rate {limiter.rate:.1f} requests/s")
+    print(f"Shared chain/generation lookups: {shared_lookups.avoided} requests avoided")
+    if cache is not None:
+        print(f"Cache: {http_stats.cache_hits} hits, {http_stats.revalidated} revalidated")
     
     # Save the data to a JSON file
-    with open('pokemon_data.json', 'w') as f:
+    with open(args.output, 'w') as f:
         json.dump(pokemon_data_list, f, indent=4)
         
-    print("Data saved to 'pokemon_data.json'")
+    print(f"Data saved to '{args.output}'")
+
+    # graph rows come from the checkpoint, so IDs skipped on a resume are still included
+    graph_rows = [record['evolution'] for _, record in sorted(checkpoint.records.items())
+                  if record.get('evolution')]
+    with open(args.graph_output, 'w') as f:
+        json.dump(graph_rows, f, indent=4)
+    print(f"Evolution graph ({len(graph_rows)} species) saved to '{args.graph_output}'")
+
+    if args.build_db:
+        loaded = build_database(pokemon_data_list, args.build_db, graph_rows)
+        print(f"Loaded {loaded} Pokémon into '{args.build_db}'")
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,220 @@
+"""
+Builds the game database straight from ingested records.
+
+Reads pokemon_data.json (parsed incrementally, never loaded whole) or the
+ingestion checkpoint JSONL, inserts everything with one executemany inside a
+single transaction, checks the schema, and creates indexes after the load.
+The result is written to a temp file and swapped in atomically; learned
+Popularity and question stats are carried over from the existing database.
+
+    python build_database.py pokemon_data.json ../../database/pokemon_database.db --graph evolution_graph.json
+"""
+import argparse
+import json
+import os
+import sqlite3
+import time
+
+from evolution_graph import store_evolution_graph
+
+MYTABLE_SCHEMA = """
+CREATE TABLE mytable(
+   ID                   INTEGER  NOT NULL PRIMARY KEY
+  ,Name                 VARCHAR(26) NOT NULL
+  ,Type_1               VARCHAR(8) NOT NULL
+  ,Type_2               VARCHAR(8)
+  ,Primay_Color         VARCHAR(6) NOT NULL
+  ,Region               VARCHAR(6) NOT NULL
+  ,Generation           INTEGER  NOT NULL
+  ,Lengendary           VARCHAR(5) NOT NULL
+  ,Mythical             VARCHAR(5) NOT NULL
+  ,Baby                 VARCHAR(5) NOT NULL
+  ,Fossile              VARCHAR(5) NOT NULL
+  ,Starter              VARCHAR(5) NOT NULL
+  ,Mega_Evolve          VARCHAR(5) NOT NULL
+  ,Gigantamax           VARCHAR(5) NOT NULL
+  ,Gender_Rate          NUMERIC(5,3) NOT NULL
+  ,Evolves              VARCHAR(5) NOT NULL
+  ,Evolves_from         VARCHAR(12)
+  ,Evolves_from_stone   VARCHAR(5) NOT NULL
+  ,Evolves_from_trading VARCHAR(5) NOT NULL
+  ,Sprite_Default       VARCHAR(81) NOT NULL
+  ,Number_of_Legs       BIT  NOT NULL
+  ,Popularity           BIT  NOT NULL
+)
+"""
+
+COLUMNS = [
+    'ID', 'Name', 'Type_1', 'Type_2', 'Primay_Color', 'Region', 'Generation',
+    'Lengendary', 'Mythical', 'Baby', 'Fossile', 'Starter', 'Mega_Evolve', 'Gigantamax',
+    'Gender_Rate', 'Evolves', 'Evolves_from', 'Evolves_from_stone', 'Evolves_from_trading',
+    'Sprite_Default', 'Number_of_Legs', 'Popularity'
+]
+
+# api.py writes a few keys that don't match the column names
+KEY_RENAMES = {'Number of Legs': 'Number_of_Legs'}
+
+INDEXES = [
+    "CREATE INDEX idx_mytable_name ON mytable(Name)",
+    "CREATE INDEX idx_mytable_type_1 ON mytable(Type_1)",
+    "CREATE INDEX idx_mytable_type_2 ON mytable(Type_2)",
+]
+
+
+def iter_json_array(path, chunk_size=64 * 1024):
+    """
+    Yields the elements of a top-level JSON array one at a time, reading the file in chunks.
+    """
+    decoder = json.JSONDecoder()
+    with open(path, 'r', encoding='utf-8') as f:
+        buffer = f.read(chunk_size).lstrip()
+        if not buffer.startswith('['):
+            raise ValueError(f"{path} is not a JSON array")
+        buffer = buffer[1:]
+        at_eof = False
+
+        while True:
+            buffer = buffer.lstrip().lstrip(',').lstrip()
+            if buffer.startswith(']'):
+                return
+            try:
+                item, end = decoder.raw_decode(buffer)
+            except ValueError:
+                # element is split across chunks, read more
+                if at_eof:
+                    raise
+                more = f.read(chunk_size)
+                at_eof = not more
+                buffer += more
+                continue
+            yield item
+            buffer = buffer[end:]
+
+def iter_checkpoint(path):
+    # ingestion checkpoint lines wrap the entry, later lines win for the same ID
+    latest = {}
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            latest[record['id']] = record['entry']
+    for _, entry in sorted(latest.items()):
+        yield entry
+
+def iter_records(path):
+    """
+    Records from either pokemon_data.json or a checkpoint JSONL file.
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        first = f.read(1)
+        while first and first.isspace():
+            first = f.read(1)
+    if first == '[':
+        return iter_json_array(path)
+    return iter_checkpoint(path)
+
+
+def to_row(record):
+    # JSON booleans are stored as 'true'/'false' strings in mytable
+    row = {}
+    for key, value in record.items():
+        key = KEY_RENAMES.get(key, key)
+        if isinstance(value, bool):
+            value = 'true' if value else 'false'
+        row[key] = value
+
+    missing = [column for column in COLUMNS if column not in row]
+    unknown = [key for key in row if key not in COLUMNS]
+    if missing or unknown:
+        raise ValueError(f"record {record.get('ID')} doesn't match mytable: "
+                         f"missing {missing}, unknown {unknown}")
+    return tuple(row[column] for column in COLUMNS)
+
+def check_schema(connection):
+    columns = [row[1] for row in connection.execute("PRAGMA table_info(mytable)")]
+    if columns != COLUMNS:
+        raise ValueError(f"mytable columns {columns} don't match the expected {COLUMNS}")
+
+def carry_over_learning(connection, old_db_path):
+    # keep what the game has learned: Popularity per ID and the question stats table
+    connection.execute("ATTACH DATABASE ? AS old", (old_db_path,))
+    old_tables = {row[0] for row in connection.execute("SELECT name FROM old.sqlite_master WHERE type = 'table'")}
+
+    if 'mytable' in old_tables:
+        connection.execute("""
+            UPDATE mytable SET Popularity = (SELECT o.Popularity FROM old.mytable o WHERE o.ID = mytable.ID)
+            WHERE ID IN (SELECT ID FROM old.mytable)
+        """)
+    if 'question_stats' in old_tables:
+        sql = connection.execute(
+            "SELECT sql FROM old.sqlite_master WHERE type = 'table' AND name = 'question_stats'"
+        ).fetchone()[0]
+        connection.execute(sql)
+        connection.execute("INSERT INTO question_stats SELECT * FROM old.question_stats")
+    connection.commit()
+    connection.execute("DETACH DATABASE old")
+
+def build_database(records, db_path, graph_rows=None, keep_learning=True):
+    """
+    Streams records into a fresh database at db_path. Returns the number of rows loaded.
+    """
+    tmp_path = db_path + '.building'
+    if os.path.exists(tmp_path):
+        os.remove(tmp_path)
+
+    connection = sqlite3.connect(tmp_path)
+    # the temp file is swapped in only once it's complete, so skip the journal
+    connection.execute("PRAGMA journal_mode = OFF")
+    connection.execute("PRAGMA synchronous = OFF")
+    try:
+        connection.execute(MYTABLE_SCHEMA)
+        check_schema(connection)
+
+        cursor = connection.cursor()
+        cursor.executemany(
+            f"INSERT INTO mytable({','.join(COLUMNS)}) VALUES ({','.join('?' * len(COLUMNS))})",
+            (to_row(record) for record in records)
+        )
+        loaded = cursor.rowcount
+
+        if graph_rows:
+            store_evolution_graph(connection, graph_rows)
+
+        # indexes after the load, one sort per index instead of per-row maintenance
+        for statement in INDEXES:
+            connection.execute(statement)
+        connection.commit()
+
+        if keep_learning and os.path.exists(db_path):
+            carry_over_learning(connection, db_path)
+    finally:
+        connection.close()
+
+    os.replace(tmp_path, db_path)
+    return loaded
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the game database from ingested records")
+    parser.add_argument('records', help="pokemon_data.json or an ingestion checkpoint .jsonl")
+    parser.add_argument('db_path')
+    parser.add_argument('--graph', default=None, help="evolution_graph.json to load as its own table")
+    parser.add_argument('--fresh', action='store_true',
+                        help="don't carry Popularity and question stats over from the old database")
+    args = parser.parse_args()
+
+    graph_rows = None
+    if args.graph:
+        with open(args.graph, 'r', encoding='utf-8') as f:
+            graph_rows = json.load(f)
+
+    start_time = time.perf_counter()
+    loaded = build_database(iter_records(args.records), args.db_path, graph_rows, not args.fresh)
+    elapsed = time.perf_counter() - start_time
+    print(f"Loaded {loaded} Pokémon into {args.db_path} in {elapsed * 1000:.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
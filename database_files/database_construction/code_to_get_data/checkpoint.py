@@ -0,0 +1,120 @@
+"""
+Checkpoint for resumable ingestion.
+
+Finished entries are appended to a JSONL file as soon as they complete, and
+failed IDs are kept in a small JSON file for a retry pass. A rerun only has to
+fetch IDs that are missing, failed, stale, or built by an older SCHEMA_VERSION.
+"""
+import json
+import os
+import time
+
+# bump when build_pokemon_entry changes, so old records get rebuilt on the next run
+SCHEMA_VERSION = 1
+
+
+class IngestionCheckpoint:
+    def __init__(self, records_path, failed_path=None):
+        self.records_path = records_path
+        self.failed_path = failed_path or records_path + '.failed.json'
+        self.records = {}   # ID -> {'id', 'fetched_at', 'schema', 'entry', 'evolution'}
+        self.failed = {}    # ID -> {'reason', 'failed_at', 'attempts'}
+        self._superseded = 0  # lines replaced by a newer record for the same ID
+        self._load()
+        self._file = open(self.records_path, 'a', encoding='utf-8')
+        if self._file.tell() > 0 and not self._ends_with_newline():
+            # don't glue the next record onto a half-written line
+            self._file.write('\n')
+
+    def _ends_with_newline(self):
+        with open(self.records_path, 'rb') as f:
+            f.seek(-1, os.SEEK_END)
+            return f.read(1) == b'\n'
+
+    def _load(self):
+        if os.path.exists(self.records_path):
+            with open(self.records_path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        # half-written line from an interrupted run
+                        continue
+                    if record['id'] in self.records:
+                        self._superseded += 1
+                    self.records[record['id']] = record
+
+        if os.path.exists(self.failed_path):
+            with open(self.failed_path, 'r', encoding='utf-8') as f:
+                self.failed = {int(pid): info for pid, info in json.load(f).items()}
+
+    def record(self, entry, evolution=None):
+        """
+        Appends one finished entry (and its evolution graph row) and flushes it,
+        so it survives a crash.
+        """
+        record = {
+            'id': entry['ID'],
+            'fetched_at': time.time(),
+            'schema': SCHEMA_VERSION,
+            'entry': entry,
+            'evolution': evolution
+        }
+        self._file.write(json.dumps(record) + '\n')
+        self._file.flush()
+        if entry['ID'] in self.records:
+            self._superseded += 1
+        self.records[entry['ID']] = record
+        self.failed.pop(entry['ID'], None)
+
+    def record_failure(self, pokemon_id, reason):
+        info = self.failed.get(pokemon_id, {'attempts': 0})
+        self.failed[pokemon_id] = {
+            'reason': reason,
+            'failed_at': time.time(),
+            'attempts': info['attempts'] + 1
+        }
+
+    def is_stale(self, record, max_age=None):
+        if record.get('schema') != SCHEMA_VERSION:
+            return True
+        return max_age is not None and time.time() - record['fetched_at'] > max_age
+
+    def pending_ids(self, pokemon_ids, max_age=None, refresh_ids=()):
+        """
+        IDs that still need fetching: never done, previously failed, stale, or forced.
+        """
+        refresh_ids = set(refresh_ids)
+        pending = []
+        for pokemon_id in pokemon_ids:
+            record = self.records.get(pokemon_id)
+            if (record is None or pokemon_id in refresh_ids or pokemon_id in self.failed
+                    or self.is_stale(record, max_age)):
+                pending.append(pokemon_id)
+        return pending
+
+    def entries(self):
+        return [record['entry'] for _, record in sorted(self.records.items())]
+
+    def save_failed(self):
+        with open(self.failed_path, 'w', encoding='utf-8') as f:
+            json.dump({str(pid): info for pid, info in sorted(self.failed.items())}, f, indent=4)
+
+    def compact(self):
+        """
+        Rewrites the records file with one line per ID (later lines win on load anyway).
+        """
+        self._file.close()
+        tmp_path = self.records_path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            for _, record in sorted(self.records.items()):
+                f.write(json.dumps(record) + '\n')
+        os.replace(tmp_path, self.records_path)
+        self._file = open(self.records_path, 'a', encoding='utf-8')
+        self._superseded = 0
+
+    def close(self):
+        self.save_failed()
+        if self._superseded:
+            self.compact()
+        self._file.close()
@@ -0,0 +1,141 @@
+"""
+Flat evolution graph built from PokéAPI evolution chains.
+
+Every chain is parsed once into nodes indexed by species ID (parent, children,
+trigger, item, stage), so per-Pokémon questions like "does it evolve?" or
+"was it evolved with a stone?" become dictionary lookups instead of a
+recursive walk with name comparisons.
+
+    python evolution_graph.py evolution_graph.json ../../database/pokemon_database.db
+"""
+import argparse
+import json
+import sqlite3
+import threading
+
+
+def species_id_from_url(url):
+    # https://pokeapi.co/api/v2/pokemon-species/25/ -> 25
+    return int(url.rstrip('/').split('/')[-1])
+
+
+class EvolutionGraph:
+    def __init__(self):
+        self.nodes = {}         # species ID -> node dict
+        self.chain_ids = set()  # chains already parsed
+        self.lock = threading.Lock()
+
+    def add_chain(self, chain_data):
+        """
+        Parses an evolution-chain response into nodes. Chains already seen are skipped.
+        """
+        if not chain_data or 'chain' not in chain_data:
+            return
+
+        with self.lock:
+            chain_id = chain_data.get('id')
+            if chain_id is not None:
+                if chain_id in self.chain_ids:
+                    return
+                self.chain_ids.add(chain_id)
+
+            # iterative walk: (chain link, parent species ID, stage)
+            stack = [(chain_data['chain'], None, 1)]
+            while stack:
+                link, parent_id, stage = stack.pop()
+                species_id = species_id_from_url(link['species']['url'])
+
+                details = link.get('evolution_details') or [{}]
+                trigger = (details[0].get('trigger') or {}).get('name')
+                item = (details[0].get('item') or {}).get('name')
+
+                self.nodes[species_id] = {
+                    'ID': species_id,
+                    'Name': link['species']['name'].capitalize(),
+                    'Parent_ID': parent_id,
+                    'Children': [species_id_from_url(child['species']['url'])
+                                 for child in link.get('evolves_to', [])],
+                    'Stage': stage,
+                    'Trigger': trigger,
+                    'Item': item,
+                    'Chain_ID': chain_id
+                }
+
+                for child in link.get('evolves_to', []):
+                    stack.append((child, species_id, stage + 1))
+
+    def get(self, species_id):
+        return self.nodes.get(species_id)
+
+    def evolves(self, species_id):
+        node = self.nodes.get(species_id)
+        return bool(node and node['Children'])
+
+    def evolves_from(self, species_id):
+        node = self.nodes.get(species_id)
+        if not node or node['Parent_ID'] is None:
+            return None
+        return self.nodes[node['Parent_ID']]['Name']
+
+    def evolves_from_stone(self, species_id):
+        node = self.nodes.get(species_id)
+        return bool(node and node['Trigger'] == 'use-item' and node['Item'])
+
+    def row(self, species_id):
+        # table row for one species (children are implied by Parent_ID)
+        node = self.nodes.get(species_id)
+        if node is None:
+            return None
+        return {key: value for key, value in node.items() if key != 'Children'}
+
+    def to_rows(self):
+        return [self.row(species_id) for species_id in sorted(self.nodes)]
+
+    def save_json(self, path):
+        with open(path, 'w') as f:
+            json.dump(self.to_rows(), f, indent=4)
+
+
+EVOLUTION_GRAPH_SCHEMA = """
+CREATE TABLE IF NOT EXISTS evolution_graph(
+   ID        INTEGER NOT NULL PRIMARY KEY
+  ,Name      VARCHAR(26) NOT NULL
+  ,Parent_ID INTEGER
+  ,Stage     INTEGER NOT NULL
+  ,Trigger   VARCHAR(20)
+  ,Item      VARCHAR(30)
+  ,Chain_ID  INTEGER
+)
+"""
+
+def store_evolution_graph(connection, rows):
+    """
+    Replaces the evolution_graph table with rows (as produced by to_rows).
+    """
+    connection.execute(EVOLUTION_GRAPH_SCHEMA)
+    connection.execute("DELETE FROM evolution_graph")
+    connection.executemany(
+        "INSERT INTO evolution_graph(ID, Name, Parent_ID, Stage, Trigger, Item, Chain_ID) "
+        "VALUES (:ID, :Name, :Parent_ID, :Stage, :Trigger, :Item, :Chain_ID)",
+        rows
+    )
+    connection.execute("CREATE INDEX IF NOT EXISTS idx_evolution_graph_parent ON evolution_graph(Parent_ID)")
+
+def main():
+    parser = argparse.ArgumentParser(description="Load evolution_graph.json into the game database")
+    parser.add_argument('graph_json')
+    parser.add_argument('db_path')
+    args = parser.parse_args()
+
+    with open(args.graph_json) as f:
+        rows = json.load(f)
+
+    connection = sqlite3.connect(args.db_path)
+    with connection:
+        store_evolution_graph(connection, rows)
+    connection.close()
+    print(f"Stored {len(rows)} evolution graph nodes in {args.db_path}")
+
+
+if __name__ == "__main__":
+    main()
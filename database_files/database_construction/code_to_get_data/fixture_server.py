@@ -0,0 +1,184 @@
+"""
+Local stand-in for PokéAPI that serves recorded responses, so api.py can be
+run and timed without hitting the real API.
+
+    python fixture_server.py record fixtures --start 1 --end 20
+    python fixture_server.py serve fixtures --port 8765
+    python api.py --base-url http://127.0.0.1:8765/api/v2/ --start 1 --end 20
+
+--max-rps and --error-rate make it misbehave like a busy server (429s and 5xx),
+for exercising api.py's rate limiter and retries.
+"""
+import argparse
+import hashlib
+import json
+import os
+import random
+import threading
+import time
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+import requests
+
+API_BASE_URL = "https://pokeapi.co/api/v2/"
+
+
+def fixture_path(fixture_dir, api_path):
+    """
+    Maps an API path like 'evolution-chain/1/' to fixtures/evolution-chain/1.json
+    """
+    return os.path.join(fixture_dir, api_path.strip('/') + '.json')
+
+def record_fixtures(fixture_dir, start_id, end_id):
+    """
+    Downloads every response api.py needs for the ID range and stores it on disk.
+    """
+    session = requests.Session()
+
+    def save(url):
+        path = fixture_path(fixture_dir, url[len(API_BASE_URL):])
+        if os.path.exists(path):
+            with open(path) as f:
+                return json.load(f)
+
+        response = session.get(url, timeout=30)
+        if response.status_code != 200:
+            return None
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w') as f:
+            f.write(response.text)
+        return response.json()
+
+    for pokemon_id in range(start_id, end_id + 1):
+        save(f"{API_BASE_URL}pokemon/{pokemon_id}")
+        species_data = save(f"{API_BASE_URL}pokemon-species/{pokemon_id}")
+        if not species_data:
+            continue
+        if species_data.get('evolution_chain'):
+            save(species_data['evolution_chain']['url'])
+        save(species_data['generation']['url'])
+        print(f"recorded {pokemon_id}")
+
+
+class ServerLimits:
+    """
+    Shared fault injection: a per-second request cap (429 past it) and random 5xx errors.
+    """
+    def __init__(self, max_rps=None, error_rate=0.0):
+        self.max_rps = max_rps
+        self.error_rate = error_rate
+        self.window_start = time.monotonic()
+        self.window_count = 0
+        self.lock = threading.Lock()
+
+    def over_limit(self):
+        if not self.max_rps:
+            return False
+        with self.lock:
+            now = time.monotonic()
+            if now - self.window_start >= 1.0:
+                self.window_start = now
+                self.window_count = 0
+            self.window_count += 1
+            return self.window_count > self.max_rps
+
+    def random_error(self):
+        if self.error_rate and random.random() < self.error_rate:
+            return random.choice([500, 503])
+        return None
+
+
+class FixtureHandler(BaseHTTPRequestHandler):
+    fixture_dir = 'fixtures'
+    latency = 0.0  # seconds added to every response, to mimic a real network
+    limits = ServerLimits()
+
+    def do_GET(self):
+        if self.latency:
+            time.sleep(self.latency)
+
+        if self.limits.over_limit():
+            self.send_response(429)
+            self.send_header('Retry-After', '1')
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+        error = self.limits.random_error()
+        if error:
+            self.send_error(error)
+            return
+
+        prefix = '/api/v2/'
+        if not self.path.startswith(prefix):
+            self.send_error(404)
+            return
+
+        path = fixture_path(self.fixture_dir, self.path[len(prefix):])
+        if not os.path.exists(path):
+            self.send_error(404)
+            return
+
+        with open(path, 'rb') as f:
+            body = f.read()
+
+        etag = '"' + hashlib.sha1(body).hexdigest() + '"'
+        if self.headers.get('If-None-Match') == etag:
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.end_headers()
+            return
+
+        self.send_response(200)
+        self.send_header('ETag', etag)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def make_server(fixture_dir, port=0, latency=0.0, max_rps=None, error_rate=0.0):
+    """
+    Builds (but doesn't start) a threaded fixture server. port=0 picks a free port.
+    """
+    handler = type('Handler', (FixtureHandler,), {
+        'fixture_dir': fixture_dir,
+        'latency': latency,
+        'limits': ServerLimits(max_rps, error_rate)
+    })
+    return ThreadingHTTPServer(('127.0.0.1', port), handler)
+
+def main():
+    parser = argparse.ArgumentParser(description="Record or serve PokéAPI fixtures")
+    subcommands = parser.add_subparsers(dest='command', required=True)
+
+    record = subcommands.add_parser('record')
+    record.add_argument('fixture_dir')
+    record.add_argument('--start', type=int, default=1)
+    record.add_argument('--end', type=int, default=1025)
+
+    serve = subcommands.add_parser('serve')
+    serve.add_argument('fixture_dir')
+    serve.add_argument('--port', type=int, default=8765)
+    serve.add_argument('--latency-ms', type=float, default=0.0)
+    serve.add_argument('--max-rps', type=int, default=None, help="answer 429 past this many requests per second")
+    serve.add_argument('--error-rate', type=float, default=0.0, help="fraction of requests that get a 500/503")
+
+    args = parser.parse_args()
+
+    if args.command == 'record':
+        record_fixtures(args.fixture_dir, args.start, args.end)
+    else:
+        server = make_server(args.fixture_dir, args.port, args.latency_ms / 1000,
+                             args.max_rps, args.error_rate)
+        print(f"Serving {args.fixture_dir} on http://127.0.0.1:{server.server_port}/api/v2/")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+Request pacing for ingestion.
+
+AdaptiveTokenBucket spaces requests out and finds the highest rate the server
+will take: it speeds up slowly while requests succeed and halves on a 429,
+pausing everyone for the server's Retry-After. RetryPolicy decides how long to
+wait before retrying a throttled, failed, or dropped request (jittered
+exponential backoff).
+"""
+import email.utils
+import random
+import threading
+import time
+
+
+class AdaptiveTokenBucket:
+    def __init__(self, rate=20.0, burst=10, min_rate=1.0, max_rate=200.0, increase=2.0):
+        self.rate = rate            # tokens per second right now
+        self.burst = burst          # bucket size
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.increase = increase    # requests/s gained per second of clean traffic
+        self.tokens = float(burst)
+        self.last_refill = time.monotonic()
+        self.paused_until = 0.0
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """
+        Blocks until a request may be sent.
+        """
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.burst, self.tokens + (now - self.last_refill) * self.rate)
+                self.last_refill = now
+
+                if now < self.paused_until:
+                    wait = self.paused_until - now
+                elif self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                else:
+                    wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+    def on_success(self):
+        # additive increase: roughly +increase requests/s for every second of successes
+        with self.lock:
+            self.rate = min(self.max_rate, self.rate + self.increase / self.rate)
+
+    def on_throttle(self, retry_after=None):
+        # multiplicative decrease, and hold everyone back for as long as the server asked
+        with self.lock:
+            self.rate = max(self.min_rate, self.rate / 2)
+            self.tokens = min(self.tokens, 0.0)
+            if retry_after:
+                self.paused_until = max(self.paused_until, time.monotonic() + retry_after)
+
+
+class RetryPolicy:
+    def __init__(self, max_retries=5, base_delay=0.25, max_delay=30.0):
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    def should_retry(self, status_code):
+        # throttled or a server-side error; 4xx other than 429 won't get better
+        return status_code == 429 or status_code >= 500
+
+    def backoff(self, attempt, retry_after=None):
+        """
+        Seconds to wait before retry number attempt (0-based), using full jitter.
+        Never less than the server's Retry-After.
+        """
+        delay = random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+        if retry_after:
+            delay = max(delay, retry_after)
+        return delay
+
+
+def parse_retry_after(value):
+    """
+    Retry-After is either a number of seconds or an HTTP date. Returns seconds or None.
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, when.timestamp() - time.time())
@@ -0,0 +1,74 @@
+"""
+On-disk cache of PokéAPI responses.
+
+Bodies are stored gzip-compressed under the sha256 of their content, and each
+URL gets a small metadata file (ETag, fetch time, body digest) under the sha256
+of the URL, so identical responses are only stored once.
+"""
+import gzip
+import hashlib
+import json
+import os
+import tempfile
+import time
+
+
+class CacheMiss(Exception):
+    """
+    Raised in offline mode when a URL has never been cached.
+    """
+
+
+class ResponseCache:
+    def __init__(self, cache_dir, max_age=None, offline=False):
+        self.cache_dir = cache_dir
+        self.max_age = max_age      # seconds before an entry is revalidated, None = never
+        self.offline = offline      # never touch the network, fail fast on a miss
+        os.makedirs(os.path.join(cache_dir, 'meta'), exist_ok=True)
+        os.makedirs(os.path.join(cache_dir, 'bodies'), exist_ok=True)
+
+    def _meta_path(self, url):
+        digest = hashlib.sha256(url.encode('utf-8')).hexdigest()
+        return os.path.join(self.cache_dir, 'meta', digest[:2], digest + '.json')
+
+    def _body_path(self, digest):
+        return os.path.join(self.cache_dir, 'bodies', digest[:2], digest + '.gz')
+
+    def _write_atomic(self, path, data):
+        # write to a temp file and rename, so concurrent readers never see half a file
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path))
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+    def load(self, url):
+        """
+        Returns (metadata, body bytes) for a cached URL, or (None, None).
+        """
+        try:
+            with open(self._meta_path(url), 'r') as f:
+                meta = json.load(f)
+            with gzip.open(self._body_path(meta['body']), 'rb') as f:
+                return meta, f.read()
+        except (OSError, ValueError, KeyError):
+            return None, None
+
+    def is_fresh(self, meta):
+        if self.max_age is None:
+            return True
+        return time.time() - meta['fetched_at'] < self.max_age
+
+    def store(self, url, body, etag=None):
+        digest = hashlib.sha256(body).hexdigest()
+        body_path = self._body_path(digest)
+        if not os.path.exists(body_path):
+            self._write_atomic(body_path, gzip.compress(body))
+
+        meta = {'url': url, 'etag': etag, 'fetched_at': time.time(), 'body': digest}
+        self._write_atomic(self._meta_path(url), json.dumps(meta).encode('utf-8'))
+
+    def touch(self, url, meta):
+        # the server said 304 Not Modified, so just restart the entry's age
+        meta = dict(meta, fetched_at=time.time())
+        self._write_atomic(self._meta_path(url), json.dumps(meta).encode('utf-8'))
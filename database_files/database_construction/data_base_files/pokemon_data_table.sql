@@ -1,1049 +0,0 @@
-CREATE TABLE mytable(
-   ID                   INTEGER  NOT NULL PRIMARY KEY 
-  ,Name                 VARCHAR(26) NOT NULL
-  ,Type_1               VARCHAR(8) NOT NULL
-  ,Type_2               VARCHAR(8)
-  ,Primay_Color         VARCHAR(6) NOT NULL
-  ,Region               VARCHAR(6) NOT NULL
-  ,Generation           INTEGER  NOT NULL
-  ,Lengendary           VARCHAR(5) NOT NULL
-  ,Mythical             VARCHAR(5) NOT NULL
-  ,Baby                 VARCHAR(5) NOT NULL
-  ,Fossile              VARCHAR(5) NOT NULL
-  ,Starter              VARCHAR(5) NOT NULL
-  ,Mega_Evolve          VARCHAR(5) NOT NULL
-  ,Gigantamax           VARCHAR(5) NOT NULL
-  ,Gender_Rate          NUMERIC(5,3) NOT NULL
-  ,Evolves              VARCHAR(5) NOT NULL
-  ,Evolves_from         VARCHAR(12)
-  ,Evolves_from_stone   VARCHAR(5) NOT NULL
-  ,Evolves_from_trading VARCHAR(5) NOT NULL
-  ,Sprite_Default       VARCHAR(81) NOT NULL
-  ,Number_of_Legs       BIT  NOT NULL
-  ,Popularity           BIT  NOT NULL
-);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (1,'Bulbasaur','Grass','Poison','Green','Kanto',1,'false','false','false','false','true','false','false',0.125,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/1.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (2,'Ivysaur','Grass','Poison','Green','Kanto',1,'false','false','false','false','true','false','false',0.125,'true','Bulbasaur','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/2.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (3,'Venusaur','Grass','Poison','Green','Kanto',1,'false','false','false','false','true','true','true',0.125,'false','Ivysaur','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/3.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (4,'Charmander','Fire',NULL,'Red','Kanto',1,'false','false','false','false','true','false','false',0.125,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/4.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (5,'Charmeleon','Fire',NULL,'Red','Kanto',1,'false','false','false','false','true','false','false',0.125,'true','Charmander','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/5.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (6,'Charizard','Fire','Flying','Red','Kanto',1,'false','false','false','false','true','true','true',0.125,'false','Charmeleon','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/6.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (7,'Squirtle','Water',NULL,'Blue','Kanto',1,'false','false','false','false','true','false','false',0.125,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/7.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (8,'Wartortle','Water',NULL,'Blue','Kanto',1,'false','false','false','false','true','false','false',0.125,'true','Squirtle','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/8.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (9,'Blastoise','Water',NULL,'Blue','Kanto',1,'false','false','false','false','true','true','true',0.125,'false','Wartortle','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/9.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (10,'Caterpie','Bug',NULL,'Green','Kanto',1,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/10.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (11,'Metapod','Bug',NULL,'Green','Kanto',1,'false','false','false','false','false','false','false',0.5,'true','Caterpie','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/11.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (12,'Butterfree','Bug','Flying','White','Kanto',1,'false','false','false','false','false','false','true',0.5,'false','Metapod','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/12.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (13,'Weedle','Bug','Poison','Brown','Kanto',1,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/13.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (14,'Kakuna','Bug','Poison','Yellow','Kanto',1,'false','false','false','false','false','false','false',0.5,'true','Weedle','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/14.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (15,'Beedrill','Bug','Poison','Yellow','Kanto',1,'false','false','false','false','false','true','false',0.5,'false','Kakuna','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/15.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (16,'Pidgey','Normal','Flying','Brown','Kanto',1,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/16.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (17,'Pidgeotto','Normal','Flying','Brown','Kanto',1,'false','false','false','false','false','false','false',0.5,'true','Pidgey','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/17.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (18,'Pidgeot','Normal','Flying','Brown','Kanto',1,'false','false','false','false','false','true','false',0.5,'false','Pidgeotto','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/18.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (19,'Rattata','Normal',NULL,'Purple','Kanto',1,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/19.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (20,'Raticate','Normal',NULL,'Brown','Kanto',1,'false','false','false','false','false','false','false',0.5,'false','Rattata','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/20.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (21,'Spearow','Normal','Flying','Brown','Kanto',1,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/21.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (22,'Fearow','Normal','Flying','Brown','Kanto',1,'false','false','false','false','false','false','false',0.5,'false','Spearow','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/22.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (23,'Ekans','Poison',NULL,'Purple','Kanto',1,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/23.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (24,'Arbok','Poison',NULL,'Purple','Kanto',1,'false','false','false','false','false','false','false',0.5,'false','Ekans','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/24.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (25,'Pikachu','Electric',NULL,'Yellow','Kanto',1,'false','false','false','false','false','false','true',0.5,'true','Pichu','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/25.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (26,'Raichu','Electric',NULL,'Yellow','Kanto',1,'false','false','false','false','false','false','false',0.5,'false','Pikachu','true','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/26.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (27,'Sandshrew','Ground',NULL,'Yellow','Kanto',1,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/27.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (28,'Sandslash','Ground',NULL,'Yellow','Kanto',1,'false','false','false','false','false','false','false',0.5,'false','Sandshrew','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/28.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (29,'Nidoran-f','Poison',NULL,'Blue','Kanto',1,'false','false','false','false','false','false','false',1,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/29.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (30,'Nidorina','Poison',NULL,'Blue','Kanto',1,'false','false','false','false','false','false','false',1,'true','Nidoran-f','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/30.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (31,'Nidoqueen','Poison','Ground','Blue','Kanto',1,'false','false','false','false','false','false','false',1,'false','Nidorina','true','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/31.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (32,'Nidoran-m','Poison',NULL,'Purple','Kanto',1,'false','false','false','false','false','false','false',0,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/32.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (33,'Nidorino','Poison',NULL,'Purple','Kanto',1,'false','false','false','false','false','false','false',0,'true','Nidoran-m','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/33.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (34,'Nidoking','Poison','Ground','Purple','Kanto',1,'false','false','false','false','false','false','false',0,'false','Nidorino','true','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/34.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (35,'Clefairy','Fairy',NULL,'Pink','Kanto',1,'false','false','false','false','false','false','false',0.75,'true','Cleffa','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/35.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (36,'Clefable','Fairy',NULL,'Pink','Kanto',1,'false','false','false','false','false','true','false',0.75,'false','Clefairy','true','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/36.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (37,'Vulpix','Fire',NULL,'Brown','Kanto',1,'false','false','false','false','false','false','false',0.75,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/37.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (38,'Ninetales','Fire',NULL,'Yellow','Kanto',1,'false','false','false','false','false','false','false',0.75,'false','Vulpix','true','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/38.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (39,'Jigglypuff','Normal','Fairy','Pink','Kanto',1,'false','false','false','false','false','false','false',0.75,'true','Igglybuff','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/39.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (40,'Wigglytuff','Normal','Fairy','Pink','Kanto',1,'false','false','false','false','false','false','false',0.75,'false','Jigglypuff','true','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/40.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (41,'Zubat','Poison','Flying','Purple','Kanto',1,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/41.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (42,'Golbat','Poison','Flying','Purple','Kanto',1,'false','false','false','false','false','false','false',0.5,'true','Zubat','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/42.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (43,'Oddish','Grass','Poison','Blue','Kanto',1,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/43.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (44,'Gloom','Grass','Poison','Blue','Kanto',1,'false','false','false','false','false','false','false',0.5,'true','Oddish','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/44.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (45,'Vileplume','Grass','Poison','Red','Kanto',1,'false','false','false','false','false','false','false',0.5,'false','Gloom','true','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/45.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (46,'Paras','Bug','Grass','Red','Kanto',1,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/46.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (47,'Parasect','Bug','Grass','Red','Kanto',1,'false','false','false','false','false','false','false',0.5,'false','Paras','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/47.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (48,'Venonat','Bug','Poison','Purple','Kanto',1,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/48.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (49,'Venomoth','Bug','Poison','Purple','Kanto',1,'false','false','false','false','false','false','false',0.5,'false','Venonat','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/49.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (50,'Diglett','Ground',NULL,'Brown','Kanto',1,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/50.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (51,'Dugtrio','Ground',NULL,'Brown','Kanto',1,'false','false','false','false','false','false','false',0.5,'false','Diglett','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/51.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (52,'Meowth','Normal',NULL,'Yellow','Kanto',1,'false','false','false','false','false','false','true',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/52.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (53,'Persian','Normal',NULL,'Yellow','Kanto',1,'false','false','false','false','false','false','false',0.5,'false','Meowth','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/53.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (54,'Psyduck','Water',NULL,'Yellow','Kanto',1,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/54.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (55,'Golduck','Water',NULL,'Blue','Kanto',1,'false','false','false','false','false','false','false',0.5,'false','Psyduck','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/55.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (56,'Mankey','Fighting',NULL,'Brown','Kanto',1,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/56.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (57,'Primeape','Fighting',NULL,'Brown','Kanto',1,'false','false','false','false','false','false','false',0.5,'true','Mankey','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/57.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (58,'Growlithe','Fire',NULL,'Brown','Kanto',1,'false','false','false','false','false','false','false',0.25,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/58.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (59,'Arcanine','Fire',NULL,'Brown','Kanto',1,'false','false','false','false','false','false','false',0.25,'false','Growlithe','true','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/59.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (60,'Poliwag','Water',NULL,'Blue','Kanto',1,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/60.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (61,'Poliwhirl','Water',NULL,'Blue','Kanto',1,'false','false','false','false','false','false','false',0.5,'true','Poliwag','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/61.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (62,'Poliwrath','Water','Fighting','Blue','Kanto',1,'false','false','false','false','false','false','false',0.5,'false','Poliwhirl','true','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/62.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (63,'Abra','Psychic',NULL,'Brown','Kanto',1,'false','false','false','false','false','false','false',0.25,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/63.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (64,'Kadabra','Psychic',NULL,'Brown','Kanto',1,'false','false','false','false','false','false','false',0.25,'true','Abra','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/64.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (65,'Alakazam','Psychic',NULL,'Brown','Kanto',1,'false','false','false','false','false','true','false',0.25,'false','Kadabra','false','true','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/65.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (66,'Machop','Fighting',NULL,'Gray','Kanto',1,'false','false','false','false','false','false','false',0.25,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/66.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (67,'Machoke','Fighting',NULL,'Gray','Kanto',1,'false','false','false','false','false','false','false',0.25,'true','Machop','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/67.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (68,'Machamp','Fighting',NULL,'Gray','Kanto',1,'false','false','false','false','false','false','true',0.25,'false','Machoke','false','true','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/68.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (69,'Bellsprout','Grass','Poison','Green','Kanto',1,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/69.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (70,'Weepinbell','Grass','Poison','Green','Kanto',1,'false','false','false','false','false','false','false',0.5,'true','Bellsprout','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/70.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (71,'Victreebel','Grass','Poison','Green','Kanto',1,'false','false','false','false','false','true','false',0.5,'false','Weepinbell','true','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/71.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (72,'Tentacool','Water','Poison','Blue','Kanto',1,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/72.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (73,'Tentacruel','Water','Poison','Blue','Kanto',1,'false','false','false','false','false','false','false',0.5,'false','Tentacool','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/73.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (74,'Geodude','Rock','Ground','Brown','Kanto',1,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/74.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (75,'Graveler','Rock','Ground','Brown','Kanto',1,'false','false','false','false','false','false','false',0.5,'true','Geodude','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/75.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (76,'Golem','Rock','Ground','Brown','Kanto',1,'false','false','false','false','false','false','false',0.5,'false','Graveler','false','true','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/76.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (77,'Ponyta','Fire',NULL,'Yellow','Kanto',1,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/77.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (78,'Rapidash','Fire',NULL,'Yellow','Kanto',1,'false','false','false','false','false','false','false',0.5,'false','Ponyta','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/78.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (79,'Slowpoke','Water','Psychic','Pink','Kanto',1,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/79.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (80,'Slowbro','Water','Psychic','Pink','Kanto',1,'false','false','false','false','false','true','false',0.5,'false','Slowpoke','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/80.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (81,'Magnemite','Electric','Steel','Gray','Kanto',1,'false','false','false','false','false','false','false',-1,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/81.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (82,'Magneton','Electric','Steel','Gray','Kanto',1,'false','false','false','false','false','false','false',-1,'true','Magnemite','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/82.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (83,'Farfetchd','Normal','Flying','Brown','Kanto',1,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/83.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (84,'Doduo','Normal','Flying','Brown','Kanto',1,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/84.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (85,'Dodrio','Normal','Flying','Brown','Kanto',1,'false','false','false','false','false','false','false',0.5,'false','Doduo','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/85.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (86,'Seel','Water',NULL,'White','Kanto',1,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/86.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (87,'Dewgong','Water','Ice','White','Kanto',1,'false','false','false','false','false','false','false',0.5,'false','Seel','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/87.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (88,'Grimer','Poison',NULL,'Purple','Kanto',1,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/88.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (89,'Muk','Poison',NULL,'Purple','Kanto',1,'false','false','false','false','false','false','false',0.5,'false','Grimer','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/89.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (90,'Shellder','Water',NULL,'Purple','Kanto',1,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/90.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (91,'Cloyster','Water','Ice','Purple','Kanto',1,'false','false','false','false','false','false','false',0.5,'false','Shellder','true','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/91.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (92,'Gastly','Ghost','Poison','Purple','Kanto',1,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/92.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (93,'Haunter','Ghost','Poison','Purple','Kanto',1,'false','false','false','false','false','false','false',0.5,'true','Gastly','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/93.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (94,'Gengar','Ghost','Poison','Purple','Kanto',1,'false','false','false','false','false','true','true',0.5,'false','Haunter','false','true','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/94.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (95,'Onix','Rock','Ground','Gray','Kanto',1,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/95.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (96,'Drowzee','Psychic',NULL,'Yellow','Kanto',1,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/96.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (97,'Hypno','Psychic',NULL,'Yellow','Kanto',1,'false','false','false','false','false','false','false',0.5,'false','Drowzee','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/97.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (98,'Krabby','Water',NULL,'Red','Kanto',1,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/98.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (99,'Kingler','Water',NULL,'Red','Kanto',1,'false','false','false','false','false','false','true',0.5,'false','Krabby','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/99.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (100,'Voltorb','Electric',NULL,'Red','Kanto',1,'false','false','false','false','false','false','false',-1,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/100.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (101,'Electrode','Electric',NULL,'Red','Kanto',1,'false','false','false','false','false','false','false',-1,'false','Voltorb','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/101.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (102,'Exeggcute','Grass','Psychic','Pink','Kanto',1,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/102.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (103,'Exeggutor','Grass','Psychic','Yellow','Kanto',1,'false','false','false','false','false','false','false',0.5,'false','Exeggcute','true','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/103.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (104,'Cubone','Ground',NULL,'Brown','Kanto',1,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/104.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (105,'Marowak','Ground',NULL,'Brown','Kanto',1,'false','false','false','false','false','false','false',0.5,'false','Cubone','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/105.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (106,'Hitmonlee','Fighting',NULL,'Brown','Kanto',1,'false','false','false','false','false','false','false',0,'false','Tyrogue','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/106.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (107,'Hitmonchan','Fighting',NULL,'Brown','Kanto',1,'false','false','false','false','false','false','false',0,'false','Tyrogue','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/107.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (108,'Lickitung','Normal',NULL,'Pink','Kanto',1,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/108.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (109,'Koffing','Poison',NULL,'Purple','Kanto',1,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/109.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (110,'Weezing','Poison',NULL,'Purple','Kanto',1,'false','false','false','false','false','false','false',0.5,'false','Koffing','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/110.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (111,'Rhyhorn','Ground','Rock','Gray','Kanto',1,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/111.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (112,'Rhydon','Ground','Rock','Gray','Kanto',1,'false','false','false','false','false','false','false',0.5,'true','Rhyhorn','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/112.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (113,'Chansey','Normal',NULL,'Pink','Kanto',1,'false','false','false','false','false','false','false',1,'true','Happiny','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/113.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (114,'Tangela','Grass',NULL,'Blue','Kanto',1,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/114.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (115,'Kangaskhan','Normal',NULL,'Brown','Kanto',1,'false','false','false','false','false','true','false',1,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/115.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (116,'Horsea','Water',NULL,'Blue','Kanto',1,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/116.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (117,'Seadra','Water',NULL,'Blue','Kanto',1,'false','false','false','false','false','false','false',0.5,'true','Horsea','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/117.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (118,'Goldeen','Water',NULL,'Red','Kanto',1,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/118.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (119,'Seaking','Water',NULL,'Red','Kanto',1,'false','false','false','false','false','false','false',0.5,'false','Goldeen','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/119.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (120,'Staryu','Water',NULL,'Brown','Kanto',1,'false','false','false','false','false','false','false',-1,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/120.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (121,'Starmie','Water','Psychic','Purple','Kanto',1,'false','false','false','false','false','true','false',-1,'false','Staryu','true','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/121.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (122,'Mr-mime','Psychic','Fairy','Pink','Kanto',1,'false','false','false','false','false','false','false',0.5,'true','Mime-jr','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/122.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (123,'Scyther','Bug','Flying','Green','Kanto',1,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/123.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (124,'Jynx','Ice','Psychic','Red','Kanto',1,'false','false','false','false','false','false','false',1,'false','Smoochum','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/124.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (125,'Electabuzz','Electric',NULL,'Yellow','Kanto',1,'false','false','false','false','false','false','false',0.25,'true','Elekid','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/125.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (126,'Magmar','Fire',NULL,'Red','Kanto',1,'false','false','false','false','false','false','false',0.25,'true','Magby','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/126.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (127,'Pinsir','Bug',NULL,'Brown','Kanto',1,'false','false','false','false','false','true','false',0.5,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/127.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (128,'Tauros','Normal',NULL,'Brown','Kanto',1,'false','false','false','false','false','false','false',0,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/128.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (129,'Magikarp','Water',NULL,'Red','Kanto',1,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/129.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (130,'Gyarados','Water','Flying','Blue','Kanto',1,'false','false','false','false','false','true','false',0.5,'false','Magikarp','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/130.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (131,'Lapras','Water','Ice','Blue','Kanto',1,'false','false','false','false','false','false','true',0.5,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/131.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (132,'Ditto','Normal',NULL,'Purple','Kanto',1,'false','false','false','false','false','false','false',-1,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/132.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (133,'Eevee','Normal',NULL,'Brown','Kanto',1,'false','false','false','false','false','false','true',0.125,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/133.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (134,'Vaporeon','Water',NULL,'Blue','Kanto',1,'false','false','false','false','false','false','false',0.125,'false','Eevee','true','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/134.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (135,'Jolteon','Electric',NULL,'Yellow','Kanto',1,'false','false','false','false','false','false','false',0.125,'false','Eevee','true','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/135.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (136,'Flareon','Fire',NULL,'Red','Kanto',1,'false','false','false','false','false','false','false',0.125,'false','Eevee','true','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/136.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (137,'Porygon','Normal',NULL,'Pink','Kanto',1,'false','false','false','false','false','false','false',-1,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/137.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (138,'Omanyte','Rock','Water','Blue','Kanto',1,'false','false','false','true','false','false','false',0.125,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/138.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (139,'Omastar','Rock','Water','Blue','Kanto',1,'false','false','false','true','false','false','false',0.125,'false','Omanyte','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/139.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (140,'Kabuto','Rock','Water','Brown','Kanto',1,'false','false','false','true','false','false','false',0.125,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/140.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (141,'Kabutops','Rock','Water','Brown','Kanto',1,'false','false','false','true','false','false','false',0.125,'false','Kabuto','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/141.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (142,'Aerodactyl','Rock','Flying','Purple','Kanto',1,'false','false','false','true','false','true','false',0.125,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/142.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (143,'Snorlax','Normal',NULL,'Black','Kanto',1,'false','false','false','false','false','false','true',0.125,'false','Munchlax','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/143.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (144,'Articuno','Ice','Flying','Blue','Kanto',1,'true','false','false','false','false','false','false',-1,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/144.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (145,'Zapdos','Electric','Flying','Yellow','Kanto',1,'true','false','false','false','false','false','false',-1,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/145.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (146,'Moltres','Fire','Flying','Yellow','Kanto',1,'true','false','false','false','false','false','false',-1,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/146.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (147,'Dratini','Dragon',NULL,'Blue','Kanto',1,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/147.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (148,'Dragonair','Dragon',NULL,'Blue','Kanto',1,'false','false','false','false','false','false','false',0.5,'true','Dratini','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/148.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (149,'Dragonite','Dragon','Flying','Brown','Kanto',1,'false','false','false','false','false','true','false',0.5,'false','Dragonair','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/149.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (150,'Mewtwo','Psychic',NULL,'Purple','Kanto',1,'true','false','false','false','false','true','false',-1,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/150.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (151,'Mew','Psychic',NULL,'Pink','Kanto',1,'false','true','false','false','false','false','false',-1,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/151.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (152,'Chikorita','Grass',NULL,'Green','Johto',2,'false','false','false','false','true','false','false',0.125,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/152.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (153,'Bayleef','Grass',NULL,'Green','Johto',2,'false','false','false','false','true','false','false',0.125,'true','Chikorita','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/153.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (154,'Meganium','Grass',NULL,'Green','Johto',2,'false','false','false','false','true','true','false',0.125,'false','Bayleef','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/154.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (155,'Cyndaquil','Fire',NULL,'Yellow','Johto',2,'false','false','false','false','true','false','false',0.125,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/155.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (156,'Quilava','Fire',NULL,'Yellow','Johto',2,'false','false','false','false','true','false','false',0.125,'true','Cyndaquil','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/156.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (157,'Typhlosion','Fire',NULL,'Yellow','Johto',2,'false','false','false','false','true','false','false',0.125,'false','Quilava','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/157.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (158,'Totodile','Water',NULL,'Blue','Johto',2,'false','false','false','false','true','false','false',0.125,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/158.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (159,'Croconaw','Water',NULL,'Blue','Johto',2,'false','false','false','false','true','false','false',0.125,'true','Totodile','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/159.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (160,'Feraligatr','Water',NULL,'Blue','Johto',2,'false','false','false','false','true','true','false',0.125,'false','Croconaw','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/160.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (161,'Sentret','Normal',NULL,'Brown','Johto',2,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/161.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (162,'Furret','Normal',NULL,'Brown','Johto',2,'false','false','false','false','false','false','false',0.5,'false','Sentret','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/162.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (163,'Hoothoot','Normal','Flying','Brown','Johto',2,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/163.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (164,'Noctowl','Normal','Flying','Brown','Johto',2,'false','false','false','false','false','false','false',0.5,'false','Hoothoot','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/164.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (165,'Ledyba','Bug','Flying','Red','Johto',2,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/165.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (166,'Ledian','Bug','Flying','Red','Johto',2,'false','false','false','false','false','false','false',0.5,'false','Ledyba','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/166.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (167,'Spinarak','Bug','Poison','Green','Johto',2,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/167.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (168,'Ariados','Bug','Poison','Red','Johto',2,'false','false','false','false','false','false','false',0.5,'false','Spinarak','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/168.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (169,'Crobat','Poison','Flying','Purple','Johto',2,'false','false','false','false','false','false','false',0.5,'false','Golbat','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/169.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (170,'Chinchou','Water','Electric','Blue','Johto',2,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/170.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (171,'Lanturn','Water','Electric','Blue','Johto',2,'false','false','false','false','false','false','false',0.5,'false','Chinchou','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/171.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (172,'Pichu','Electric',NULL,'Yellow','Johto',2,'false','false','true','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/172.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (173,'Cleffa','Fairy',NULL,'Pink','Johto',2,'false','false','true','false','false','false','false',0.75,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/173.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (174,'Igglybuff','Normal','Fairy','Pink','Johto',2,'false','false','true','false','false','false','false',0.75,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/174.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (175,'Togepi','Fairy',NULL,'White','Johto',2,'false','false','true','false','false','false','false',0.125,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/175.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (176,'Togetic','Fairy','Flying','White','Johto',2,'false','false','false','false','false','false','false',0.125,'true','Togepi','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/176.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (177,'Natu','Psychic','Flying','Green','Johto',2,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/177.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (178,'Xatu','Psychic','Flying','Green','Johto',2,'false','false','false','false','false','false','false',0.5,'false','Natu','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/178.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (179,'Mareep','Electric',NULL,'White','Johto',2,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/179.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (180,'Flaaffy','Electric',NULL,'Pink','Johto',2,'false','false','false','false','false','false','false',0.5,'true','Mareep','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/180.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (181,'Ampharos','Electric',NULL,'Yellow','Johto',2,'false','false','false','false','false','true','false',0.5,'false','Flaaffy','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/181.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (182,'Bellossom','Grass',NULL,'Green','Johto',2,'false','false','false','false','false','false','false',0.5,'false','Gloom','true','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/182.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (183,'Marill','Water','Fairy','Blue','Johto',2,'false','false','false','false','false','false','false',0.5,'true','Azurill','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/183.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (184,'Azumarill','Water','Fairy','Blue','Johto',2,'false','false','false','false','false','false','false',0.5,'false','Marill','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/184.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (185,'Sudowoodo','Rock',NULL,'Brown','Johto',2,'false','false','false','false','false','false','false',0.5,'false','Bonsly','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/185.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (186,'Politoed','Water',NULL,'Green','Johto',2,'false','false','false','false','false','false','false',0.5,'false','Poliwhirl','false','true','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/186.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (187,'Hoppip','Grass','Flying','Pink','Johto',2,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/187.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (188,'Skiploom','Grass','Flying','Green','Johto',2,'false','false','false','false','false','false','false',0.5,'true','Hoppip','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/188.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (189,'Jumpluff','Grass','Flying','Blue','Johto',2,'false','false','false','false','false','false','false',0.5,'false','Skiploom','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/189.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (190,'Aipom','Normal',NULL,'Purple','Johto',2,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/190.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (191,'Sunkern','Grass',NULL,'Yellow','Johto',2,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/191.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (192,'Sunflora','Grass',NULL,'Yellow','Johto',2,'false','false','false','false','false','false','false',0.5,'false','Sunkern','true','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/192.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (193,'Yanma','Bug','Flying','Red','Johto',2,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/193.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (194,'Wooper','Water','Ground','Blue','Johto',2,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/194.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (195,'Quagsire','Water','Ground','Blue','Johto',2,'false','false','false','false','false','false','false',0.5,'false','Wooper','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/195.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (196,'Espeon','Psychic',NULL,'Purple','Johto',2,'false','false','false','false','false','false','false',0.125,'false','Eevee','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/196.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (197,'Umbreon','Dark',NULL,'Black','Johto',2,'false','false','false','false','false','false','false',0.125,'false','Eevee','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/197.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (198,'Murkrow','Dark','Flying','Black','Johto',2,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/198.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (199,'Slowking','Water','Psychic','Pink','Johto',2,'false','false','false','false','false','false','false',0.5,'false','Slowpoke','false','true','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/199.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (200,'Misdreavus','Ghost',NULL,'Gray','Johto',2,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/200.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (201,'Unown','Psychic',NULL,'Black','Johto',2,'false','false','false','false','false','false','false',-1,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/201.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (202,'Wobbuffet','Psychic',NULL,'Blue','Johto',2,'false','false','false','false','false','false','false',0.5,'false','Wynaut','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/202.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (203,'Girafarig','Normal','Psychic','Yellow','Johto',2,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/203.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (204,'Pineco','Bug',NULL,'Gray','Johto',2,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/204.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (205,'Forretress','Bug','Steel','Purple','Johto',2,'false','false','false','false','false','false','false',0.5,'false','Pineco','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/205.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (206,'Dunsparce','Normal',NULL,'Yellow','Johto',2,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/206.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (207,'Gligar','Ground','Flying','Purple','Johto',2,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/207.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (208,'Steelix','Steel','Ground','Gray','Johto',2,'false','false','false','false','false','true','false',0.5,'false','Onix','false','true','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/208.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (209,'Snubbull','Fairy',NULL,'Pink','Johto',2,'false','false','false','false','false','false','false',0.75,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/209.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (210,'Granbull','Fairy',NULL,'Purple','Johto',2,'false','false','false','false','false','false','false',0.75,'false','Snubbull','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/210.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (211,'Qwilfish','Water','Poison','Gray','Johto',2,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/211.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (212,'Scizor','Bug','Steel','Red','Johto',2,'false','false','false','false','false','true','false',0.5,'false','Scyther','false','true','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/212.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (213,'Shuckle','Bug','Rock','Yellow','Johto',2,'false','false','false','false','false','false','false',0.5,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/213.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (214,'Heracross','Bug','Fighting','Blue','Johto',2,'false','false','false','false','false','true','false',0.5,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/214.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (215,'Sneasel','Dark','Ice','Black','Johto',2,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/215.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (216,'Teddiursa','Normal',NULL,'Brown','Johto',2,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/216.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (217,'Ursaring','Normal',NULL,'Brown','Johto',2,'false','false','false','false','false','false','false',0.5,'true','Teddiursa','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/217.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (218,'Slugma','Fire',NULL,'Red','Johto',2,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/218.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (219,'Magcargo','Fire','Rock','Red','Johto',2,'false','false','false','false','false','false','false',0.5,'false','Slugma','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/219.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (220,'Swinub','Ice','Ground','Brown','Johto',2,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/220.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (221,'Piloswine','Ice','Ground','Brown','Johto',2,'false','false','false','false','false','false','false',0.5,'true','Swinub','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/221.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (222,'Corsola','Water','Rock','Pink','Johto',2,'false','false','false','false','false','false','false',0.75,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/222.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (223,'Remoraid','Water',NULL,'Gray','Johto',2,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/223.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (224,'Octillery','Water',NULL,'Red','Johto',2,'false','false','false','false','false','false','false',0.5,'false','Remoraid','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/224.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (225,'Delibird','Ice','Flying','Red','Johto',2,'false','false','false','false','false','false','false',0.5,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/225.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (226,'Mantine','Water','Flying','Purple','Johto',2,'false','false','false','false','false','false','false',0.5,'false','Mantyke','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/226.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (227,'Skarmory','Steel','Flying','Gray','Johto',2,'false','false','false','false','false','true','false',0.5,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/227.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (228,'Houndour','Dark','Fire','Black','Johto',2,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/228.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (229,'Houndoom','Dark','Fire','Black','Johto',2,'false','false','false','false','false','true','false',0.5,'false','Houndour','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/229.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (230,'Kingdra','Water','Dragon','Blue','Johto',2,'false','false','false','false','false','false','false',0.5,'false','Seadra','false','true','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/230.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (231,'Phanpy','Ground',NULL,'Blue','Johto',2,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/231.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (232,'Donphan','Ground',NULL,'Gray','Johto',2,'false','false','false','false','false','false','false',0.5,'false','Phanpy','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/232.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (233,'Porygon2','Normal',NULL,'Red','Johto',2,'false','false','false','false','false','false','false',-1,'true','Porygon','false','true','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/233.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (234,'Stantler','Normal',NULL,'Brown','Johto',2,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/234.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (235,'Smeargle','Normal',NULL,'White','Johto',2,'false','false','false','false','false','false','false',0.5,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/235.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (236,'Tyrogue','Fighting',NULL,'Purple','Johto',2,'false','false','true','false','false','false','false',0,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/236.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (237,'Hitmontop','Fighting',NULL,'Brown','Johto',2,'false','false','false','false','false','false','false',0,'false','Tyrogue','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/237.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (238,'Smoochum','Ice','Psychic','Pink','Johto',2,'false','false','true','false','false','false','false',1,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/238.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (239,'Elekid','Electric',NULL,'Yellow','Johto',2,'false','false','true','false','false','false','false',0.25,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/239.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (240,'Magby','Fire',NULL,'Red','Johto',2,'false','false','true','false','false','false','false',0.25,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/240.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (241,'Miltank','Normal',NULL,'Pink','Johto',2,'false','false','false','false','false','false','false',1,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/241.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (242,'Blissey','Normal',NULL,'Pink','Johto',2,'false','false','false','false','false','false','false',1,'false','Chansey','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/242.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (243,'Raikou','Electric',NULL,'Yellow','Johto',2,'true','false','false','false','false','false','false',-1,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/243.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (244,'Entei','Fire',NULL,'Brown','Johto',2,'true','false','false','false','false','false','false',-1,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/244.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (245,'Suicune','Water',NULL,'Blue','Johto',2,'true','false','false','false','false','false','false',-1,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/245.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (246,'Larvitar','Rock','Ground','Green','Johto',2,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/246.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (247,'Pupitar','Rock','Ground','Gray','Johto',2,'false','false','false','false','false','false','false',0.5,'true','Larvitar','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/247.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (248,'Tyranitar','Rock','Dark','Green','Johto',2,'false','false','false','false','false','true','false',0.5,'false','Pupitar','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/248.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (249,'Lugia','Psychic','Flying','White','Johto',2,'true','false','false','false','false','false','false',-1,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/249.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (250,'Ho-oh','Fire','Flying','Red','Johto',2,'true','false','false','false','false','false','false',-1,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/250.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (251,'Celebi','Psychic','Grass','Green','Johto',2,'false','true','false','false','false','false','false',-1,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/251.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (252,'Treecko','Grass',NULL,'Green','Hoenn',3,'false','false','false','false','true','false','false',0.125,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/252.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (253,'Grovyle','Grass',NULL,'Green','Hoenn',3,'false','false','false','false','true','false','false',0.125,'true','Treecko','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/253.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (254,'Sceptile','Grass',NULL,'Green','Hoenn',3,'false','false','false','false','true','true','false',0.125,'false','Grovyle','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/254.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (255,'Torchic','Fire',NULL,'Red','Hoenn',3,'false','false','false','false','true','false','false',0.125,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/255.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (256,'Combusken','Fire','Fighting','Red','Hoenn',3,'false','false','false','false','true','false','false',0.125,'true','Torchic','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/256.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (257,'Blaziken','Fire','Fighting','Red','Hoenn',3,'false','false','false','false','true','true','false',0.125,'false','Combusken','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/257.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (258,'Mudkip','Water',NULL,'Blue','Hoenn',3,'false','false','false','false','true','false','false',0.125,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/258.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (259,'Marshtomp','Water','Ground','Blue','Hoenn',3,'false','false','false','false','true','false','false',0.125,'true','Mudkip','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/259.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (260,'Swampert','Water','Ground','Blue','Hoenn',3,'false','false','false','false','true','true','false',0.125,'false','Marshtomp','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/260.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (261,'Poochyena','Dark',NULL,'Gray','Hoenn',3,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/261.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (262,'Mightyena','Dark',NULL,'Gray','Hoenn',3,'false','false','false','false','false','false','false',0.5,'false','Poochyena','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/262.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (263,'Zigzagoon','Normal',NULL,'Brown','Hoenn',3,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/263.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (264,'Linoone','Normal',NULL,'White','Hoenn',3,'false','false','false','false','false','false','false',0.5,'true','Zigzagoon','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/264.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (265,'Wurmple','Bug',NULL,'Red','Hoenn',3,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/265.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (266,'Silcoon','Bug',NULL,'White','Hoenn',3,'false','false','false','false','false','false','false',0.5,'true','Wurmple','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/266.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (267,'Beautifly','Bug','Flying','Yellow','Hoenn',3,'false','false','false','false','false','false','false',0.5,'false','Silcoon','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/267.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (268,'Cascoon','Bug',NULL,'Purple','Hoenn',3,'false','false','false','false','false','false','false',0.5,'true','Wurmple','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/268.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (269,'Dustox','Bug','Poison','Green','Hoenn',3,'false','false','false','false','false','false','false',0.5,'false','Cascoon','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/269.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (270,'Lotad','Water','Grass','Green','Hoenn',3,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/270.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (271,'Lombre','Water','Grass','Green','Hoenn',3,'false','false','false','false','false','false','false',0.5,'true','Lotad','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/271.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (272,'Ludicolo','Water','Grass','Green','Hoenn',3,'false','false','false','false','false','false','false',0.5,'false','Lombre','true','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/272.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (273,'Seedot','Grass',NULL,'Brown','Hoenn',3,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/273.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (274,'Nuzleaf','Grass','Dark','Brown','Hoenn',3,'false','false','false','false','false','false','false',0.5,'true','Seedot','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/274.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (275,'Shiftry','Grass','Dark','Brown','Hoenn',3,'false','false','false','false','false','false','false',0.5,'false','Nuzleaf','true','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/275.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (276,'Taillow','Normal','Flying','Blue','Hoenn',3,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/276.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (277,'Swellow','Normal','Flying','Blue','Hoenn',3,'false','false','false','false','false','false','false',0.5,'false','Taillow','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/277.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (278,'Wingull','Water','Flying','White','Hoenn',3,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/278.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (279,'Pelipper','Water','Flying','Yellow','Hoenn',3,'false','false','false','false','false','false','false',0.5,'false','Wingull','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/279.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (280,'Ralts','Psychic','Fairy','White','Hoenn',3,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/280.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (281,'Kirlia','Psychic','Fairy','White','Hoenn',3,'false','false','false','false','false','false','false',0.5,'true','Ralts','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/281.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (282,'Gardevoir','Psychic','Fairy','White','Hoenn',3,'false','false','false','false','false','true','false',0.5,'false','Kirlia','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/282.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (283,'Surskit','Bug','Water','Blue','Hoenn',3,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/283.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (284,'Masquerain','Bug','Flying','Blue','Hoenn',3,'false','false','false','false','false','false','false',0.5,'false','Surskit','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/284.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (285,'Shroomish','Grass',NULL,'Brown','Hoenn',3,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/285.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (286,'Breloom','Grass','Fighting','Green','Hoenn',3,'false','false','false','false','false','false','false',0.5,'false','Shroomish','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/286.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (287,'Slakoth','Normal',NULL,'Brown','Hoenn',3,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/287.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (288,'Vigoroth','Normal',NULL,'White','Hoenn',3,'false','false','false','false','false','false','false',0.5,'true','Slakoth','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/288.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (289,'Slaking','Normal',NULL,'Brown','Hoenn',3,'false','false','false','false','false','false','false',0.5,'false','Vigoroth','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/289.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (290,'Nincada','Bug','Ground','Gray','Hoenn',3,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/290.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (291,'Ninjask','Bug','Flying','Yellow','Hoenn',3,'false','false','false','false','false','false','false',0.5,'false','Nincada','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/291.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (292,'Shedinja','Bug','Ghost','Brown','Hoenn',3,'false','false','false','false','false','false','false',-1,'false','Nincada','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/292.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (293,'Whismur','Normal',NULL,'Pink','Hoenn',3,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/293.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (294,'Loudred','Normal',NULL,'Blue','Hoenn',3,'false','false','false','false','false','false','false',0.5,'true','Whismur','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/294.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (295,'Exploud','Normal',NULL,'Blue','Hoenn',3,'false','false','false','false','false','false','false',0.5,'false','Loudred','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/295.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (296,'Makuhita','Fighting',NULL,'Yellow','Hoenn',3,'false','false','false','false','false','false','false',0.25,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/296.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (297,'Hariyama','Fighting',NULL,'Brown','Hoenn',3,'false','false','false','false','false','false','false',0.25,'false','Makuhita','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/297.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (298,'Azurill','Normal','Fairy','Blue','Hoenn',3,'false','false','true','false','false','false','false',0.75,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/298.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (299,'Nosepass','Rock',NULL,'Gray','Hoenn',3,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/299.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (300,'Skitty','Normal',NULL,'Pink','Hoenn',3,'false','false','false','false','false','false','false',0.75,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/300.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (301,'Delcatty','Normal',NULL,'Purple','Hoenn',3,'false','false','false','false','false','false','false',0.75,'false','Skitty','true','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/301.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (302,'Sableye','Dark','Ghost','Purple','Hoenn',3,'false','false','false','false','false','true','false',0.5,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/302.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (303,'Mawile','Steel','Fairy','Black','Hoenn',3,'false','false','false','false','false','true','false',0.5,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/303.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (304,'Aron','Steel','Rock','Gray','Hoenn',3,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/304.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (305,'Lairon','Steel','Rock','Gray','Hoenn',3,'false','false','false','false','false','false','false',0.5,'true','Aron','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/305.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (306,'Aggron','Steel','Rock','Gray','Hoenn',3,'false','false','false','false','false','true','false',0.5,'false','Lairon','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/306.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (307,'Meditite','Fighting','Psychic','Blue','Hoenn',3,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/307.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (308,'Medicham','Fighting','Psychic','Red','Hoenn',3,'false','false','false','false','false','true','false',0.5,'false','Meditite','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/308.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (309,'Electrike','Electric',NULL,'Green','Hoenn',3,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/309.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (310,'Manectric','Electric',NULL,'Yellow','Hoenn',3,'false','false','false','false','false','true','false',0.5,'false','Electrike','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/310.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (311,'Plusle','Electric',NULL,'Yellow','Hoenn',3,'false','false','false','false','false','false','false',0.5,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/311.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (312,'Minun','Electric',NULL,'Yellow','Hoenn',3,'false','false','false','false','false','false','false',0.5,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/312.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (313,'Volbeat','Bug',NULL,'Gray','Hoenn',3,'false','false','false','false','false','false','false',0,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/313.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (314,'Illumise','Bug',NULL,'Purple','Hoenn',3,'false','false','false','false','false','false','false',1,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/314.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (315,'Roselia','Grass','Poison','Green','Hoenn',3,'false','false','false','false','false','false','false',0.5,'true','Budew','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/315.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (316,'Gulpin','Poison',NULL,'Green','Hoenn',3,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/316.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (317,'Swalot','Poison',NULL,'Purple','Hoenn',3,'false','false','false','false','false','false','false',0.5,'false','Gulpin','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/317.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (318,'Carvanha','Water','Dark','Red','Hoenn',3,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/318.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (319,'Sharpedo','Water','Dark','Blue','Hoenn',3,'false','false','false','false','false','true','false',0.5,'false','Carvanha','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/319.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (320,'Wailmer','Water',NULL,'Blue','Hoenn',3,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/320.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (321,'Wailord','Water',NULL,'Blue','Hoenn',3,'false','false','false','false','false','false','false',0.5,'false','Wailmer','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/321.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (322,'Numel','Fire','Ground','Yellow','Hoenn',3,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/322.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (323,'Camerupt','Fire','Ground','Red','Hoenn',3,'false','false','false','false','false','true','false',0.5,'false','Numel','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/323.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (324,'Torkoal','Fire',NULL,'Brown','Hoenn',3,'false','false','false','false','false','false','false',0.5,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/324.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (325,'Spoink','Psychic',NULL,'Black','Hoenn',3,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/325.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (326,'Grumpig','Psychic',NULL,'Purple','Hoenn',3,'false','false','false','false','false','false','false',0.5,'false','Spoink','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/326.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (327,'Spinda','Normal',NULL,'Brown','Hoenn',3,'false','false','false','false','false','false','false',0.5,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/327.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (328,'Trapinch','Ground',NULL,'Brown','Hoenn',3,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/328.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (329,'Vibrava','Ground','Dragon','Green','Hoenn',3,'false','false','false','false','false','false','false',0.5,'true','Trapinch','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/329.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (330,'Flygon','Ground','Dragon','Green','Hoenn',3,'false','false','false','false','false','false','false',0.5,'false','Vibrava','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/330.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (331,'Cacnea','Grass',NULL,'Green','Hoenn',3,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/331.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (332,'Cacturne','Grass','Dark','Green','Hoenn',3,'false','false','false','false','false','false','false',0.5,'false','Cacnea','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/332.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (333,'Swablu','Normal','Flying','Blue','Hoenn',3,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/333.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (334,'Altaria','Dragon','Flying','Blue','Hoenn',3,'false','false','false','false','false','true','false',0.5,'false','Swablu','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/334.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (335,'Zangoose','Normal',NULL,'White','Hoenn',3,'false','false','false','false','false','false','false',0.5,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/335.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (336,'Seviper','Poison',NULL,'Black','Hoenn',3,'false','false','false','false','false','false','false',0.5,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/336.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (337,'Lunatone','Rock','Psychic','Yellow','Hoenn',3,'false','false','false','false','false','false','false',-1,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/337.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (338,'Solrock','Rock','Psychic','Red','Hoenn',3,'false','false','false','false','false','false','false',-1,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/338.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (339,'Barboach','Water','Ground','Gray','Hoenn',3,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/339.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (340,'Whiscash','Water','Ground','Blue','Hoenn',3,'false','false','false','false','false','false','false',0.5,'false','Barboach','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/340.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (341,'Corphish','Water',NULL,'Red','Hoenn',3,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/341.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (342,'Crawdaunt','Water','Dark','Red','Hoenn',3,'false','false','false','false','false','false','false',0.5,'false','Corphish','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/342.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (343,'Baltoy','Ground','Psychic','Brown','Hoenn',3,'false','false','false','false','false','false','false',-1,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/343.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (344,'Claydol','Ground','Psychic','Black','Hoenn',3,'false','false','false','false','false','false','false',-1,'false','Baltoy','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/344.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (345,'Lileep','Rock','Grass','Purple','Hoenn',3,'false','false','false','true','false','false','false',0.125,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/345.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (346,'Cradily','Rock','Grass','Green','Hoenn',3,'false','false','false','true','false','false','false',0.125,'false','Lileep','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/346.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (347,'Anorith','Rock','Bug','Gray','Hoenn',3,'false','false','false','true','false','false','false',0.125,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/347.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (348,'Armaldo','Rock','Bug','Gray','Hoenn',3,'false','false','false','true','false','false','false',0.125,'false','Anorith','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/348.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (349,'Feebas','Water',NULL,'Brown','Hoenn',3,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/349.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (350,'Milotic','Water',NULL,'Pink','Hoenn',3,'false','false','false','false','false','false','false',0.5,'false','Feebas','false','true','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/350.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (351,'Castform','Normal',NULL,'Gray','Hoenn',3,'false','false','false','false','false','false','false',0.5,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/351.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (352,'Kecleon','Normal',NULL,'Green','Hoenn',3,'false','false','false','false','false','false','false',0.5,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/352.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (353,'Shuppet','Ghost',NULL,'Black','Hoenn',3,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/353.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (354,'Banette','Ghost',NULL,'Black','Hoenn',3,'false','false','false','false','false','true','false',0.5,'false','Shuppet','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/354.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (355,'Duskull','Ghost',NULL,'Black','Hoenn',3,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/355.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (356,'Dusclops','Ghost',NULL,'Black','Hoenn',3,'false','false','false','false','false','false','false',0.5,'true','Duskull','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/356.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (357,'Tropius','Grass','Flying','Green','Hoenn',3,'false','false','false','false','false','false','false',0.5,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/357.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (358,'Chimecho','Psychic',NULL,'Blue','Hoenn',3,'false','false','false','false','false','false','false',0.5,'false','Chingling','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/358.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (359,'Absol','Dark',NULL,'White','Hoenn',3,'false','false','false','false','false','true','false',0.5,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/359.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (360,'Wynaut','Psychic',NULL,'Blue','Hoenn',3,'false','false','true','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/360.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (361,'Snorunt','Ice',NULL,'Gray','Hoenn',3,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/361.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (362,'Glalie','Ice',NULL,'Gray','Hoenn',3,'false','false','false','false','false','true','false',0.5,'false','Snorunt','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/362.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (363,'Spheal','Ice','Water','Blue','Hoenn',3,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/363.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (364,'Sealeo','Ice','Water','Blue','Hoenn',3,'false','false','false','false','false','false','false',0.5,'true','Spheal','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/364.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (365,'Walrein','Ice','Water','Blue','Hoenn',3,'false','false','false','false','false','false','false',0.5,'false','Sealeo','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/365.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (366,'Clamperl','Water',NULL,'Blue','Hoenn',3,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/366.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (367,'Huntail','Water',NULL,'Blue','Hoenn',3,'false','false','false','false','false','false','false',0.5,'false','Clamperl','false','true','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/367.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (368,'Gorebyss','Water',NULL,'Pink','Hoenn',3,'false','false','false','false','false','false','false',0.5,'false','Clamperl','false','true','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/368.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (369,'Relicanth','Water','Rock','Gray','Hoenn',3,'false','false','false','false','false','false','false',0.125,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/369.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (370,'Luvdisc','Water',NULL,'Pink','Hoenn',3,'false','false','false','false','false','false','false',0.75,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/370.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (371,'Bagon','Dragon',NULL,'Blue','Hoenn',3,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/371.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (372,'Shelgon','Dragon',NULL,'White','Hoenn',3,'false','false','false','false','false','false','false',0.5,'true','Bagon','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/372.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (373,'Salamence','Dragon','Flying','Blue','Hoenn',3,'false','false','false','false','false','true','false',0.5,'false','Shelgon','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/373.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (374,'Beldum','Steel','Psychic','Blue','Hoenn',3,'false','false','false','false','false','false','false',-1,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/374.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (375,'Metang','Steel','Psychic','Blue','Hoenn',3,'false','false','false','false','false','false','false',-1,'true','Beldum','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/375.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (376,'Metagross','Steel','Psychic','Blue','Hoenn',3,'false','false','false','false','false','true','false',-1,'false','Metang','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/376.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (377,'Regirock','Rock',NULL,'Brown','Hoenn',3,'true','false','false','false','false','false','false',-1,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/377.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (378,'Regice','Ice',NULL,'Blue','Hoenn',3,'true','false','false','false','false','false','false',-1,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/378.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (379,'Registeel','Steel',NULL,'Gray','Hoenn',3,'true','false','false','false','false','false','false',-1,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/379.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (380,'Latias','Dragon','Psychic','Red','Hoenn',3,'true','false','false','false','false','true','false',1,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/380.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (381,'Latios','Dragon','Psychic','Blue','Hoenn',3,'true','false','false','false','false','true','false',0,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/381.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (382,'Kyogre','Water',NULL,'Blue','Hoenn',3,'true','false','false','false','false','false','false',-1,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/382.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (383,'Groudon','Ground',NULL,'Red','Hoenn',3,'true','false','false','false','false','false','false',-1,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/383.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (384,'Rayquaza','Dragon','Flying','Green','Hoenn',3,'true','false','false','false','false','true','false',-1,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/384.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (385,'Jirachi','Steel','Psychic','Yellow','Hoenn',3,'false','true','false','false','false','false','false',-1,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/385.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (386,'Deoxys-normal','Psychic',NULL,'Red','Hoenn',3,'false','true','false','false','false','false','false',-1,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/386.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (387,'Turtwig','Grass',NULL,'Green','Sinnoh',4,'false','false','false','false','true','false','false',0.125,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/387.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (388,'Grotle','Grass',NULL,'Green','Sinnoh',4,'false','false','false','false','true','false','false',0.125,'true','Turtwig','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/388.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (389,'Torterra','Grass','Ground','Green','Sinnoh',4,'false','false','false','false','true','false','false',0.125,'false','Grotle','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/389.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (390,'Chimchar','Fire',NULL,'Brown','Sinnoh',4,'false','false','false','false','true','false','false',0.125,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/390.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (391,'Monferno','Fire','Fighting','Brown','Sinnoh',4,'false','false','false','false','true','false','false',0.125,'true','Chimchar','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/391.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (392,'Infernape','Fire','Fighting','Brown','Sinnoh',4,'false','false','false','false','true','false','false',0.125,'false','Monferno','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/392.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (393,'Piplup','Water',NULL,'Blue','Sinnoh',4,'false','false','false','false','true','false','false',0.125,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/393.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (394,'Prinplup','Water',NULL,'Blue','Sinnoh',4,'false','false','false','false','true','false','false',0.125,'true','Piplup','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/394.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (395,'Empoleon','Water','Steel','Blue','Sinnoh',4,'false','false','false','false','true','false','false',0.125,'false','Prinplup','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/395.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (396,'Starly','Normal','Flying','Brown','Sinnoh',4,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/396.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (397,'Staravia','Normal','Flying','Brown','Sinnoh',4,'false','false','false','false','false','false','false',0.5,'true','Starly','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/397.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (398,'Staraptor','Normal','Flying','Brown','Sinnoh',4,'false','false','false','false','false','false','false',0.5,'false','Staravia','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/398.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (399,'Bidoof','Normal',NULL,'Brown','Sinnoh',4,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/399.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (400,'Bibarel','Normal','Water','Brown','Sinnoh',4,'false','false','false','false','false','false','false',0.5,'false','Bidoof','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/400.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (401,'Kricketot','Bug',NULL,'Red','Sinnoh',4,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/401.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (402,'Kricketune','Bug',NULL,'Red','Sinnoh',4,'false','false','false','false','false','false','false',0.5,'false','Kricketot','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/402.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (403,'Shinx','Electric',NULL,'Blue','Sinnoh',4,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/403.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (404,'Luxio','Electric',NULL,'Blue','Sinnoh',4,'false','false','false','false','false','false','false',0.5,'true','Shinx','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/404.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (405,'Luxray','Electric',NULL,'Blue','Sinnoh',4,'false','false','false','false','false','false','false',0.5,'false','Luxio','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/405.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (406,'Budew','Grass','Poison','Green','Sinnoh',4,'false','false','true','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/406.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (407,'Roserade','Grass','Poison','Green','Sinnoh',4,'false','false','false','false','false','false','false',0.5,'false','Roselia','true','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/407.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (408,'Cranidos','Rock',NULL,'Blue','Sinnoh',4,'false','false','false','true','false','false','false',0.125,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/408.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (409,'Rampardos','Rock',NULL,'Blue','Sinnoh',4,'false','false','false','true','false','false','false',0.125,'false','Cranidos','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/409.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (410,'Shieldon','Rock','Steel','Gray','Sinnoh',4,'false','false','false','true','false','false','false',0.125,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/410.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (411,'Bastiodon','Rock','Steel','Gray','Sinnoh',4,'false','false','false','true','false','false','false',0.125,'false','Shieldon','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/411.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (412,'Burmy','Bug',NULL,'Green','Sinnoh',4,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/412.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (413,'Wormadam-plant','Bug','Grass','Green','Sinnoh',4,'false','false','false','false','false','false','false',1,'false','Burmy','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/413.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (414,'Mothim','Bug','Flying','Yellow','Sinnoh',4,'false','false','false','false','false','false','false',0,'false','Burmy','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/414.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (415,'Combee','Bug','Flying','Yellow','Sinnoh',4,'false','false','false','false','false','false','false',0.125,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/415.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (416,'Vespiquen','Bug','Flying','Yellow','Sinnoh',4,'false','false','false','false','false','false','false',1,'false','Combee','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/416.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (417,'Pachirisu','Electric',NULL,'White','Sinnoh',4,'false','false','false','false','false','false','false',0.5,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/417.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (418,'Buizel','Water',NULL,'Brown','Sinnoh',4,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/418.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (419,'Floatzel','Water',NULL,'Brown','Sinnoh',4,'false','false','false','false','false','false','false',0.5,'false','Buizel','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/419.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (420,'Cherubi','Grass',NULL,'Pink','Sinnoh',4,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/420.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (421,'Cherrim','Grass',NULL,'Purple','Sinnoh',4,'false','false','false','false','false','false','false',0.5,'false','Cherubi','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/421.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (422,'Shellos','Water',NULL,'Purple','Sinnoh',4,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/422.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (423,'Gastrodon','Water','Ground','Purple','Sinnoh',4,'false','false','false','false','false','false','false',0.5,'false','Shellos','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/423.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (424,'Ambipom','Normal',NULL,'Purple','Sinnoh',4,'false','false','false','false','false','false','false',0.5,'false','Aipom','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/424.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (425,'Drifloon','Ghost','Flying','Purple','Sinnoh',4,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/425.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (426,'Drifblim','Ghost','Flying','Purple','Sinnoh',4,'false','false','false','false','false','false','false',0.5,'false','Drifloon','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/426.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (427,'Buneary','Normal',NULL,'Brown','Sinnoh',4,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/427.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (428,'Lopunny','Normal',NULL,'Brown','Sinnoh',4,'false','false','false','false','false','true','false',0.5,'false','Buneary','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/428.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (429,'Mismagius','Ghost',NULL,'Purple','Sinnoh',4,'false','false','false','false','false','false','false',0.5,'false','Misdreavus','true','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/429.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (430,'Honchkrow','Dark','Flying','Black','Sinnoh',4,'false','false','false','false','false','false','false',0.5,'false','Murkrow','true','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/430.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (431,'Glameow','Normal',NULL,'Gray','Sinnoh',4,'false','false','false','false','false','false','false',0.75,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/431.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (432,'Purugly','Normal',NULL,'Gray','Sinnoh',4,'false','false','false','false','false','false','false',0.75,'false','Glameow','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/432.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (433,'Chingling','Psychic',NULL,'Yellow','Sinnoh',4,'false','false','true','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/433.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (434,'Stunky','Poison','Dark','Purple','Sinnoh',4,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/434.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (435,'Skuntank','Poison','Dark','Purple','Sinnoh',4,'false','false','false','false','false','false','false',0.5,'false','Stunky','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/435.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (436,'Bronzor','Steel','Psychic','Green','Sinnoh',4,'false','false','false','false','false','false','false',-1,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/436.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (437,'Bronzong','Steel','Psychic','Green','Sinnoh',4,'false','false','false','false','false','false','false',-1,'false','Bronzor','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/437.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (438,'Bonsly','Rock',NULL,'Brown','Sinnoh',4,'false','false','true','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/438.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (439,'Mime-jr','Psychic','Fairy','Pink','Sinnoh',4,'false','false','true','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/439.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (440,'Happiny','Normal',NULL,'Pink','Sinnoh',4,'false','false','true','false','false','false','false',1,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/440.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (441,'Chatot','Normal','Flying','Black','Sinnoh',4,'false','false','false','false','false','false','false',0.5,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/441.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (442,'Spiritomb','Ghost','Dark','Purple','Sinnoh',4,'false','false','false','false','false','false','false',0.5,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/442.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (443,'Gible','Dragon','Ground','Blue','Sinnoh',4,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/443.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (444,'Gabite','Dragon','Ground','Blue','Sinnoh',4,'false','false','false','false','false','false','false',0.5,'true','Gible','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/444.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (445,'Garchomp','Dragon','Ground','Blue','Sinnoh',4,'false','false','false','false','false','true','false',0.5,'false','Gabite','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/445.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (446,'Munchlax','Normal',NULL,'Black','Sinnoh',4,'false','false','true','false','false','false','false',0.125,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/446.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (447,'Riolu','Fighting',NULL,'Blue','Sinnoh',4,'false','false','true','false','false','false','false',0.125,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/447.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (448,'Lucario','Fighting','Steel','Blue','Sinnoh',4,'false','false','false','false','false','true','false',0.125,'false','Riolu','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/448.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (449,'Hippopotas','Ground',NULL,'Brown','Sinnoh',4,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/449.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (450,'Hippowdon','Ground',NULL,'Brown','Sinnoh',4,'false','false','false','false','false','false','false',0.5,'false','Hippopotas','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/450.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (451,'Skorupi','Poison','Bug','Purple','Sinnoh',4,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/451.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (452,'Drapion','Poison','Dark','Purple','Sinnoh',4,'false','false','false','false','false','false','false',0.5,'false','Skorupi','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/452.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (453,'Croagunk','Poison','Fighting','Blue','Sinnoh',4,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/453.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (454,'Toxicroak','Poison','Fighting','Blue','Sinnoh',4,'false','false','false','false','false','false','false',0.5,'false','Croagunk','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/454.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (455,'Carnivine','Grass',NULL,'Green','Sinnoh',4,'false','false','false','false','false','false','false',0.5,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/455.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (456,'Finneon','Water',NULL,'Blue','Sinnoh',4,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/456.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (457,'Lumineon','Water',NULL,'Blue','Sinnoh',4,'false','false','false','false','false','false','false',0.5,'false','Finneon','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/457.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (458,'Mantyke','Water','Flying','Blue','Sinnoh',4,'false','false','true','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/458.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (459,'Snover','Grass','Ice','White','Sinnoh',4,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/459.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (460,'Abomasnow','Grass','Ice','White','Sinnoh',4,'false','false','false','false','false','true','false',0.5,'false','Snover','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/460.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (461,'Weavile','Dark','Ice','Black','Sinnoh',4,'false','false','false','false','false','false','false',0.5,'false','Sneasel','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/461.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (462,'Magnezone','Electric','Steel','Gray','Sinnoh',4,'false','false','false','false','false','false','false',-1,'false','Magneton','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/462.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (463,'Lickilicky','Normal',NULL,'Pink','Sinnoh',4,'false','false','false','false','false','false','false',0.5,'false','Lickitung','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/463.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (464,'Rhyperior','Ground','Rock','Gray','Sinnoh',4,'false','false','false','false','false','false','false',0.5,'false','Rhydon','false','true','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/464.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (465,'Tangrowth','Grass',NULL,'Blue','Sinnoh',4,'false','false','false','false','false','false','false',0.5,'false','Tangela','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/465.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (466,'Electivire','Electric',NULL,'Yellow','Sinnoh',4,'false','false','false','false','false','false','false',0.25,'false','Electabuzz','false','true','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/466.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (467,'Magmortar','Fire',NULL,'Red','Sinnoh',4,'false','false','false','false','false','false','false',0.25,'false','Magmar','false','true','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/467.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (468,'Togekiss','Fairy','Flying','White','Sinnoh',4,'false','false','false','false','false','false','false',0.125,'false','Togetic','true','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/468.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (469,'Yanmega','Bug','Flying','Green','Sinnoh',4,'false','false','false','false','false','false','false',0.5,'false','Yanma','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/469.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (470,'Leafeon','Grass',NULL,'Green','Sinnoh',4,'false','false','false','false','false','false','false',0.125,'false','Eevee','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/470.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (471,'Glaceon','Ice',NULL,'Blue','Sinnoh',4,'false','false','false','false','false','false','false',0.125,'false','Eevee','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/471.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (472,'Gliscor','Ground','Flying','Purple','Sinnoh',4,'false','false','false','false','false','false','false',0.5,'false','Gligar','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/472.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (473,'Mamoswine','Ice','Ground','Brown','Sinnoh',4,'false','false','false','false','false','false','false',0.5,'false','Piloswine','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/473.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (474,'Porygon-z','Normal',NULL,'Red','Sinnoh',4,'false','false','false','false','false','false','false',-1,'false','Porygon2','false','true','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/474.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (475,'Gallade','Psychic','Fighting','White','Sinnoh',4,'false','false','false','false','false','true','false',0,'false','Kirlia','true','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/475.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (476,'Probopass','Rock','Steel','Gray','Sinnoh',4,'false','false','false','false','false','false','false',0.5,'false','Nosepass','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/476.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (477,'Dusknoir','Ghost',NULL,'Black','Sinnoh',4,'false','false','false','false','false','false','false',0.5,'false','Dusclops','false','true','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/477.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (478,'Froslass','Ice','Ghost','White','Sinnoh',4,'false','false','false','false','false','true','false',1,'false','Snorunt','true','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/478.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (479,'Rotom','Electric','Ghost','Red','Sinnoh',4,'false','false','false','false','false','false','false',-1,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/479.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (480,'Uxie','Psychic',NULL,'Yellow','Sinnoh',4,'true','false','false','false','false','false','false',-1,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/480.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (481,'Mesprit','Psychic',NULL,'Pink','Sinnoh',4,'true','false','false','false','false','false','false',-1,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/481.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (482,'Azelf','Psychic',NULL,'Blue','Sinnoh',4,'true','false','false','false','false','false','false',-1,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/482.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (483,'Dialga','Steel','Dragon','White','Sinnoh',4,'true','false','false','false','false','false','false',-1,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/483.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (484,'Palkia','Water','Dragon','Purple','Sinnoh',4,'true','false','false','false','false','false','false',-1,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/484.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (485,'Heatran','Fire','Steel','Brown','Sinnoh',4,'true','false','false','false','false','false','false',0.5,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/485.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (486,'Regigigas','Normal',NULL,'White','Sinnoh',4,'true','false','false','false','false','false','false',-1,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/486.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (487,'Giratina-altered','Ghost','Dragon','Black','Sinnoh',4,'true','false','false','false','false','false','false',-1,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/487.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (488,'Cresselia','Psychic',NULL,'Yellow','Sinnoh',4,'true','false','false','false','false','false','false',1,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/488.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (489,'Phione','Water',NULL,'Blue','Sinnoh',4,'false','true','false','false','false','false','false',-1,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/489.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (490,'Manaphy','Water',NULL,'Blue','Sinnoh',4,'false','true','false','false','false','false','false',-1,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/490.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (491,'Darkrai','Dark',NULL,'Black','Sinnoh',4,'false','true','false','false','false','false','false',-1,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/491.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (492,'Shaymin-land','Grass',NULL,'Green','Sinnoh',4,'false','true','false','false','false','false','false',-1,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/492.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (493,'Arceus','Normal',NULL,'White','Sinnoh',4,'false','true','false','false','false','false','false',-1,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/493.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (494,'Victini','Psychic','Fire','Yellow','Unova',5,'false','true','false','false','false','false','false',-1,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/494.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (495,'Snivy','Grass',NULL,'Green','Unova',5,'false','false','false','false','true','false','false',0.125,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/495.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (496,'Servine','Grass',NULL,'Green','Unova',5,'false','false','false','false','true','false','false',0.125,'true','Snivy','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/496.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (497,'Serperior','Grass',NULL,'Green','Unova',5,'false','false','false','false','true','false','false',0.125,'false','Servine','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/497.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (498,'Tepig','Fire',NULL,'Red','Unova',5,'false','false','false','false','true','false','false',0.125,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/498.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (499,'Pignite','Fire','Fighting','Red','Unova',5,'false','false','false','false','true','false','false',0.125,'true','Tepig','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/499.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (500,'Emboar','Fire','Fighting','Red','Unova',5,'false','false','false','false','true','true','false',0.125,'false','Pignite','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/500.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (501,'Oshawott','Water',NULL,'Blue','Unova',5,'false','false','false','false','true','false','false',0.125,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/501.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (502,'Dewott','Water',NULL,'Blue','Unova',5,'false','false','false','false','true','false','false',0.125,'true','Oshawott','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/502.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (503,'Samurott','Water',NULL,'Blue','Unova',5,'false','false','false','false','true','false','false',0.125,'false','Dewott','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/503.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (504,'Patrat','Normal',NULL,'Brown','Unova',5,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/504.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (505,'Watchog','Normal',NULL,'Brown','Unova',5,'false','false','false','false','false','false','false',0.5,'false','Patrat','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/505.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (506,'Lillipup','Normal',NULL,'Brown','Unova',5,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/506.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (507,'Herdier','Normal',NULL,'Gray','Unova',5,'false','false','false','false','false','false','false',0.5,'true','Lillipup','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/507.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (508,'Stoutland','Normal',NULL,'Gray','Unova',5,'false','false','false','false','false','false','false',0.5,'false','Herdier','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/508.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (509,'Purrloin','Dark',NULL,'Purple','Unova',5,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/509.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (510,'Liepard','Dark',NULL,'Purple','Unova',5,'false','false','false','false','false','false','false',0.5,'false','Purrloin','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/510.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (511,'Pansage','Grass',NULL,'Green','Unova',5,'false','false','false','false','false','false','false',0.125,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/511.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (512,'Simisage','Grass',NULL,'Green','Unova',5,'false','false','false','false','false','false','false',0.125,'false','Pansage','true','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/512.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (513,'Pansear','Fire',NULL,'Red','Unova',5,'false','false','false','false','false','false','false',0.125,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/513.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (514,'Simisear','Fire',NULL,'Red','Unova',5,'false','false','false','false','false','false','false',0.125,'false','Pansear','true','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/514.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (515,'Panpour','Water',NULL,'Blue','Unova',5,'false','false','false','false','false','false','false',0.125,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/515.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (516,'Simipour','Water',NULL,'Blue','Unova',5,'false','false','false','false','false','false','false',0.125,'false','Panpour','true','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/516.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (517,'Munna','Psychic',NULL,'Pink','Unova',5,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/517.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (518,'Musharna','Psychic',NULL,'Pink','Unova',5,'false','false','false','false','false','false','false',0.5,'false','Munna','true','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/518.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (519,'Pidove','Normal','Flying','Gray','Unova',5,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/519.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (520,'Tranquill','Normal','Flying','Gray','Unova',5,'false','false','false','false','false','false','false',0.5,'true','Pidove','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/520.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (521,'Unfezant','Normal','Flying','Gray','Unova',5,'false','false','false','false','false','false','false',0.5,'false','Tranquill','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/521.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (522,'Blitzle','Electric',NULL,'Black','Unova',5,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/522.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (523,'Zebstrika','Electric',NULL,'Black','Unova',5,'false','false','false','false','false','false','false',0.5,'false','Blitzle','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/523.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (524,'Roggenrola','Rock',NULL,'Blue','Unova',5,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/524.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (525,'Boldore','Rock',NULL,'Blue','Unova',5,'false','false','false','false','false','false','false',0.5,'true','Roggenrola','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/525.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (526,'Gigalith','Rock',NULL,'Blue','Unova',5,'false','false','false','false','false','false','false',0.5,'false','Boldore','false','true','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/526.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (527,'Woobat','Psychic','Flying','Blue','Unova',5,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/527.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (528,'Swoobat','Psychic','Flying','Blue','Unova',5,'false','false','false','false','false','false','false',0.5,'false','Woobat','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/528.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (529,'Drilbur','Ground',NULL,'Gray','Unova',5,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/529.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (530,'Excadrill','Ground','Steel','Gray','Unova',5,'false','false','false','false','false','true','false',0.5,'false','Drilbur','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/530.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (531,'Audino','Normal',NULL,'Pink','Unova',5,'false','false','false','false','false','true','false',0.5,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/531.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (532,'Timburr','Fighting',NULL,'Gray','Unova',5,'false','false','false','false','false','false','false',0.25,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/532.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (533,'Gurdurr','Fighting',NULL,'Gray','Unova',5,'false','false','false','false','false','false','false',0.25,'true','Timburr','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/533.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (534,'Conkeldurr','Fighting',NULL,'Brown','Unova',5,'false','false','false','false','false','false','false',0.25,'false','Gurdurr','false','true','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/534.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (535,'Tympole','Water',NULL,'Blue','Unova',5,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/535.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (536,'Palpitoad','Water','Ground','Blue','Unova',5,'false','false','false','false','false','false','false',0.5,'true','Tympole','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/536.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (537,'Seismitoad','Water','Ground','Blue','Unova',5,'false','false','false','false','false','false','false',0.5,'false','Palpitoad','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/537.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (538,'Throh','Fighting',NULL,'Red','Unova',5,'false','false','false','false','false','false','false',0,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/538.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (539,'Sawk','Fighting',NULL,'Blue','Unova',5,'false','false','false','false','false','false','false',0,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/539.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (540,'Sewaddle','Bug','Grass','Yellow','Unova',5,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/540.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (541,'Swadloon','Bug','Grass','Green','Unova',5,'false','false','false','false','false','false','false',0.5,'true','Sewaddle','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/541.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (542,'Leavanny','Bug','Grass','Yellow','Unova',5,'false','false','false','false','false','false','false',0.5,'false','Swadloon','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/542.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (543,'Venipede','Bug','Poison','Red','Unova',5,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/543.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (544,'Whirlipede','Bug','Poison','Gray','Unova',5,'false','false','false','false','false','false','false',0.5,'true','Venipede','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/544.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (545,'Scolipede','Bug','Poison','Red','Unova',5,'false','false','false','false','false','true','false',0.5,'false','Whirlipede','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/545.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (546,'Cottonee','Grass','Fairy','Green','Unova',5,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/546.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (547,'Whimsicott','Grass','Fairy','Green','Unova',5,'false','false','false','false','false','false','false',0.5,'false','Cottonee','true','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/547.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (548,'Petilil','Grass',NULL,'Green','Unova',5,'false','false','false','false','false','false','false',1,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/548.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (549,'Lilligant','Grass',NULL,'Green','Unova',5,'false','false','false','false','false','false','false',1,'false','Petilil','true','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/549.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (550,'Basculin-red-striped','Water',NULL,'Green','Unova',5,'false','false','false','false','false','false','false',0.5,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/550.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (551,'Sandile','Ground','Dark','Brown','Unova',5,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/551.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (552,'Krokorok','Ground','Dark','Brown','Unova',5,'false','false','false','false','false','false','false',0.5,'true','Sandile','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/552.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (553,'Krookodile','Ground','Dark','Red','Unova',5,'false','false','false','false','false','false','false',0.5,'false','Krokorok','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/553.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (554,'Darumaka','Fire',NULL,'Red','Unova',5,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/554.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (555,'Darmanitan-standard','Fire',NULL,'Red','Unova',5,'false','false','false','false','false','false','false',0.5,'false','Darumaka','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/555.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (556,'Maractus','Grass',NULL,'Green','Unova',5,'false','false','false','false','false','false','false',0.5,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/556.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (557,'Dwebble','Bug','Rock','Red','Unova',5,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/557.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (558,'Crustle','Bug','Rock','Red','Unova',5,'false','false','false','false','false','false','false',0.5,'false','Dwebble','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/558.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (559,'Scraggy','Dark','Fighting','Yellow','Unova',5,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/559.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (560,'Scrafty','Dark','Fighting','Red','Unova',5,'false','false','false','false','false','true','false',0.5,'false','Scraggy','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/560.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (561,'Sigilyph','Psychic','Flying','Black','Unova',5,'false','false','false','false','false','false','false',0.5,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/561.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (562,'Yamask','Ghost',NULL,'Black','Unova',5,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/562.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (563,'Cofagrigus','Ghost',NULL,'Yellow','Unova',5,'false','false','false','false','false','false','false',0.5,'false','Yamask','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/563.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (564,'Tirtouga','Water','Rock','Blue','Unova',5,'false','false','false','true','false','false','false',0.125,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/564.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (565,'Carracosta','Water','Rock','Blue','Unova',5,'false','false','false','true','false','false','false',0.125,'false','Tirtouga','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/565.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (566,'Archen','Rock','Flying','Yellow','Unova',5,'false','false','false','true','false','false','false',0.125,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/566.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (567,'Archeops','Rock','Flying','Yellow','Unova',5,'false','false','false','true','false','false','false',0.125,'false','Archen','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/567.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (568,'Trubbish','Poison',NULL,'Green','Unova',5,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/568.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (569,'Garbodor','Poison',NULL,'Green','Unova',5,'false','false','false','false','false','false','true',0.5,'false','Trubbish','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/569.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (570,'Zorua','Dark',NULL,'Gray','Unova',5,'false','false','false','false','false','false','false',0.125,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/570.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (571,'Zoroark','Dark',NULL,'Gray','Unova',5,'false','false','false','false','false','false','false',0.125,'false','Zorua','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/571.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (572,'Minccino','Normal',NULL,'Gray','Unova',5,'false','false','false','false','false','false','false',0.75,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/572.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (573,'Cinccino','Normal',NULL,'Gray','Unova',5,'false','false','false','false','false','false','false',0.75,'false','Minccino','true','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/573.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (574,'Gothita','Psychic',NULL,'Purple','Unova',5,'false','false','false','false','false','false','false',0.75,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/574.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (575,'Gothorita','Psychic',NULL,'Purple','Unova',5,'false','false','false','false','false','false','false',0.75,'true','Gothita','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/575.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (576,'Gothitelle','Psychic',NULL,'Purple','Unova',5,'false','false','false','false','false','false','false',0.75,'false','Gothorita','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/576.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (577,'Solosis','Psychic',NULL,'Green','Unova',5,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/577.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (578,'Duosion','Psychic',NULL,'Green','Unova',5,'false','false','false','false','false','false','false',0.5,'true','Solosis','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/578.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (579,'Reuniclus','Psychic',NULL,'Green','Unova',5,'false','false','false','false','false','false','false',0.5,'false','Duosion','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/579.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (580,'Ducklett','Water','Flying','Blue','Unova',5,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/580.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (581,'Swanna','Water','Flying','White','Unova',5,'false','false','false','false','false','false','false',0.5,'false','Ducklett','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/581.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (582,'Vanillite','Ice',NULL,'White','Unova',5,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/582.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (583,'Vanillish','Ice',NULL,'White','Unova',5,'false','false','false','false','false','false','false',0.5,'true','Vanillite','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/583.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (584,'Vanilluxe','Ice',NULL,'White','Unova',5,'false','false','false','false','false','false','false',0.5,'false','Vanillish','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/584.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (585,'Deerling','Normal','Grass','Pink','Unova',5,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/585.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (586,'Sawsbuck','Normal','Grass','Brown','Unova',5,'false','false','false','false','false','false','false',0.5,'false','Deerling','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/586.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (587,'Emolga','Electric','Flying','White','Unova',5,'false','false','false','false','false','false','false',0.5,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/587.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (588,'Karrablast','Bug',NULL,'Blue','Unova',5,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/588.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (589,'Escavalier','Bug','Steel','Gray','Unova',5,'false','false','false','false','false','false','false',0.5,'false','Karrablast','false','true','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/589.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (590,'Foongus','Grass','Poison','White','Unova',5,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/590.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (591,'Amoonguss','Grass','Poison','White','Unova',5,'false','false','false','false','false','false','false',0.5,'false','Foongus','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/591.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (592,'Frillish','Water','Ghost','White','Unova',5,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/592.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (593,'Jellicent','Water','Ghost','White','Unova',5,'false','false','false','false','false','false','false',0.5,'false','Frillish','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/593.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (594,'Alomomola','Water',NULL,'Pink','Unova',5,'false','false','false','false','false','false','false',0.5,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/594.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (595,'Joltik','Bug','Electric','Yellow','Unova',5,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/595.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (596,'Galvantula','Bug','Electric','Yellow','Unova',5,'false','false','false','false','false','false','false',0.5,'false','Joltik','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/596.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (597,'Ferroseed','Grass','Steel','Gray','Unova',5,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/597.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (598,'Ferrothorn','Grass','Steel','Gray','Unova',5,'false','false','false','false','false','false','false',0.5,'false','Ferroseed','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/598.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (599,'Klink','Steel',NULL,'Gray','Unova',5,'false','false','false','false','false','false','false',-1,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/599.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (600,'Klang','Steel',NULL,'Gray','Unova',5,'false','false','false','false','false','false','false',-1,'true','Klink','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/600.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (601,'Klinklang','Steel',NULL,'Gray','Unova',5,'false','false','false','false','false','false','false',-1,'false','Klang','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/601.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (602,'Tynamo','Electric',NULL,'White','Unova',5,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/602.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (603,'Eelektrik','Electric',NULL,'Blue','Unova',5,'false','false','false','false','false','false','false',0.5,'true','Tynamo','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/603.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (604,'Eelektross','Electric',NULL,'Blue','Unova',5,'false','false','false','false','false','true','false',0.5,'false','Eelektrik','true','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/604.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (605,'Elgyem','Psychic',NULL,'Blue','Unova',5,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/605.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (606,'Beheeyem','Psychic',NULL,'Brown','Unova',5,'false','false','false','false','false','false','false',0.5,'false','Elgyem','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/606.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (607,'Litwick','Ghost','Fire','White','Unova',5,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/607.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (608,'Lampent','Ghost','Fire','Black','Unova',5,'false','false','false','false','false','false','false',0.5,'true','Litwick','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/608.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (609,'Chandelure','Ghost','Fire','Black','Unova',5,'false','false','false','false','false','true','false',0.5,'false','Lampent','true','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/609.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (610,'Axew','Dragon',NULL,'Green','Unova',5,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/610.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (611,'Fraxure','Dragon',NULL,'Green','Unova',5,'false','false','false','false','false','false','false',0.5,'true','Axew','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/611.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (612,'Haxorus','Dragon',NULL,'Yellow','Unova',5,'false','false','false','false','false','false','false',0.5,'false','Fraxure','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/612.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (613,'Cubchoo','Ice',NULL,'White','Unova',5,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/613.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (614,'Beartic','Ice',NULL,'White','Unova',5,'false','false','false','false','false','false','false',0.5,'false','Cubchoo','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/614.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (615,'Cryogonal','Ice',NULL,'Blue','Unova',5,'false','false','false','false','false','false','false',-1,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/615.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (616,'Shelmet','Bug',NULL,'Red','Unova',5,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/616.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (617,'Accelgor','Bug',NULL,'Red','Unova',5,'false','false','false','false','false','false','false',0.5,'false','Shelmet','false','true','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/617.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (618,'Stunfisk','Ground','Electric','Brown','Unova',5,'false','false','false','false','false','false','false',0.5,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/618.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (619,'Mienfoo','Fighting',NULL,'Yellow','Unova',5,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/619.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (620,'Mienshao','Fighting',NULL,'Purple','Unova',5,'false','false','false','false','false','false','false',0.5,'false','Mienfoo','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/620.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (621,'Druddigon','Dragon',NULL,'Red','Unova',5,'false','false','false','false','false','false','false',0.5,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/621.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (622,'Golett','Ground','Ghost','Green','Unova',5,'false','false','false','false','false','false','false',-1,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/622.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (623,'Golurk','Ground','Ghost','Green','Unova',5,'false','false','false','false','false','false','false',-1,'false','Golett','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/623.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (624,'Pawniard','Dark','Steel','Red','Unova',5,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/624.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (625,'Bisharp','Dark','Steel','Red','Unova',5,'false','false','false','false','false','false','false',0.5,'true','Pawniard','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/625.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (626,'Bouffalant','Normal',NULL,'Brown','Unova',5,'false','false','false','false','false','false','false',0.5,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/626.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (627,'Rufflet','Normal','Flying','White','Unova',5,'false','false','false','false','false','false','false',0,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/627.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (628,'Braviary','Normal','Flying','Red','Unova',5,'false','false','false','false','false','false','false',0,'false','Rufflet','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/628.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (629,'Vullaby','Dark','Flying','Brown','Unova',5,'false','false','false','false','false','false','false',1,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/629.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (630,'Mandibuzz','Dark','Flying','Brown','Unova',5,'false','false','false','false','false','false','false',1,'false','Vullaby','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/630.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (631,'Heatmor','Fire',NULL,'Red','Unova',5,'false','false','false','false','false','false','false',0.5,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/631.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (632,'Durant','Bug','Steel','Gray','Unova',5,'false','false','false','false','false','false','false',0.5,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/632.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (633,'Deino','Dark','Dragon','Blue','Unova',5,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/633.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (634,'Zweilous','Dark','Dragon','Blue','Unova',5,'false','false','false','false','false','false','false',0.5,'true','Deino','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/634.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (635,'Hydreigon','Dark','Dragon','Blue','Unova',5,'false','false','false','false','false','false','false',0.5,'false','Zweilous','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/635.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (636,'Larvesta','Bug','Fire','White','Unova',5,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/636.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (637,'Volcarona','Bug','Fire','White','Unova',5,'false','false','false','false','false','false','false',0.5,'false','Larvesta','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/637.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (638,'Cobalion','Steel','Fighting','Blue','Unova',5,'true','false','false','false','false','false','false',-1,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/638.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (639,'Terrakion','Rock','Fighting','Gray','Unova',5,'true','false','false','false','false','false','false',-1,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/639.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (640,'Virizion','Grass','Fighting','Green','Unova',5,'true','false','false','false','false','false','false',-1,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/640.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (641,'Tornadus-incarnate','Flying',NULL,'Green','Unova',5,'true','false','false','false','false','false','false',0,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/641.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (642,'Thundurus-incarnate','Electric','Flying','Blue','Unova',5,'true','false','false','false','false','false','false',0,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/642.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (643,'Reshiram','Dragon','Fire','White','Unova',5,'true','false','false','false','false','false','false',-1,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/643.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (644,'Zekrom','Dragon','Electric','Black','Unova',5,'true','false','false','false','false','false','false',-1,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/644.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (645,'Landorus-incarnate','Ground','Flying','Brown','Unova',5,'true','false','false','false','false','false','false',0,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/645.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (646,'Kyurem','Dragon','Ice','Gray','Unova',5,'true','false','false','false','false','false','false',-1,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/646.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (647,'Keldeo-ordinary','Water','Fighting','Yellow','Unova',5,'false','true','false','false','false','false','false',-1,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/647.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (648,'Meloetta-aria','Normal','Psychic','White','Unova',5,'false','true','false','false','false','false','false',-1,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/648.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (649,'Genesect','Bug','Steel','Purple','Unova',5,'false','true','false','false','false','false','false',-1,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/649.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (650,'Chespin','Grass',NULL,'Green','Kalos',6,'false','false','false','false','true','false','false',0.125,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/650.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (651,'Quilladin','Grass',NULL,'Green','Kalos',6,'false','false','false','false','true','false','false',0.125,'true','Chespin','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/651.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (652,'Chesnaught','Grass','Fighting','Green','Kalos',6,'false','false','false','false','true','true','false',0.125,'false','Quilladin','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/652.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (653,'Fennekin','Fire',NULL,'Red','Kalos',6,'false','false','false','false','true','false','false',0.125,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/653.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (654,'Braixen','Fire',NULL,'Red','Kalos',6,'false','false','false','false','true','false','false',0.125,'true','Fennekin','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/654.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (655,'Delphox','Fire','Psychic','Red','Kalos',6,'false','false','false','false','true','true','false',0.125,'false','Braixen','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/655.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (656,'Froakie','Water',NULL,'Blue','Kalos',6,'false','false','false','false','true','false','false',0.125,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/656.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (657,'Frogadier','Water',NULL,'Blue','Kalos',6,'false','false','false','false','true','false','false',0.125,'true','Froakie','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/657.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (658,'Greninja','Water','Dark','Blue','Kalos',6,'false','false','false','false','true','true','false',0.125,'false','Frogadier','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/658.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (659,'Bunnelby','Normal',NULL,'Brown','Kalos',6,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/659.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (660,'Diggersby','Normal','Ground','Brown','Kalos',6,'false','false','false','false','false','false','false',0.5,'false','Bunnelby','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/660.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (661,'Fletchling','Normal','Flying','Red','Kalos',6,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/661.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (662,'Fletchinder','Fire','Flying','Red','Kalos',6,'false','false','false','false','false','false','false',0.5,'true','Fletchling','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/662.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (663,'Talonflame','Fire','Flying','Red','Kalos',6,'false','false','false','false','false','false','false',0.5,'false','Fletchinder','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/663.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (664,'Scatterbug','Bug',NULL,'Black','Kalos',6,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/664.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (665,'Spewpa','Bug',NULL,'Black','Kalos',6,'false','false','false','false','false','false','false',0.5,'true','Scatterbug','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/665.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (666,'Vivillon','Bug','Flying','White','Kalos',6,'false','false','false','false','false','false','false',0.5,'false','Spewpa','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/666.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (667,'Litleo','Fire','Normal','Brown','Kalos',6,'false','false','false','false','false','false','false',0.875,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/667.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (668,'Pyroar','Fire','Normal','Brown','Kalos',6,'false','false','false','false','false','true','false',0.875,'false','Litleo','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/668.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (669,'Flabebe','Fairy',NULL,'White','Kalos',6,'false','false','false','false','false','false','false',1,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/669.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (670,'Floette','Fairy',NULL,'White','Kalos',6,'false','false','false','false','false','true','false',1,'true','Flabebe','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/670.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (671,'Florges','Fairy',NULL,'White','Kalos',6,'false','false','false','false','false','false','false',1,'false','Floette','true','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/671.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (672,'Skiddo','Grass',NULL,'Brown','Kalos',6,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/672.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (673,'Gogoat','Grass',NULL,'Brown','Kalos',6,'false','false','false','false','false','false','false',0.5,'false','Skiddo','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/673.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (674,'Pancham','Fighting',NULL,'White','Kalos',6,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/674.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (675,'Pangoro','Fighting','Dark','White','Kalos',6,'false','false','false','false','false','false','false',0.5,'false','Pancham','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/675.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (676,'Furfrou','Normal',NULL,'White','Kalos',6,'false','false','false','false','false','false','false',0.5,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/676.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (677,'Espurr','Psychic',NULL,'Gray','Kalos',6,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/677.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (678,'Meowstic-male','Psychic',NULL,'Blue','Kalos',6,'false','false','false','false','false','false','false',0.5,'false','Espurr','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/678.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (679,'Honedge','Steel','Ghost','Brown','Kalos',6,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/679.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (680,'Doublade','Steel','Ghost','Brown','Kalos',6,'false','false','false','false','false','false','false',0.5,'true','Honedge','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/680.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (681,'Aegislash-shield','Steel','Ghost','Brown','Kalos',6,'false','false','false','false','false','false','false',0.5,'false','Doublade','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/681.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (682,'Spritzee','Fairy',NULL,'Pink','Kalos',6,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/682.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (683,'Aromatisse','Fairy',NULL,'Pink','Kalos',6,'false','false','false','false','false','false','false',0.5,'false','Spritzee','false','true','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/683.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (684,'Swirlix','Fairy',NULL,'White','Kalos',6,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/684.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (685,'Slurpuff','Fairy',NULL,'White','Kalos',6,'false','false','false','false','false','false','false',0.5,'false','Swirlix','false','true','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/685.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (686,'Inkay','Dark','Psychic','Blue','Kalos',6,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/686.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (687,'Malamar','Dark','Psychic','Blue','Kalos',6,'false','false','false','false','false','true','false',0.5,'false','Inkay','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/687.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (688,'Binacle','Rock','Water','Brown','Kalos',6,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/688.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (689,'Barbaracle','Rock','Water','Brown','Kalos',6,'false','false','false','false','false','true','false',0.5,'false','Binacle','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/689.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (690,'Skrelp','Poison','Water','Brown','Kalos',6,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/690.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (691,'Dragalge','Poison','Dragon','Brown','Kalos',6,'false','false','false','false','false','true','false',0.5,'false','Skrelp','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/691.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (692,'Clauncher','Water',NULL,'Blue','Kalos',6,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/692.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (693,'Clawitzer','Water',NULL,'Blue','Kalos',6,'false','false','false','false','false','false','false',0.5,'false','Clauncher','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/693.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (694,'Helioptile','Electric','Normal','Yellow','Kalos',6,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/694.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (695,'Heliolisk','Electric','Normal','Yellow','Kalos',6,'false','false','false','false','false','false','false',0.5,'false','Helioptile','true','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/695.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (696,'Tyrunt','Rock','Dragon','Brown','Kalos',6,'false','false','false','true','false','false','false',0.125,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/696.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (697,'Tyrantrum','Rock','Dragon','Red','Kalos',6,'false','false','false','true','false','false','false',0.125,'false','Tyrunt','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/697.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (698,'Amaura','Rock','Ice','Blue','Kalos',6,'false','false','false','true','false','false','false',0.125,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/698.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (699,'Aurorus','Rock','Ice','Blue','Kalos',6,'false','false','false','true','false','false','false',0.125,'false','Amaura','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/699.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (700,'Sylveon','Fairy',NULL,'Pink','Kalos',6,'false','false','false','false','false','false','false',0.125,'false','Eevee','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/700.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (701,'Hawlucha','Fighting','Flying','Green','Kalos',6,'false','false','false','false','false','true','false',0.5,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/701.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (702,'Dedenne','Electric','Fairy','Yellow','Kalos',6,'false','false','false','false','false','false','false',0.5,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/702.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (703,'Carbink','Rock','Fairy','Gray','Kalos',6,'false','false','false','false','false','false','false',-1,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/703.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (704,'Goomy','Dragon',NULL,'Purple','Kalos',6,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/704.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (705,'Sliggoo','Dragon',NULL,'Purple','Kalos',6,'false','false','false','false','false','false','false',0.5,'true','Goomy','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/705.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (706,'Goodra','Dragon',NULL,'Purple','Kalos',6,'false','false','false','false','false','false','false',0.5,'false','Sliggoo','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/706.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (707,'Klefki','Steel','Fairy','Gray','Kalos',6,'false','false','false','false','false','false','false',0.5,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/707.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (708,'Phantump','Ghost','Grass','Brown','Kalos',6,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/708.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (709,'Trevenant','Ghost','Grass','Brown','Kalos',6,'false','false','false','false','false','false','false',0.5,'false','Phantump','false','true','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/709.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (710,'Pumpkaboo-average','Ghost','Grass','Brown','Kalos',6,'false','false','false','false','false','false','false',0.5,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/710.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (711,'Gourgeist-average','Ghost','Grass','Brown','Kalos',6,'false','false','false','false','false','false','false',0.5,'false','Pumpkaboo','false','true','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/711.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (712,'Bergmite','Ice',NULL,'Blue','Kalos',6,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/712.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (713,'Avalugg','Ice',NULL,'Blue','Kalos',6,'false','false','false','false','false','false','false',0.5,'false','Bergmite','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/713.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (714,'Noibat','Flying','Dragon','Purple','Kalos',6,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/714.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (715,'Noivern','Flying','Dragon','Purple','Kalos',6,'false','false','false','false','false','false','false',0.5,'false','Noibat','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/715.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (716,'Xerneas','Fairy',NULL,'Blue','Kalos',6,'true','false','false','false','false','false','false',-1,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/716.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (717,'Yveltal','Dark','Flying','Red','Kalos',6,'true','false','false','false','false','false','false',-1,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/717.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (718,'Zygarde-50','Dragon','Ground','Green','Kalos',6,'true','false','false','false','false','true','false',-1,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/718.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (719,'Diancie','Rock','Fairy','Pink','Kalos',6,'false','true','false','false','false','true','false',-1,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/719.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (720,'Hoopa','Psychic','Ghost','Purple','Kalos',6,'false','true','false','false','false','false','false',-1,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/720.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (721,'Volcanion','Fire','Water','Brown','Kalos',6,'false','true','false','false','false','false','false',-1,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/721.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (722,'Rowlet','Grass','Flying','Brown','Alola',7,'false','false','false','false','true','false','false',0.125,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/722.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (723,'Dartrix','Grass','Flying','Brown','Alola',7,'false','false','false','false','true','false','false',0.125,'true','Rowlet','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/723.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (724,'Decidueye','Grass','Ghost','Brown','Alola',7,'false','false','false','false','true','false','false',0.125,'false','Dartrix','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/724.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (725,'Litten','Fire',NULL,'Red','Alola',7,'false','false','false','false','true','false','false',0.125,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/725.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (726,'Torracat','Fire',NULL,'Red','Alola',7,'false','false','false','false','true','false','false',0.125,'true','Litten','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/726.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (727,'Incineroar','Fire','Dark','Red','Alola',7,'false','false','false','false','true','false','false',0.125,'false','Torracat','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/727.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (728,'Popplio','Water',NULL,'Blue','Alola',7,'false','false','false','false','true','false','false',0.125,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/728.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (729,'Brionne','Water',NULL,'Blue','Alola',7,'false','false','false','false','true','false','false',0.125,'true','Popplio','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/729.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (730,'Primarina','Water','Fairy','Blue','Alola',7,'false','false','false','false','true','false','false',0.125,'false','Brionne','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/730.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (731,'Pikipek','Normal','Flying','Black','Alola',7,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/731.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (732,'Trumbeak','Normal','Flying','Black','Alola',7,'false','false','false','false','false','false','false',0.5,'true','Pikipek','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/732.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (733,'Toucannon','Normal','Flying','Black','Alola',7,'false','false','false','false','false','false','false',0.5,'false','Trumbeak','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/733.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (734,'Yungoos','Normal',NULL,'Brown','Alola',7,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/734.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (735,'Gumshoos','Normal',NULL,'Brown','Alola',7,'false','false','false','false','false','false','false',0.5,'false','Yungoos','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/735.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (736,'Grubbin','Bug',NULL,'Gray','Alola',7,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/736.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (737,'Charjabug','Bug','Electric','Green','Alola',7,'false','false','false','false','false','false','false',0.5,'true','Grubbin','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/737.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (738,'Vikavolt','Bug','Electric','Blue','Alola',7,'false','false','false','false','false','false','false',0.5,'false','Charjabug','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/738.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (739,'Crabrawler','Fighting',NULL,'Purple','Alola',7,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/739.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (740,'Crabominable','Fighting','Ice','White','Alola',7,'false','false','false','false','false','false','false',0.5,'false','Crabrawler','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/740.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (741,'Oricorio-baile','Fire','Flying','Red','Alola',7,'false','false','false','false','false','false','false',0.75,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/741.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (742,'Cutiefly','Bug','Fairy','Yellow','Alola',7,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/742.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (743,'Ribombee','Bug','Fairy','Yellow','Alola',7,'false','false','false','false','false','false','false',0.5,'false','Cutiefly','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/743.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (744,'Rockruff','Rock',NULL,'Brown','Alola',7,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/744.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (745,'Lycanroc-midday','Rock',NULL,'Brown','Alola',7,'false','false','false','false','false','false','false',0.5,'false','Rockruff','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/745.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (746,'Wishiwashi-solo','Water',NULL,'Blue','Alola',7,'false','false','false','false','false','false','false',0.5,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/746.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (747,'Mareanie','Poison','Water','Blue','Alola',7,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/747.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (748,'Toxapex','Poison','Water','Blue','Alola',7,'false','false','false','false','false','false','false',0.5,'false','Mareanie','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/748.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (749,'Mudbray','Ground',NULL,'Brown','Alola',7,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/749.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (750,'Mudsdale','Ground',NULL,'Brown','Alola',7,'false','false','false','false','false','false','false',0.5,'false','Mudbray','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/750.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (751,'Dewpider','Water','Bug','Green','Alola',7,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/751.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (752,'Araquanid','Water','Bug','Green','Alola',7,'false','false','false','false','false','false','false',0.5,'false','Dewpider','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/752.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (753,'Fomantis','Grass',NULL,'Pink','Alola',7,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/753.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (754,'Lurantis','Grass',NULL,'Pink','Alola',7,'false','false','false','false','false','false','false',0.5,'false','Fomantis','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/754.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (755,'Morelull','Grass','Fairy','Purple','Alola',7,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/755.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (756,'Shiinotic','Grass','Fairy','Purple','Alola',7,'false','false','false','false','false','false','false',0.5,'false','Morelull','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/756.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (757,'Salandit','Poison','Fire','Black','Alola',7,'false','false','false','false','false','false','false',0.125,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/757.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (758,'Salazzle','Poison','Fire','Black','Alola',7,'false','false','false','false','false','false','false',1,'false','Salandit','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/758.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (759,'Stufful','Normal','Fighting','Pink','Alola',7,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/759.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (760,'Bewear','Normal','Fighting','Pink','Alola',7,'false','false','false','false','false','false','false',0.5,'false','Stufful','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/760.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (761,'Bounsweet','Grass',NULL,'Purple','Alola',7,'false','false','false','false','false','false','false',1,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/761.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (762,'Steenee','Grass',NULL,'Purple','Alola',7,'false','false','false','false','false','false','false',1,'true','Bounsweet','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/762.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (763,'Tsareena','Grass',NULL,'Purple','Alola',7,'false','false','false','false','false','false','false',1,'false','Steenee','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/763.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (764,'Comfey','Fairy',NULL,'Green','Alola',7,'false','false','false','false','false','false','false',0.75,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/764.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (765,'Oranguru','Normal','Psychic','White','Alola',7,'false','false','false','false','false','false','false',0.5,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/765.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (766,'Passimian','Fighting',NULL,'White','Alola',7,'false','false','false','false','false','false','false',0.5,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/766.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (767,'Wimpod','Bug','Water','Gray','Alola',7,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/767.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (768,'Golisopod','Bug','Water','Gray','Alola',7,'false','false','false','false','false','false','false',0.5,'false','Wimpod','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/768.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (769,'Sandygast','Ghost','Ground','Brown','Alola',7,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/769.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (770,'Palossand','Ghost','Ground','Brown','Alola',7,'false','false','false','false','false','false','false',0.5,'false','Sandygast','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/770.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (771,'Pyukumuku','Water',NULL,'Black','Alola',7,'false','false','false','false','false','false','false',0.5,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/771.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (772,'Type-null','Normal',NULL,'Gray','Alola',7,'true','false','false','false','false','false','false',-1,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/772.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (773,'Silvally','Normal',NULL,'Gray','Alola',7,'true','false','false','false','false','false','false',-1,'false','Type-null','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/773.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (774,'Minior-red-meteor','Rock','Flying','Brown','Alola',7,'false','false','false','false','false','false','false',-1,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/774.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (775,'Komala','Normal',NULL,'Blue','Alola',7,'false','false','false','false','false','false','false',0.5,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/775.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (776,'Turtonator','Fire','Dragon','Red','Alola',7,'false','false','false','false','false','false','false',0.5,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/776.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (777,'Togedemaru','Electric','Steel','Gray','Alola',7,'false','false','false','false','false','false','false',0.5,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/777.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (778,'Mimikyu-disguised','Ghost','Fairy','Yellow','Alola',7,'false','false','false','false','false','false','false',0.5,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/778.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (779,'Bruxish','Water','Psychic','Pink','Alola',7,'false','false','false','false','false','false','false',0.5,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/779.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (780,'Drampa','Normal','Dragon','White','Alola',7,'false','false','false','false','false','true','false',0.5,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/780.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (781,'Dhelmise','Ghost','Grass','Green','Alola',7,'false','false','false','false','false','false','false',-1,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/781.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (782,'Jangmo-o','Dragon',NULL,'Gray','Alola',7,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/782.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (783,'Hakamo-o','Dragon','Fighting','Gray','Alola',7,'false','false','false','false','false','false','false',0.5,'true','Jangmo-o','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/783.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (784,'Kommo-o','Dragon','Fighting','Gray','Alola',7,'false','false','false','false','false','false','false',0.5,'false','Hakamo-o','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/784.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (785,'Tapu-koko','Electric','Fairy','Yellow','Alola',7,'true','false','false','false','false','false','false',-1,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/785.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (786,'Tapu-lele','Psychic','Fairy','Pink','Alola',7,'true','false','false','false','false','false','false',-1,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/786.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (787,'Tapu-bulu','Grass','Fairy','Red','Alola',7,'true','false','false','false','false','false','false',-1,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/787.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (788,'Tapu-fini','Water','Fairy','Purple','Alola',7,'true','false','false','false','false','false','false',-1,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/788.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (789,'Cosmog','Psychic',NULL,'Blue','Alola',7,'true','false','false','false','false','false','false',-1,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/789.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (790,'Cosmoem','Psychic',NULL,'Blue','Alola',7,'true','false','false','false','false','false','false',-1,'true','Cosmog','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/790.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (791,'Solgaleo','Psychic','Steel','White','Alola',7,'true','false','false','false','false','false','false',-1,'false','Cosmoem','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/791.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (792,'Lunala','Psychic','Ghost','Purple','Alola',7,'true','false','false','false','false','false','false',-1,'false','Cosmoem','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/792.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (793,'Nihilego','Rock','Poison','White','Alola',7,'false','false','false','false','false','false','false',-1,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/793.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (794,'Buzzwole','Bug','Fighting','Red','Alola',7,'false','false','false','false','false','false','false',-1,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/794.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (795,'Pheromosa','Bug','Fighting','White','Alola',7,'false','false','false','false','false','false','false',-1,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/795.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (796,'Xurkitree','Electric',NULL,'Black','Alola',7,'false','false','false','false','false','false','false',-1,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/796.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (797,'Celesteela','Steel','Flying','Green','Alola',7,'false','false','false','false','false','false','false',-1,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/797.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (798,'Kartana','Grass','Steel','White','Alola',7,'false','false','false','false','false','false','false',-1,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/798.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (799,'Guzzlord','Dark','Dragon','Black','Alola',7,'false','false','false','false','false','false','false',-1,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/799.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (800,'Necrozma','Psychic',NULL,'Black','Alola',7,'true','false','false','false','false','false','false',-1,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/800.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (801,'Magearna','Steel','Fairy','Gray','Alola',7,'false','true','false','false','false','false','false',-1,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/801.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (802,'Marshadow','Fighting','Ghost','Gray','Alola',7,'false','true','false','false','false','false','false',-1,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/802.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (803,'Poipole','Poison',NULL,'Purple','Alola',7,'false','false','false','false','false','false','false',-1,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/803.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (804,'Naganadel','Poison','Dragon','Purple','Alola',7,'false','false','false','false','false','false','false',-1,'false','Poipole','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/804.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (805,'Stakataka','Rock','Steel','Gray','Alola',7,'false','false','false','false','false','false','false',-1,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/805.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (806,'Blacephalon','Fire','Ghost','White','Alola',7,'false','false','false','false','false','false','false',-1,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/806.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (807,'Zeraora','Electric',NULL,'Yellow','Alola',7,'false','true','false','false','false','false','false',-1,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/807.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (808,'Meltan','Steel',NULL,'Gray','Alola',7,'false','true','false','false','false','false','false',-1,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/808.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (809,'Melmetal','Steel',NULL,'Gray','Alola',7,'false','true','false','false','false','false','true',-1,'false','Meltan','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/809.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (810,'Grookey','Grass',NULL,'Green','Galar',8,'false','false','false','false','true','false','false',0.125,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/810.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (811,'Thwackey','Grass',NULL,'Green','Galar',8,'false','false','false','false','true','false','false',0.125,'true','Grookey','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/811.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (812,'Rillaboom','Grass',NULL,'Green','Galar',8,'false','false','false','false','true','false','true',0.125,'false','Thwackey','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/812.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (813,'Scorbunny','Fire',NULL,'White','Galar',8,'false','false','false','false','true','false','false',0.125,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/813.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (814,'Raboot','Fire',NULL,'Gray','Galar',8,'false','false','false','false','true','false','false',0.125,'true','Scorbunny','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/814.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (815,'Cinderace','Fire',NULL,'White','Galar',8,'false','false','false','false','true','false','true',0.125,'false','Raboot','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/815.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (816,'Sobble','Water',NULL,'Blue','Galar',8,'false','false','false','false','true','false','false',0.125,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/816.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (817,'Drizzile','Water',NULL,'Blue','Galar',8,'false','false','false','false','true','false','false',0.125,'true','Sobble','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/817.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (818,'Inteleon','Water',NULL,'Blue','Galar',8,'false','false','false','false','true','false','true',0.125,'false','Drizzile','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/818.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (819,'Skwovet','Normal',NULL,'Brown','Galar',8,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/819.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (820,'Greedent','Normal',NULL,'Brown','Galar',8,'false','false','false','false','false','false','false',0.5,'false','Skwovet','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/820.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (821,'Rookidee','Flying',NULL,'Blue','Galar',8,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/821.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (822,'Corvisquire','Flying',NULL,'Blue','Galar',8,'false','false','false','false','false','false','false',0.5,'true','Rookidee','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/822.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (823,'Corviknight','Flying','Steel','Purple','Galar',8,'false','false','false','false','false','false','false',0.5,'false','Corvisquire','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/823.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (824,'Blipbug','Bug',NULL,'Blue','Galar',8,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/824.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (825,'Dottler','Bug','Psychic','Yellow','Galar',8,'false','false','false','false','false','false','false',0.5,'true','Blipbug','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/825.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (826,'Orbeetle','Bug','Psychic','Red','Galar',8,'false','false','false','false','false','false','true',0.5,'false','Dottler','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/826.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (827,'Nickit','Dark',NULL,'Brown','Galar',8,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/827.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (828,'Thievul','Dark',NULL,'Brown','Galar',8,'false','false','false','false','false','false','false',0.5,'false','Nickit','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/828.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (829,'Gossifleur','Grass',NULL,'Green','Galar',8,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/829.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (830,'Eldegoss','Grass',NULL,'Green','Galar',8,'false','false','false','false','false','false','false',0.5,'false','Gossifleur','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/830.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (831,'Wooloo','Normal',NULL,'White','Galar',8,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/831.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (832,'Dubwool','Normal',NULL,'White','Galar',8,'false','false','false','false','false','false','false',0.5,'false','Wooloo','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/832.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (833,'Chewtle','Water',NULL,'Green','Galar',8,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/833.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (834,'Drednaw','Water','Rock','Green','Galar',8,'false','false','false','false','false','false','true',0.5,'false','Chewtle','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/834.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (835,'Yamper','Electric',NULL,'Yellow','Galar',8,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/835.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (836,'Boltund','Electric',NULL,'Yellow','Galar',8,'false','false','false','false','false','false','false',0.5,'false','Yamper','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/836.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (837,'Rolycoly','Rock',NULL,'Black','Galar',8,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/837.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (838,'Carkol','Rock','Fire','Black','Galar',8,'false','false','false','false','false','false','false',0.5,'true','Rolycoly','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/838.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (839,'Coalossal','Rock','Fire','Black','Galar',8,'false','false','false','false','false','false','true',0.5,'false','Carkol','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/839.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (840,'Applin','Grass','Dragon','Green','Galar',8,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/840.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (841,'Flapple','Grass','Dragon','Green','Galar',8,'false','false','false','false','false','false','true',0.5,'false','Applin','true','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/841.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (842,'Appletun','Grass','Dragon','Green','Galar',8,'false','false','false','false','false','false','true',0.5,'false','Applin','true','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/842.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (843,'Silicobra','Ground',NULL,'Green','Galar',8,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/843.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (844,'Sandaconda','Ground',NULL,'Green','Galar',8,'false','false','false','false','false','false','true',0.5,'false','Silicobra','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/844.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (845,'Cramorant','Flying','Water','Blue','Galar',8,'false','false','false','false','false','false','false',0.5,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/845.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (846,'Arrokuda','Water',NULL,'Brown','Galar',8,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/846.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (847,'Barraskewda','Water',NULL,'Brown','Galar',8,'false','false','false','false','false','false','false',0.5,'false','Arrokuda','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/847.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (848,'Toxel','Electric','Poison','Purple','Galar',8,'false','false','true','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/848.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (849,'Toxtricity-amped','Electric','Poison','Purple','Galar',8,'false','false','false','false','false','false','true',0.5,'false','Toxel','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/849.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (850,'Sizzlipede','Fire','Bug','Red','Galar',8,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/850.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (851,'Centiskorch','Fire','Bug','Red','Galar',8,'false','false','false','false','false','false','true',0.5,'false','Sizzlipede','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/851.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (852,'Clobbopus','Fighting',NULL,'Brown','Galar',8,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/852.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (853,'Grapploct','Fighting',NULL,'Blue','Galar',8,'false','false','false','false','false','false','false',0.5,'false','Clobbopus','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/853.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (854,'Sinistea','Ghost',NULL,'Purple','Galar',8,'false','false','false','false','false','false','false',-1,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/854.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (855,'Polteageist','Ghost',NULL,'Purple','Galar',8,'false','false','false','false','false','false','false',-1,'false','Sinistea','true','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/855.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (856,'Hatenna','Psychic',NULL,'Pink','Galar',8,'false','false','false','false','false','false','false',1,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/856.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (857,'Hattrem','Psychic',NULL,'Pink','Galar',8,'false','false','false','false','false','false','false',1,'true','Hatenna','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/857.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (858,'Hatterene','Psychic','Fairy','Pink','Galar',8,'false','false','false','false','false','false','true',1,'false','Hattrem','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/858.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (859,'Impidimp','Dark','Fairy','Pink','Galar',8,'false','false','false','false','false','false','false',0,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/859.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (860,'Morgrem','Dark','Fairy','Pink','Galar',8,'false','false','false','false','false','false','false',0,'true','Impidimp','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/860.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (861,'Grimmsnarl','Dark','Fairy','Purple','Galar',8,'false','false','false','false','false','false','true',0,'false','Morgrem','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/861.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (862,'Obstagoon','Dark','Normal','Gray','Galar',8,'false','false','false','false','false','false','false',0.5,'false','Linoone','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/862.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (863,'Perrserker','Steel',NULL,'Brown','Galar',8,'false','false','false','false','false','false','false',0.5,'false','Meowth','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/863.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (864,'Cursola','Ghost',NULL,'White','Galar',8,'false','false','false','false','false','false','false',0.75,'false','Corsola','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/864.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (865,'Sirfetchd','Fighting',NULL,'White','Galar',8,'false','false','false','false','false','false','false',0.5,'false','Farfetchd','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/865.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (866,'Mr-rime','Ice','Psychic','Purple','Galar',8,'false','false','false','false','false','false','false',0.5,'false','Mr-mime','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/866.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (867,'Runerigus','Ground','Ghost','Gray','Galar',8,'false','false','false','false','false','false','false',0.5,'false','Yamask','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/867.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (868,'Milcery','Fairy',NULL,'White','Galar',8,'false','false','false','false','false','false','false',1,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/868.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (869,'Alcremie','Fairy',NULL,'White','Galar',8,'false','false','false','false','false','false','true',1,'false','Milcery','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/869.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (870,'Falinks','Fighting',NULL,'Yellow','Galar',8,'false','false','false','false','false','true','false',-1,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/870.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (871,'Pincurchin','Electric',NULL,'Purple','Galar',8,'false','false','false','false','false','false','false',0.5,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/871.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (872,'Snom','Ice','Bug','White','Galar',8,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/872.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (873,'Frosmoth','Ice','Bug','White','Galar',8,'false','false','false','false','false','false','false',0.5,'false','Snom','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/873.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (874,'Stonjourner','Rock',NULL,'Gray','Galar',8,'false','false','false','false','false','false','false',0.5,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/874.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (875,'Eiscue-ice','Ice',NULL,'Blue','Galar',8,'false','false','false','false','false','false','false',0.5,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/875.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (876,'Indeedee-male','Psychic','Normal','Purple','Galar',8,'false','false','false','false','false','false','false',0.5,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/876.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (877,'Morpeko-full-belly','Electric','Dark','Yellow','Galar',8,'false','false','false','false','false','false','false',0.5,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/877.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (878,'Cufant','Steel',NULL,'Yellow','Galar',8,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/878.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (879,'Copperajah','Steel',NULL,'Green','Galar',8,'false','false','false','false','false','false','true',0.5,'false','Cufant','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/879.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (880,'Dracozolt','Electric','Dragon','Green','Galar',8,'false','false','false','true','false','false','false',-1,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/880.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (881,'Arctozolt','Electric','Ice','Blue','Galar',8,'false','false','false','true','false','false','false',-1,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/881.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (882,'Dracovish','Water','Dragon','Green','Galar',8,'false','false','false','true','false','false','false',-1,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/882.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (883,'Arctovish','Water','Ice','Blue','Galar',8,'false','false','false','true','false','false','false',-1,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/883.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (884,'Duraludon','Steel','Dragon','White','Galar',8,'false','false','false','false','false','false','true',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/884.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (885,'Dreepy','Dragon','Ghost','Green','Galar',8,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/885.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (886,'Drakloak','Dragon','Ghost','Green','Galar',8,'false','false','false','false','false','false','false',0.5,'true','Dreepy','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/886.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (887,'Dragapult','Dragon','Ghost','Green','Galar',8,'false','false','false','false','false','false','false',0.5,'false','Drakloak','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/887.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (888,'Zacian','Fairy',NULL,'Blue','Galar',8,'true','false','false','false','false','false','false',-1,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/888.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (889,'Zamazenta','Fighting',NULL,'Red','Galar',8,'true','false','false','false','false','false','false',-1,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/889.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (890,'Eternatus','Poison','Dragon','Purple','Galar',8,'true','false','false','false','false','false','false',-1,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/890.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (891,'Kubfu','Fighting',NULL,'Gray','Galar',8,'true','false','false','false','false','false','false',0.125,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/891.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (892,'Urshifu-single-strike','Fighting','Dark','Gray','Galar',8,'true','false','false','false','false','false','true',0.125,'false','Kubfu','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/892.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (893,'Zarude','Dark','Grass','Green','Galar',8,'false','true','false','false','false','false','false',-1,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/893.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (894,'Regieleki','Electric',NULL,'Yellow','Galar',8,'true','false','false','false','false','false','false',-1,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/894.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (895,'Regidrago','Dragon',NULL,'Green','Galar',8,'true','false','false','false','false','false','false',-1,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/895.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (896,'Glastrier','Ice',NULL,'White','Galar',8,'true','false','false','false','false','false','false',-1,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/896.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (897,'Spectrier','Ghost',NULL,'Black','Galar',8,'true','false','false','false','false','false','false',-1,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/897.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (898,'Calyrex','Psychic','Grass','Green','Galar',8,'true','false','false','false','false','false','false',-1,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/898.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (899,'Wyrdeer','Normal','Psychic','Gray','Galar',8,'false','false','false','false','false','false','false',0.5,'false','Stantler','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/899.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (900,'Kleavor','Bug','Rock','Brown','Galar',8,'false','false','false','false','false','false','false',0.5,'false','Scyther','true','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/900.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (901,'Ursaluna','Ground','Normal','Brown','Galar',8,'false','false','false','false','false','false','false',0.5,'false','Ursaring','true','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/901.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (902,'Basculegion-male','Water','Ghost','Green','Galar',8,'false','false','false','false','false','false','false',0.5,'false','Basculin','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/902.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (903,'Sneasler','Fighting','Poison','Gray','Galar',8,'false','false','false','false','false','false','false',0.5,'false','Sneasel','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/903.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (904,'Overqwil','Dark','Poison','Black','Galar',8,'false','false','false','false','false','false','false',0.5,'false','Qwilfish','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/904.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (905,'Enamorus-incarnate','Fairy','Flying','Pink','Galar',8,'true','false','false','false','false','false','false',1,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/905.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (906,'Sprigatito','Grass',NULL,'Green','Paldea',9,'false','false','false','false','true','false','false',0.125,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/906.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (907,'Floragato','Grass',NULL,'Green','Paldea',9,'false','false','false','false','true','false','false',0.125,'true','Sprigatito','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/907.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (908,'Meowscarada','Grass','Dark','Green','Paldea',9,'false','false','false','false','true','false','false',0.125,'false','Floragato','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/908.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (909,'Fuecoco','Fire',NULL,'Red','Paldea',9,'false','false','false','false','true','false','false',0.125,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/909.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (910,'Crocalor','Fire',NULL,'Red','Paldea',9,'false','false','false','false','true','false','false',0.125,'true','Fuecoco','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/910.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (911,'Skeledirge','Fire','Ghost','Red','Paldea',9,'false','false','false','false','true','false','false',0.125,'false','Crocalor','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/911.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (912,'Quaxly','Water',NULL,'White','Paldea',9,'false','false','false','false','true','false','false',0.125,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/912.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (913,'Quaxwell','Water',NULL,'Blue','Paldea',9,'false','false','false','false','true','false','false',0.125,'true','Quaxly','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/913.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (914,'Quaquaval','Water','Fighting','Blue','Paldea',9,'false','false','false','false','true','false','false',0.125,'false','Quaxwell','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/914.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (915,'Lechonk','Normal',NULL,'Gray','Paldea',9,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/915.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (916,'Oinkologne-male','Normal',NULL,'Gray','Paldea',9,'false','false','false','false','false','false','false',0,'false','Lechonk','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/916.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (917,'Tarountula','Bug',NULL,'White','Paldea',9,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/917.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (918,'Spidops','Bug',NULL,'Green','Paldea',9,'false','false','false','false','false','false','false',0.5,'false','Tarountula','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/918.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (919,'Nymble','Bug',NULL,'Gray','Paldea',9,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/919.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (920,'Lokix','Bug','Dark','Gray','Paldea',9,'false','false','false','false','false','false','false',0.5,'false','Nymble','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/920.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (921,'Pawmi','Electric',NULL,'Yellow','Paldea',9,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/921.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (922,'Pawmo','Electric','Fighting','Yellow','Paldea',9,'false','false','false','false','false','false','false',0.5,'true','Pawmi','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/922.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (923,'Pawmot','Electric','Fighting','Yellow','Paldea',9,'false','false','false','false','false','false','false',0.5,'false','Pawmo','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/923.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (924,'Tandemaus','Normal',NULL,'White','Paldea',9,'false','false','false','false','false','false','false',-1,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/924.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (925,'Maushold-family-of-four','Normal',NULL,'White','Paldea',9,'false','false','false','false','false','false','false',-1,'false','Tandemaus','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/925.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (926,'Fidough','Fairy',NULL,'Yellow','Paldea',9,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/926.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (927,'Dachsbun','Fairy',NULL,'Brown','Paldea',9,'false','false','false','false','false','false','false',0.5,'false','Fidough','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/927.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (928,'Smoliv','Grass','Normal','Green','Paldea',9,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/928.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (929,'Dolliv','Grass','Normal','Green','Paldea',9,'false','false','false','false','false','false','false',0.5,'true','Smoliv','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/929.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (930,'Arboliva','Grass','Normal','Green','Paldea',9,'false','false','false','false','false','false','false',0.5,'false','Dolliv','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/930.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (931,'Squawkabilly-green-plumage','Normal','Flying','Green','Paldea',9,'false','false','false','false','false','false','false',0.5,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/931.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (932,'Nacli','Rock',NULL,'Brown','Paldea',9,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/932.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (933,'Naclstack','Rock',NULL,'Brown','Paldea',9,'false','false','false','false','false','false','false',0.5,'true','Nacli','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/933.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (934,'Garganacl','Rock',NULL,'Brown','Paldea',9,'false','false','false','false','false','false','false',0.5,'false','Naclstack','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/934.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (935,'Charcadet','Fire',NULL,'Red','Paldea',9,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/935.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (936,'Armarouge','Fire','Psychic','Red','Paldea',9,'false','false','false','false','false','false','false',0.5,'false','Charcadet','true','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/936.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (937,'Ceruledge','Fire','Ghost','Blue','Paldea',9,'false','false','false','false','false','false','false',0.5,'false','Charcadet','true','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/937.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (938,'Tadbulb','Electric',NULL,'Yellow','Paldea',9,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/938.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (939,'Bellibolt','Electric',NULL,'Green','Paldea',9,'false','false','false','false','false','false','false',0.5,'false','Tadbulb','true','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/939.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (940,'Wattrel','Electric','Flying','Black','Paldea',9,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/940.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (941,'Kilowattrel','Electric','Flying','Yellow','Paldea',9,'false','false','false','false','false','false','false',0.5,'false','Wattrel','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/941.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (942,'Maschiff','Dark',NULL,'Brown','Paldea',9,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/942.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (943,'Mabosstiff','Dark',NULL,'Gray','Paldea',9,'false','false','false','false','false','false','false',0.5,'false','Maschiff','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/943.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (944,'Shroodle','Poison','Normal','Gray','Paldea',9,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/944.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (945,'Grafaiai','Poison','Normal','Gray','Paldea',9,'false','false','false','false','false','false','false',0.5,'false','Shroodle','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/945.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (946,'Bramblin','Grass','Ghost','Brown','Paldea',9,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/946.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (947,'Brambleghast','Grass','Ghost','Brown','Paldea',9,'false','false','false','false','false','false','false',0.5,'false','Bramblin','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/947.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (948,'Toedscool','Ground','Grass','Yellow','Paldea',9,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/948.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (949,'Toedscruel','Ground','Grass','Black','Paldea',9,'false','false','false','false','false','false','false',0.5,'false','Toedscool','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/949.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (950,'Klawf','Rock',NULL,'Red','Paldea',9,'false','false','false','false','false','false','false',0.5,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/950.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (951,'Capsakid','Grass',NULL,'Green','Paldea',9,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/951.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (952,'Scovillain','Grass','Fire','Green','Paldea',9,'false','false','false','false','false','false','false',0.5,'false','Capsakid','true','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/952.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (953,'Rellor','Bug',NULL,'Brown','Paldea',9,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/953.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (954,'Rabsca','Bug','Psychic','Green','Paldea',9,'false','false','false','false','false','false','false',0.5,'false','Rellor','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/954.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (955,'Flittle','Psychic',NULL,'Yellow','Paldea',9,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/955.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (956,'Espathra','Psychic',NULL,'Yellow','Paldea',9,'false','false','false','false','false','false','false',0.5,'false','Flittle','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/956.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (957,'Tinkatink','Fairy','Steel','Pink','Paldea',9,'false','false','false','false','false','false','false',1,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/957.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (958,'Tinkatuff','Fairy','Steel','Pink','Paldea',9,'false','false','false','false','false','false','false',1,'true','Tinkatink','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/958.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (959,'Tinkaton','Fairy','Steel','Pink','Paldea',9,'false','false','false','false','false','false','false',1,'false','Tinkatuff','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/959.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (960,'Wiglett','Water',NULL,'White','Paldea',9,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/960.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (961,'Wugtrio','Water',NULL,'Red','Paldea',9,'false','false','false','false','false','false','false',0.5,'false','Wiglett','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/961.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (962,'Bombirdier','Flying','Dark','White','Paldea',9,'false','false','false','false','false','false','false',0.5,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/962.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (963,'Finizen','Water',NULL,'Blue','Paldea',9,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/963.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (964,'Palafin-zero','Water',NULL,'Blue','Paldea',9,'false','false','false','false','false','false','false',0.5,'false','Finizen','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/964.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (965,'Varoom','Steel','Poison','Gray','Paldea',9,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/965.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (966,'Revavroom','Steel','Poison','Gray','Paldea',9,'false','false','false','false','false','false','false',0.5,'false','Varoom','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/966.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (967,'Cyclizar','Dragon','Normal','Green','Paldea',9,'false','false','false','false','false','false','false',0.5,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/967.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (968,'Orthworm','Steel',NULL,'Pink','Paldea',9,'false','false','false','false','false','false','false',0.5,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/968.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (969,'Glimmet','Rock','Poison','Blue','Paldea',9,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/969.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (970,'Glimmora','Rock','Poison','Blue','Paldea',9,'false','false','false','false','false','false','false',0.5,'false','Glimmet','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/970.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (971,'Greavard','Ghost',NULL,'White','Paldea',9,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/971.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (972,'Houndstone','Ghost',NULL,'White','Paldea',9,'false','false','false','false','false','false','false',0.5,'false','Greavard','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/972.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (973,'Flamigo','Flying','Fighting','Pink','Paldea',9,'false','false','false','false','false','false','false',0.5,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/973.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (974,'Cetoddle','Ice',NULL,'White','Paldea',9,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/974.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (975,'Cetitan','Ice',NULL,'White','Paldea',9,'false','false','false','false','false','false','false',0.5,'false','Cetoddle','true','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/975.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (976,'Veluza','Water','Psychic','Gray','Paldea',9,'false','false','false','false','false','false','false',0.5,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/976.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (977,'Dondozo','Water',NULL,'Blue','Paldea',9,'false','false','false','false','false','false','false',0.5,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/977.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (978,'Tatsugiri-curly','Dragon','Water','Pink','Paldea',9,'false','false','false','false','false','false','false',0.5,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/978.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (979,'Annihilape','Fighting','Ghost','Gray','Paldea',9,'false','false','false','false','false','false','false',0.5,'false','Primeape','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/979.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (980,'Clodsire','Poison','Ground','Brown','Paldea',9,'false','false','false','false','false','false','false',0.5,'false','Wooper','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/980.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (981,'Farigiraf','Normal','Psychic','Brown','Paldea',9,'false','false','false','false','false','false','false',0.5,'false','Girafarig','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/981.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (982,'Dudunsparce-two-segment','Normal',NULL,'Yellow','Paldea',9,'false','false','false','false','false','false','false',0.5,'false','Dunsparce','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/982.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (983,'Kingambit','Dark','Steel','Black','Paldea',9,'false','false','false','false','false','false','false',0.5,'false','Bisharp','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/983.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (984,'Great-tusk','Ground','Fighting','Purple','Paldea',9,'false','false','false','false','false','false','false',-1,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/984.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (985,'Scream-tail','Fairy','Psychic','Pink','Paldea',9,'false','false','false','false','false','false','false',-1,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/985.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (986,'Brute-bonnet','Grass','Dark','Gray','Paldea',9,'false','false','false','false','false','false','false',-1,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/986.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (987,'Flutter-mane','Ghost','Fairy','Gray','Paldea',9,'false','false','false','false','false','false','false',-1,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/987.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (988,'Slither-wing','Bug','Fighting','Red','Paldea',9,'false','false','false','false','false','false','false',-1,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/988.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (989,'Sandy-shocks','Electric','Ground','Gray','Paldea',9,'false','false','false','false','false','false','false',-1,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/989.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (990,'Iron-treads','Ground','Steel','Gray','Paldea',9,'false','false','false','false','false','false','false',-1,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/990.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (991,'Iron-bundle','Ice','Water','Red','Paldea',9,'false','false','false','false','false','false','false',-1,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/991.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (992,'Iron-hands','Fighting','Electric','Gray','Paldea',9,'false','false','false','false','false','false','false',-1,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/992.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (993,'Iron-jugulis','Dark','Flying','Blue','Paldea',9,'false','false','false','false','false','false','false',-1,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/993.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (994,'Iron-moth','Fire','Poison','Yellow','Paldea',9,'false','false','false','false','false','false','false',-1,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/994.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (995,'Iron-thorns','Rock','Electric','Green','Paldea',9,'false','false','false','false','false','false','false',-1,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/995.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (996,'Frigibax','Dragon','Ice','Gray','Paldea',9,'false','false','false','false','false','false','false',0.5,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/996.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (997,'Arctibax','Dragon','Ice','Gray','Paldea',9,'false','false','false','false','false','false','false',0.5,'true','Frigibax','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/997.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (998,'Baxcalibur','Dragon','Ice','Gray','Paldea',9,'false','false','false','false','false','false','false',0.5,'false','Arctibax','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/998.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (999,'Gimmighoul','Ghost',NULL,'Brown','Paldea',9,'false','false','false','false','false','false','false',-1,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/999.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (1000,'Gholdengo','Steel','Ghost','Yellow','Paldea',9,'false','false','false','false','false','false','false',-1,'false','Gimmighoul','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/1000.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (1001,'Wo-chien','Dark','Grass','Brown','Paldea',9,'true','false','false','false','false','false','false',-1,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/1001.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (1002,'Chien-pao','Dark','Ice','White','Paldea',9,'true','false','false','false','false','false','false',-1,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/1002.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (1003,'Ting-lu','Dark','Ground','Brown','Paldea',9,'true','false','false','false','false','false','false',-1,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/1003.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (1004,'Chi-yu','Dark','Fire','Red','Paldea',9,'true','false','false','false','false','false','false',-1,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/1004.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (1005,'Roaring-moon','Dragon','Dark','Green','Paldea',9,'false','false','false','false','false','false','false',-1,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/1005.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (1006,'Iron-valiant','Fairy','Fighting','White','Paldea',9,'false','false','false','false','false','false','false',-1,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/1006.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (1007,'Koraidon','Fighting','Dragon','Red','Paldea',9,'true','false','false','false','false','false','false',-1,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/1007.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (1008,'Miraidon','Electric','Dragon','Blue','Paldea',9,'true','false','false','false','false','false','false',-1,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/1008.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (1009,'Walking-wake','Water','Dragon','Blue','Paldea',9,'false','false','false','false','false','false','false',-1,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/1009.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (1010,'Iron-leaves','Grass','Psychic','Green','Paldea',9,'false','false','false','false','false','false','false',-1,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/1010.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (1011,'Dipplin','Grass','Dragon','Green','Paldea',9,'false','false','false','false','false','false','false',-1,'true','Applin','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/1011.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (1012,'Poltchageist','Grass','Ghost','Green','Paldea',9,'false','false','false','false','false','false','false',-1,'true',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/1012.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (1013,'Sinistcha','Grass','Ghost','Green','Paldea',9,'false','false','false','false','false','false','false',-1,'false','Poltchageist','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/1013.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (1014,'Okidogi','Poison','Fighting','Black','Paldea',9,'true','false','false','false','false','false','false',-1,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/1014.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (1015,'Munkidori','Poison','Psychic','Black','Paldea',9,'true','false','false','false','false','false','false',-1,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/1015.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (1016,'Fezandipiti','Poison','Fairy','Black','Paldea',9,'true','false','false','false','false','false','false',-1,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/1016.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (1017,'Ogerpon','Grass',NULL,'Green','Paldea',9,'true','false','false','false','false','false','false',-1,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/1017.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (1018,'Archaludon','Steel','Dragon','White','Paldea',9,'false','false','false','false','false','false','false',0.5,'false','Duraludon','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/1018.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (1019,'Hydrapple','Grass','Dragon','Green','Paldea',9,'false','false','false','false','false','false','false',0.5,'false','Dipplin','false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/1019.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (1020,'Gouging-fire','Fire','Dragon','Brown','Paldea',9,'false','false','false','false','false','false','false',-1,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/1020.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (1021,'Raging-bolt','Electric','Dragon','Yellow','Paldea',9,'false','false','false','false','false','false','false',-1,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/1021.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (1022,'Iron-boulder','Rock','Psychic','Gray','Paldea',9,'false','false','false','false','false','false','false',-1,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/1022.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (1023,'Iron-crown','Steel','Psychic','Blue','Paldea',9,'false','false','false','false','false','false','false',-1,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/1023.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (1024,'Terapagos','Normal',NULL,'Blue','Paldea',9,'true','false','false','false','false','false','false',-1,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/1024.png',0,0);
-INSERT INTO mytable(ID,Name,Type_1,Type_2,Primay_Color,Region,Generation,Lengendary,Mythical,Baby,Fossile,Starter,Mega_Evolve,Gigantamax,Gender_Rate,Evolves,Evolves_from,Evolves_from_stone,Evolves_from_trading,Sprite_Default,Number_of_Legs,Popularity) VALUES (1025,'Pecharunt','Poison','Ghost','Purple','Paldea',9,'false','true','false','false','false','false','false',-1,'false',NULL,'false','false','https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/1025.png',0,0);
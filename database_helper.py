@@ -1,5 +1,6 @@
 import sqlite3
 from typing import List, Dict, Any, Optional
+from sql_trace import QueryTracer, TracingCursor
 
 
 class PokemonDatabase:
@@ -7,6 +8,8 @@ class PokemonDatabase:
         self.db_path = db_path
         self.connection = None
         self.cursor = None
+        self.tracer = None  # set by enable_tracing()
+        self._queryable_attributes = None
         self.connect()
         
     def connect(self):
@@ -17,6 +20,27 @@ class PokemonDatabase:
     def close(self):
         if self.connection:
             self.connection.close()
+    
+    def commit(self):
+        self.connection.commit()
+    
+    def enable_tracing(self, tracer: QueryTracer = None) -> QueryTracer:
+        # route every query through a timing cursor, grouped by statement shape
+        if self.tracer is None:
+            self.tracer = tracer or QueryTracer()
+            self.cursor = TracingCursor(self.cursor, self.tracer)
+        return self.tracer
+    
+    def disable_tracing(self):
+        if self.tracer is not None:
+            self.cursor = self.cursor._cursor
+            self.tracer = None
+    
+    def query_report(self) -> str:
+        # traced statements with their query plans, full scans flagged
+        if self.tracer is None:
+            return "SQL tracing is not enabled."
+        return self.tracer.format_report(self.connection)
             
     def get_all_pokemon(self) -> List[Dict[str, Any]]:
         self.cursor.execute("SELECT * FROM mytable")
@@ -86,13 +110,23 @@ class PokemonDatabase:
         
         return {row[0]: row[1] for row in self.cursor.fetchall()}
     
+    def get_columns(self) -> List[str]:
+        self.cursor.execute("PRAGMA table_info(mytable)")
+        return [row[1] for row in self.cursor.fetchall()]
+    
     def get_queryable_attributes(self) -> List[str]:
-        # only return boolean/binary attributes for yes/no questions
-        return [
-            'Lengendary', 'Mythical', 'Baby', 'Fossile', 'Starter',
-            'Mega_Evolve', 'Gigantamax', 'Evolves', 'Evolves_from_stone',
-            'Evolves_from_trading'
-        ]
+        # boolean/binary attributes for yes/no questions: every column holding only 'true'/'false'
+        # found once from the schema and data, so new flag columns need no code changes
+        if self._queryable_attributes is None:
+            attributes = []
+            for column in self.get_columns():
+                self.cursor.execute(
+                    f"SELECT 1 FROM mytable WHERE {column} IS NULL OR {column} NOT IN ('true', 'false') LIMIT 1"
+                )
+                if self.cursor.fetchone() is None:
+                    attributes.append(column)
+            self._queryable_attributes = attributes
+        return self._queryable_attributes
     
     def get_all_types(self) -> List[str]:
         types = set()
@@ -111,6 +145,34 @@ class PokemonDatabase:
     def get_all_generations(self) -> List[int]:
         return self.get_distinct_values('Generation')
     
+    def get_evolution_stages(self) -> Dict[int, int]:
+        # ID -> evolution stage (1 = basic), from the evolution_graph table when it has been built
+        self.cursor.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'table' AND name = 'evolution_graph'"
+        )
+        if self.cursor.fetchone():
+            self.cursor.execute("SELECT ID, Stage FROM evolution_graph")
+            return {row[0]: row[1] for row in self.cursor.fetchall()}
+        
+        # otherwise derive it by following Evolves_from back to the base form
+        self.cursor.execute("SELECT ID, Name, Evolves_from FROM mytable")
+        rows = self.cursor.fetchall()
+        by_name = {row['Name']: row for row in rows}
+        for row in rows:
+            # Evolves_from holds species names, Name may carry a form suffix (Pumpkaboo-average)
+            species_name = row['Name'].split('-')[0]
+            by_name.setdefault(species_name, row)
+        
+        stages = {}
+        for row in rows:
+            stage = 1
+            parent = by_name.get(row['Evolves_from']) if row['Evolves_from'] else None
+            while parent is not None and stage <= len(rows):
+                stage += 1
+                parent = by_name.get(parent['Evolves_from']) if parent['Evolves_from'] else None
+            stages[row['ID']] = stage
+        return stages
+    
     def has_type(self, pokemon_filters: Dict[str, Any], type_name: str) -> int:
         conditions = []
         values = []
@@ -0,0 +1,85 @@
+import argparse
+from collections import Counter
+from typing import Dict, Any, List, Tuple
+from question_families import QuestionRegistry, BooleanFamily
+
+# columns that identify a row rather than describe it, never worth suggesting as separators
+NON_DESCRIPTIVE_COLUMNS = {'ID', 'Name', 'Sprite_Default', 'Popularity', 'Equivalence_Class'}
+
+
+class EquivalenceIndex:
+    def __init__(self, pokemon: List[Dict[str, Any]], questions: QuestionRegistry):
+        # groups Pokemon that give the same answer to every question the engine can ask;
+        # once the candidates all sit in one class no question can tell them apart
+        self.questions = questions
+        self.class_of = {}   # ID -> class number
+        self.members = []    # class number -> IDs
+        class_numbers = {}
+        for p in pokemon:
+            signature = self.signature(p)
+            number = class_numbers.get(signature)
+            if number is None:
+                number = class_numbers[signature] = len(self.members)
+                self.members.append([])
+            self.class_of[p['ID']] = number
+            self.members[number].append(p['ID'])
+
+    def signature(self, pokemon: Dict[str, Any]) -> Tuple:
+        parts = []
+        for family in self.questions:
+            if isinstance(family, BooleanFamily):
+                parts.extend(pokemon.get(column) for column in family.columns)
+            else:
+                # "is it X?" only sees which values are present, not which column holds them
+                parts.append(frozenset(pokemon.get(column) or None for column in family.columns))
+        return tuple(parts)
+
+    def __len__(self) -> int:
+        return len(self.members)
+
+    def largest_classes(self, n: int = 10) -> List[List[int]]:
+        return sorted((ids for ids in self.members if len(ids) > 1), key=len, reverse=True)[:n]
+
+    def separating_attributes(self, pokemon: List[Dict[str, Any]]) -> List[str]:
+        # stored columns the question families don't ask about but that differ within this group
+        if len(pokemon) < 2:
+            return []
+        asked_columns = {column for family in self.questions for column in family.columns}
+        separating = []
+        for column in pokemon[0]:
+            if column in asked_columns or column in NON_DESCRIPTIVE_COLUMNS:
+                continue
+            if len({p.get(column) for p in pokemon}) > 1:
+                separating.append(column)
+        return separating
+
+
+def main():
+    from database_helper import PokemonDatabase
+    from game_ai import TwentyQuestionsAI
+
+    parser = argparse.ArgumentParser(description="Report groups of Pokemon the questions can't tell apart")
+    parser.add_argument('--db', default="database_files/database/pokemon_database.db")
+    parser.add_argument('--top', type=int, default=10)
+    args = parser.parse_args()
+
+    db = PokemonDatabase(args.db)
+    ai = TwentyQuestionsAI(db, use_learning=False)
+    index = ai.equivalence
+    by_id = {p['ID']: p for p in ai.remaining_pokemon}
+
+    sizes = Counter(len(ids) for ids in index.members)
+    shared = sum(size * count for size, count in sizes.items() if size > 1)
+    print(f"{len(by_id)} Pokemon in {len(index)} classes, {shared} share a class with another Pokemon")
+
+    for ids in index.largest_classes(args.top):
+        group = [by_id[pid] for pid in ids]
+        names = ', '.join(p['Name'] for p in group[:6]) + (', ...' if len(group) > 6 else '')
+        separating = index.separating_attributes(group)
+        print(f"\n{len(group)}: {names}")
+        print(f"   separable by: {', '.join(separating) if separating else 'nothing stored'}")
+    db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,31 +1,186 @@
 import math
-from typing import List, Dict, Any, Tuple
+from collections import Counter
+from operator import itemgetter
+from typing import List, Dict, Any, Tuple, Set, Optional
 from database_helper import PokemonDatabase
+from learning import AdaptiveQuestionSelector
+from popularity_index import PopularityIndex
+from question_families import QuestionRegistry, DEFAULT_REGISTRY
+from parallel_scoring import ParallelScorer, DEFAULT_MIN_CANDIDATES
+from equivalence_classes import EquivalenceIndex
+from speculation import SpeculativeCounter
+
+# every Pokemon's chance of being the answer is its popularity plus this, so unplayed ones still count
+POPULARITY_SMOOTHING = 0.05
+
+
+def pokemon_matches(pokemon: Dict[str, Any], question_type: str, question_detail: Any) -> bool:
+    # the truthful answer to a question for a given Pokemon
+    if question_type not in DEFAULT_REGISTRY:
+        return False
+    return DEFAULT_REGISTRY[question_type].matches(pokemon, question_detail)
 
 
 class TwentyQuestionsAI:
-    def __init__(self, db: PokemonDatabase, use_learning: bool = True):
+    def __init__(self, db: PokemonDatabase, use_learning: bool = True,
+                 question_selector: AdaptiveQuestionSelector = None):
+        self._init_session(db, use_learning, question_selector)
+        self.evolution_stages = db.get_evolution_stages()
+        self.equivalence = None
+        self.remaining_pokemon = self._load_pokemon()
+        # Pokemon no question can tell apart share a class, counted per class as candidates shrink
+        self.equivalence = EquivalenceIndex(self.remaining_pokemon, self.questions)
+        self._tag_classes(self.remaining_pokemon)
+        self._count_classes()
+        # popularity order shared with the learner so top-K never needs a full sort
+        self.popularity_index = PopularityIndex(self.remaining_pokemon)
+        self._by_id = {p['ID']: p for p in self.remaining_pokemon}
+        self._mask = self.popularity_index.full_mask()
+        self._mask_key = (self.remaining_pokemon, self.popularity_index.version)
+        
+    def _init_session(self, db: PokemonDatabase, use_learning: bool,
+                      question_selector: AdaptiveQuestionSelector):
+        # game state that doesn't depend on where the rows live, shared with ShardedQuestionsAI
         self.db = db
+        # question families found from the schema, one asked set per family
+        self.questions = QuestionRegistry.from_database(db)
+        self.asked = {name: set() for name in self.questions.names()}
         self.current_filters = {}
-        self.remaining_pokemon = db.get_all_pokemon()
         self.questions_asked = 0
         self.max_questions = 20
         self.question_history = []
-        self.asked_types = set()
-        self.asked_colors = set()
-        self.asked_regions = set()
-        self.asked_generations = set()
+        self._turns = []  # undo stack, one entry per answer or wrong guess
         self.use_learning = use_learning
-        
+        self.question_selector = question_selector  # boosts questions that worked well before
+        self.parallel_scorer = None  # set by enable_parallel_scoring()
+        self.speculator = None  # set by enable_speculation()
+    
+    def _load_pokemon(self) -> List[Dict[str, Any]]:
+        pokemon = self.db.get_all_pokemon()
+        for p in pokemon:
+            p['Evolution_Stage'] = self.evolution_stages.get(p['ID'])
+        if self.equivalence is not None:
+            self._tag_classes(pokemon)
+        return pokemon
+    
+    def _tag_classes(self, pokemon: List[Dict[str, Any]]):
+        class_of = self.equivalence.class_of
+        for p in pokemon:
+            # rows added since start-up get a class of their own
+            p['Equivalence_Class'] = class_of.get(p['ID'], ('new', p['ID']))
+    
+    def _count_classes(self):
+        # one C-level pass over the candidates, kept in step with every filter
+        self._class_counts = Counter(map(itemgetter('Equivalence_Class'), self.remaining_pokemon))
+    
+    def is_dead_end(self) -> bool:
+        # O(1): every remaining candidate answers every question the same way
+        return len(self._class_counts) <= 1
+    
+    def dead_end_separators(self) -> List[str]:
+        # stored columns that would split the remaining candidates if they were askable
+        return self.equivalence.separating_attributes(self.remaining_pokemon)
+    
+    def enable_parallel_scoring(self, workers: int = None, min_candidates: int = DEFAULT_MIN_CANDIDATES):
+        # big candidate sets get counted by a process pool over a shared copy of the catalog
+        if self.parallel_scorer is None:
+            self.parallel_scorer = ParallelScorer(self._load_pokemon(), self.questions,
+                                                  workers, min_candidates)
+        return self.parallel_scorer
+    
+    def enable_speculation(self) -> SpeculativeCounter:
+        # count the next turn for both answers on background threads while the player thinks
+        if self.speculator is None:
+            self.speculator = SpeculativeCounter(self)
+        return self.speculator
+    
+    def speculate(self, question_type: str, question_detail: Any):
+        # no-op unless speculation is enabled
+        if self.speculator is not None:
+            self.speculator.start(question_type, question_detail)
+    
+    def close(self):
+        if self.speculator is not None:
+            self.speculator.close()
+            self.speculator = None
+        if self.parallel_scorer is not None:
+            self.parallel_scorer.close()
+            self.parallel_scorer = None
+    
     def reset(self):
         self.current_filters = {}
-        self.remaining_pokemon = self.db.get_all_pokemon()
+        self.remaining_pokemon = self._load_pokemon()
         self.questions_asked = 0
         self.question_history = []
-        self.asked_types = set()
-        self.asked_colors = set()
-        self.asked_regions = set()
-        self.asked_generations = set()
+        self.asked = {name: set() for name in self.questions.names()}
+        self._turns = []
+        self._count_classes()
+        if self.speculator is not None:
+            self.speculator.cancel()
+        
+        # the index may be ahead of the table while logged games wait for compaction
+        for p in self.remaining_pokemon:
+            if p['ID'] in self.popularity_index:
+                p['Popularity'] = self.popularity_index.popularity(p['ID'])
+        self._by_id = {p['ID']: p for p in self.remaining_pokemon}
+        self._mask = self.popularity_index.full_mask()
+        self._mask_key = (self.remaining_pokemon, self.popularity_index.version)
+    
+    def _candidate_mask(self) -> int:
+        # rebuilt only when the candidate list or the popularity order has changed
+        mask_list, mask_version = self._mask_key
+        if mask_list is not self.remaining_pokemon or mask_version != self.popularity_index.version:
+            self._mask = self.popularity_index.candidate_mask(p['ID'] for p in self.remaining_pokemon)
+            self._mask_key = (self.remaining_pokemon, self.popularity_index.version)
+        return self._mask
+    
+    def _snapshot(self) -> Tuple:
+        # candidate state is only ever replaced, never mutated, so references are enough
+        return (self.remaining_pokemon, self._class_counts, self._mask, self._mask_key)
+    
+    def _restore(self, snapshot: Tuple):
+        self.remaining_pokemon, self._class_counts, self._mask, self._mask_key = snapshot
+    
+    def can_undo(self) -> bool:
+        return bool(self._turns)
+    
+    def undo(self) -> Tuple[str, Any, bool]:
+        # O(1) step back over the last answer or wrong guess; returns the question taken back, or None for a guess
+        snapshot, question, previous_filter, previous_stats = self._turns.pop()
+        self._restore(snapshot)
+        if question is None:
+            return None
+        question_type, question_detail, answer = question
+        self.asked[question_type].discard(question_detail)
+        if self.question_selector is not None:
+            # a retracted answer mustn't count towards the question's effectiveness
+            self.question_selector.restore_question_stats(question_type, question_detail, previous_stats)
+        if question_type == 'attribute':
+            if previous_filter is None:
+                self.current_filters.pop(question_detail, None)
+            else:
+                self.current_filters[question_detail] = previous_filter
+        self.questions_asked -= 1
+        self.question_history.pop()
+        return question
+    
+    def eliminate(self, pokemon_id: int):
+        # drop a wrongly guessed Pokemon from the candidates
+        self._turns.append((self._snapshot(), None, None, None))
+        mask = self._candidate_mask()
+        before = len(self.remaining_pokemon)
+        self.remaining_pokemon = [p for p in self.remaining_pokemon if p['ID'] != pokemon_id]
+        if len(self.remaining_pokemon) < before:
+            eliminated = self._by_id[pokemon_id]['Equivalence_Class']
+            # a new Counter, the undo stack still holds the old one
+            self._class_counts = self._class_counts.copy()
+            self._class_counts[eliminated] -= 1
+            if not self._class_counts[eliminated]:
+                del self._class_counts[eliminated]
+        if pokemon_id in self.popularity_index:
+            mask &= ~self.popularity_index.candidate_mask([pokemon_id])
+        self._mask = mask
+        self._mask_key = (self.remaining_pokemon, self.popularity_index.version)
         
     def calculate_entropy(self, distribution: Dict[Any, int]) -> float:
         total = sum(distribution.values())
@@ -40,267 +195,134 @@ class TwentyQuestionsAI:
         
         return entropy
     
-    def calculate_information_gain_for_type(self, type_name: str) -> float:
-        # calculate information gain for asking about a specific type
-        if not self.remaining_pokemon:
+    def information_gain(self, total: int, yes_count: int) -> float:
+        # expected drop in entropy from a yes/no question that keeps yes_count of total on "yes"
+        no_count = total - yes_count
+        if yes_count <= 0 or no_count <= 0:
             return 0.0
         
-        current_entropy = math.log2(len(self.remaining_pokemon))
+        entropy_yes = math.log2(yes_count) if yes_count > 1 else 0
+        entropy_no = math.log2(no_count) if no_count > 1 else 0
+        weighted_entropy = (yes_count / total) * entropy_yes + (no_count / total) * entropy_no
         
-        # count how many have this type vs don't
-        has_type_count = sum(1 for p in self.remaining_pokemon 
-                            if p['Type_1'] == type_name or p['Type_2'] == type_name)
-        doesnt_have_count = len(self.remaining_pokemon) - has_type_count
-        
-        if has_type_count == 0 or doesnt_have_count == 0:
-            return 0.0
-        
-        # calculate weighted entropy
-        total = len(self.remaining_pokemon)
-        prob_has = has_type_count / total
-        prob_doesnt = doesnt_have_count / total
-        
-        entropy_has = math.log2(has_type_count) if has_type_count > 1 else 0
-        entropy_doesnt = math.log2(doesnt_have_count) if doesnt_have_count > 1 else 0
-        
-        weighted_entropy = prob_has * entropy_has + prob_doesnt * entropy_doesnt
-        
-        info_gain = current_entropy - weighted_entropy
-        
-        # Add popularity bias if learning is enabled
-        if self.use_learning:
-            info_gain = self._apply_popularity_bias(info_gain, type_name, 'type')
-        
-        return info_gain
+        return math.log2(total) - weighted_entropy
     
-    def calculate_information_gain_for_value(self, attribute: str, value: Any) -> float:
-        if not self.remaining_pokemon:
+    def weighted_gain(self, yes_share: float) -> float:
+        # information_gain when candidates aren't equally likely: the entropy of the yes/no split
+        if yes_share <= 0 or yes_share >= 1:
             return 0.0
-        
-        current_entropy = math.log2(len(self.remaining_pokemon))
-        
-        # count how many have this value vs don't
-        has_value_count = sum(1 for p in self.remaining_pokemon if p[attribute] == value)
-        doesnt_have_count = len(self.remaining_pokemon) - has_value_count
-        
-        if has_value_count == 0 or doesnt_have_count == 0:
-            return 0.0
-        
-        # calculate weighted entropy
-        total = len(self.remaining_pokemon)
-        prob_has = has_value_count / total
-        prob_doesnt = doesnt_have_count / total
-        
-        entropy_has = math.log2(has_value_count) if has_value_count > 1 else 0
-        entropy_doesnt = math.log2(doesnt_have_count) if doesnt_have_count > 1 else 0
-        
-        weighted_entropy = prob_has * entropy_has + prob_doesnt * entropy_doesnt
-        
-        info_gain = current_entropy - weighted_entropy
-        
-        # Add popularity bias if learning is enabled
-        if self.use_learning:
-            info_gain = self._apply_popularity_bias(info_gain, value, attribute)
-        
-        return info_gain
+        return -yes_share * math.log2(yes_share) - (1 - yes_share) * math.log2(1 - yes_share)
     
-    def calculate_information_gain(self, attribute: str) -> float:
-        # get distribution of this attribute in remaining Pokemon
-        if not self.remaining_pokemon:
-            return 0.0
-        
-        distribution = {}
-        for pokemon in self.remaining_pokemon:
-            value = pokemon[attribute]
-            distribution[value] = distribution.get(value, 0) + 1
-        
-        if not distribution or len(distribution) == 1:
-            return 0.0
-        
-        # current entropy
-        current_entropy = math.log2(len(self.remaining_pokemon))
-        
-        # calculate weighted average entropy after asking about this attribute
-        total = sum(distribution.values())
-        weighted_entropy = 0.0
-        
-        for value, count in distribution.items():
-            if count > 0:
-                probability = count / total
-                # entropy of this subset
-                subset_entropy = math.log2(count) if count > 1 else 0
-                weighted_entropy += probability * subset_entropy
-        
-        info_gain = current_entropy - weighted_entropy
-        
-        # Add popularity bias if learning is enabled
-        if self.use_learning:
-            info_gain = self._apply_popularity_bias(info_gain, attribute, 'attribute')
-        
-        return info_gain
+    def _question_boost(self, gain: float, question_type: str, question_detail: Any) -> float:
+        # O(1) lookup of how well this question narrowed things down in past games
+        if self.question_selector is None or gain <= 0:
+            return gain
+        return gain + self.question_selector.get_question_boost(question_type, question_detail)
     
-    def _apply_popularity_bias(self, info_gain: float, question_detail: Any, question_type: str) -> float:
-        # Trying to boost questions that lead to popular Pokemon
-        if not self.remaining_pokemon:
-            return info_gain
-        
-        # Calculate which Pokemon would remain if answer is "yes"
-        if question_type == 'type':
-            matching_pokemon = [p for p in self.remaining_pokemon 
-                               if p['Type_1'] == question_detail or p['Type_2'] == question_detail]
-        elif question_type == 'attribute':
-            matching_pokemon = [p for p in self.remaining_pokemon 
-                               if p.get(question_detail) == 'true']
-        elif question_type == 'color':
-            matching_pokemon = [p for p in self.remaining_pokemon 
-                               if p.get('Primay_Color') == question_detail]
-        elif question_type == 'region':
-            matching_pokemon = [p for p in self.remaining_pokemon 
-                               if p.get('Region') == question_detail]
-        elif question_type == 'generation':
-            matching_pokemon = [p for p in self.remaining_pokemon 
-                               if p.get('Generation') == question_detail]
-        else:
-            matching_pokemon = []
-        
-        if not matching_pokemon:
-            return info_gain
-        
-        # Calculate average popularity of non-matching Pokemon
-        non_matching = [p for p in self.remaining_pokemon if p not in matching_pokemon]
-        
-        # Use MAX popularity instead of average for stronger signal
-        max_popularity_yes = max((p.get('Popularity', 0) for p in matching_pokemon), default=0)
-        max_popularity_no = max((p.get('Popularity', 0) for p in non_matching), default=0) if non_matching else 0
-        max_popularity_overall = max((p.get('Popularity', 0) for p in self.remaining_pokemon), default=0)
-        
-        # Boost questions that keep the most popular Pokemon in play
-        if max_popularity_overall > 0:
-            best_outcome_popularity = max(max_popularity_yes, max_popularity_no)
-            
-            # Strong boost for questions leading to popular Pokemon
-            # popularity_ratio ranges from 0 to 1
-            popularity_ratio = best_outcome_popularity / max_popularity_overall
-            
-            # Apply up to 100% boost for questions that preserve the most popular Pokemon
-            popularity_boost = info_gain * (popularity_ratio - 0.5) * 2.0
-            
-            return info_gain + max(0, popularity_boost)
-        
-        return info_gain
+    def count_histograms(self, candidates: List[Dict[str, Any]],
+                         asked: Dict[str, Set[Any]]) -> Dict[str, Dict[Any, int]]:
+        # question type -> {detail: candidates answering yes}, one counting pass per family
+        # histograms from disjoint slices of the candidates can simply be added together
+        return {family.name: family.count(candidates, asked.get(family.name, ()))
+                for family in self.questions}
     
-    def find_best_question(self) -> Tuple[str, Any]:
-        if not self.remaining_pokemon:
-            return None, None
-        
+    def count_popularity(self, candidates: List[Dict[str, Any]],
+                         asked: Dict[str, Set[Any]]) -> Optional[Tuple[float, Dict[str, Dict[Any, float]]]]:
+        # (total popularity, question type -> {detail: popularity answering yes}), None if nothing is learned yet
+        # only Pokemon with some popularity are walked, so this stays cheap while few have been guessed
+        popular = [p for p in candidates if p['Popularity']]
+        if not popular:
+            return None
+        return (sum(map(itemgetter('Popularity'), popular)),
+                {family.name: family.popularity(popular, asked.get(family.name, ()))
+                 for family in self.questions})
+    
+    def score_histograms(self, total: int, histograms: Dict[str, Dict[Any, int]],
+                         popularity: Optional[Tuple[float, Dict[str, Dict[Any, float]]]] = None) -> Tuple[str, Any]:
+        # best question from yes-counts alone, so the counting can happen anywhere
         best_question = None
         best_gain = -1.0
         
-        # check boolean attributes
-        queryable_attributes = self.db.get_queryable_attributes()
-        available_attributes = [
-            attr for attr in queryable_attributes 
-            if attr not in self.current_filters
-        ]
-        
-        for attribute in available_attributes:
-            gain = self.calculate_information_gain(attribute)
-            if gain > best_gain:
-                best_gain = gain
-                best_question = ('attribute', attribute)
-        
-        # check types (not yet asked about)
-        remaining_types = set()
-        for p in self.remaining_pokemon:
-            if p['Type_1']:
-                remaining_types.add(p['Type_1'])
-            if p['Type_2']:
-                remaining_types.add(p['Type_2'])
-        available_types = [t for t in remaining_types if t not in self.asked_types]
-        for type_name in available_types:
-            gain = self.calculate_information_gain_for_type(type_name)
-            if gain > best_gain:
-                best_gain = gain
-                best_question = ('type', type_name)
-        
-        # check colors
-        remaining_colors = set(p['Primay_Color'] for p in self.remaining_pokemon if p['Primay_Color'])
-        available_colors = [c for c in remaining_colors if c not in self.asked_colors]
-        for color in available_colors:
-            gain = self.calculate_information_gain_for_value('Primay_Color', color)
-            if gain > best_gain:
-                best_gain = gain
-                best_question = ('color', color)
-        
-        # check regions
-        remaining_regions = set(p['Region'] for p in self.remaining_pokemon if p['Region'])
-        available_regions = [r for r in remaining_regions if r not in self.asked_regions]
-        for region in available_regions:
-            gain = self.calculate_information_gain_for_value('Region', region)
-            if gain > best_gain:
-                best_gain = gain
-                best_question = ('region', region)
-        
-        # check generations
-        remaining_generations = set(p['Generation'] for p in self.remaining_pokemon if p['Generation'])
-        available_generations = [g for g in remaining_generations if g not in self.asked_generations]
-        for generation in available_generations:
-            gain = self.calculate_information_gain_for_value('Generation', generation)
-            if gain > best_gain:
-                best_gain = gain
-                best_question = ('generation', generation)
+        # with learning, split the candidates' chance of being the answer rather than their head count
+        total_popularity, popularity_histograms = popularity if popularity is not None else (0, {})
+        total_weight = total * POPULARITY_SMOOTHING + total_popularity
+        
+        for question_type, counts in histograms.items():
+            popular_counts = popularity_histograms.get(question_type, {})
+            for question_detail, yes_count in counts.items():
+                if popularity is None:
+                    gain = self.information_gain(total, yes_count)
+                else:
+                    yes_weight = yes_count * POPULARITY_SMOOTHING + popular_counts.get(question_detail, 0)
+                    gain = self.weighted_gain(yes_weight / total_weight)
+                gain = self._question_boost(gain, question_type, question_detail)
+                if gain > best_gain:
+                    best_gain = gain
+                    best_question = (question_type, question_detail)
         
         return best_question if best_question else (None, None)
     
+    def count_candidates(self, candidates: List[Dict[str, Any]],
+                         asked: Dict[str, Set[Any]]) -> Tuple[int, Dict[str, Dict[Any, int]],
+                                                              Optional[Tuple[float, Dict[str, Dict[Any, float]]]]]:
+        # everything score_histograms needs, the expensive part of choosing a question
+        popularity = self.count_popularity(candidates, asked) if self.use_learning else None
+        
+        histograms = None
+        if self.parallel_scorer is not None and self.parallel_scorer.should_handle(candidates):
+            histograms = self.parallel_scorer.count_histograms(candidates, asked)
+        if histograms is None:
+            histograms = self.count_histograms(candidates, asked)
+        return len(candidates), histograms, popularity
+    
+    def score_candidates(self, candidates: List[Dict[str, Any]],
+                         asked: Dict[str, Set[Any]]) -> Tuple[str, Any]:
+        # best question for any candidate set, not just the current one
+        if not candidates:
+            return None, None
+        return self.score_histograms(*self.count_candidates(candidates, asked))
+    
+    def find_best_question(self) -> Tuple[str, Any]:
+        # nothing left to ask once all candidates are indistinguishable
+        if self.is_dead_end():
+            return None, None
+        if self.speculator is not None:
+            counted = self.speculator.take()
+            if counted is not None:
+                return self.score_histograms(*counted) if counted[0] else (None, None)
+        return self.score_candidates(self.remaining_pokemon, self.asked)
+    
     def ask_question(self) -> Tuple[str, Any]:
         # generate the next optimal yes/no question
         return self.find_best_question()
     
     def update_filters(self, question_type: str, question_detail: Any, answer: bool):
         # update current filters and remaining Pokemon based on the answer
+        previous_stats = (self.question_selector.question_stats(question_type, question_detail)
+                          if self.question_selector is not None else None)
+        self._turns.append((self._snapshot(), (question_type, question_detail, answer),
+                            self.current_filters.get(question_detail) if question_type == 'attribute' else None,
+                            previous_stats))
+        before_count, after_count = self._filter_candidates(question_type, question_detail, answer)
+        self.asked[question_type].add(question_detail)
         if question_type == 'attribute':
-            # boolean attribute - filter remaining Pokemon
-            value = 'true' if answer else 'false'
-            self.current_filters[question_detail] = value
-            # filter the already-narrowed list, not the whole database
-            self.remaining_pokemon = [p for p in self.remaining_pokemon if p[question_detail] == value]
-            
-        elif question_type == 'type':
-            # filter by type
-            if answer:
-                # keep Pokemon that have this type
-                self.remaining_pokemon = [p for p in self.remaining_pokemon 
-                                         if p['Type_1'] == question_detail or p['Type_2'] == question_detail]
-            else:
-                # remove Pokemon that have this type
-                self.remaining_pokemon = [p for p in self.remaining_pokemon 
-                                         if p['Type_1'] != question_detail and p['Type_2'] != question_detail]
-            self.asked_types.add(question_detail)
-            
-        elif question_type == 'color':
-            if answer:
-                self.remaining_pokemon = [p for p in self.remaining_pokemon if p['Primay_Color'] == question_detail]
-            else:
-                self.remaining_pokemon = [p for p in self.remaining_pokemon if p['Primay_Color'] != question_detail]
-            self.asked_colors.add(question_detail)
-            
-        elif question_type == 'region':
-            if answer:
-                self.remaining_pokemon = [p for p in self.remaining_pokemon if p['Region'] == question_detail]
-            else:
-                self.remaining_pokemon = [p for p in self.remaining_pokemon if p['Region'] != question_detail]
-            self.asked_regions.add(question_detail)
-            
-        elif question_type == 'generation':
-            if answer:
-                self.remaining_pokemon = [p for p in self.remaining_pokemon if p['Generation'] == question_detail]
-            else:
-                self.remaining_pokemon = [p for p in self.remaining_pokemon if p['Generation'] != question_detail]
-            self.asked_generations.add(question_detail)
+            self.current_filters[question_detail] = 'true' if answer else 'false'
         
         self.questions_asked += 1
         self.question_history.append((question_type, question_detail, answer))
         
+        if self.question_selector is not None:
+            self.question_selector.record_question_result(question_type, question_detail,
+                                                          before_count, after_count)
+    
+    def _filter_candidates(self, question_type: str, question_detail: Any, answer: bool) -> Tuple[int, int]:
+        # filter the already-narrowed list, not the whole database; returns (before, after) counts
+        before_count = len(self.remaining_pokemon)
+        family = self.questions[question_type]
+        self.remaining_pokemon = family.filter(self.remaining_pokemon, question_detail, answer)
+        self._count_classes()
+        return before_count, len(self.remaining_pokemon)
+        
     def get_remaining_count(self) -> int:
         return len(self.remaining_pokemon)
     
@@ -309,7 +331,7 @@ class TwentyQuestionsAI:
         if self.remaining_pokemon:
             if self.use_learning:
                 # Guess the most popular Pokemon
-                return max(self.remaining_pokemon, key=lambda p: (p.get('Popularity', 0), -p['ID']))
+                return self._by_id[self.popularity_index.top_k(self._candidate_mask(), 1)[0]]
             else:
                 return self.remaining_pokemon[0]
         return None
@@ -317,44 +339,14 @@ class TwentyQuestionsAI:
     def get_top_candidates(self, n: int = 5) -> List[Dict[str, Any]]:
         # get the top N most likely remaining Pokemon
         if self.use_learning:
-            # sort by popularity (highest first), then by ID for tie-breaking
-            sorted_pokemon = sorted(
-                self.remaining_pokemon,
-                key=lambda p: (p.get('Popularity', 0), -p['ID']),
-                reverse=True
-            )
-            return sorted_pokemon[:n]
+            # popularity (highest first), then by ID for tie-breaking
+            top_ids = self.popularity_index.top_k(self._candidate_mask(), n)
+            return [self._by_id[pid] for pid in top_ids]
         else:
             return self.remaining_pokemon[:n]
     
     def format_question(self, question_type: str, question_detail: Any) -> str:
         # yes/no question formatting
-        if question_type == 'attribute':
-            question_templates = {
-                'Lengendary': "Is it a legendary Pokemon?",
-                'Mythical': "Is it a mythical Pokemon?",
-                'Baby': "Is it a baby Pokemon?",
-                'Fossile': "Is it a fossil Pokemon?",
-                'Starter': "Is it a starter Pokemon?",
-                'Mega_Evolve': "Can it mega evolve?",
-                'Gigantamax': "Can it Gigantamax?",
-                'Evolves': "Does it evolve into another Pokemon?",
-                'Evolves_from_stone': "Is it evolved from a stone? (e.g. Raichu = yes)",
-                'Evolves_from_trading': "Does it evolve through trading? (e.g. Gengar = yes)"
-            }
-            return question_templates.get(question_detail, f"Is the {question_detail} true?")
-        
-        elif question_type == 'type':
-            return f"Is it a {question_detail}-type Pokemon?"
-        
-        elif question_type == 'color':
-            return f"Is it {question_detail} in color? (Pokedex color)"
-        
-        elif question_type == 'region':
-            return f"Is it from the {question_detail} region?"
-        
-        elif question_type == 'generation':
-            return f"Is it from Generation {question_detail}?"
-        
-        return "Unknown question"
-
+        if question_type not in self.questions:
+            return "Unknown question"
+        return self.questions[question_type].format(question_detail)
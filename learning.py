@@ -1,30 +1,184 @@
+import hashlib
+import heapq
+import json
+import os
 import sqlite3
-from typing import Dict, Any, List
+import sys
+import threading
+import time
+import traceback
+from typing import Dict, Any, List, Iterable, Iterator, Optional
 from database_helper import PokemonDatabase
+from popularity_index import PopularityIndex
+
+# how much of a log read_outcomes decodes at a time
+READ_CHUNK_BYTES = 4 * 1024 * 1024
+
+
+class OutcomeLog:
+    def __init__(self, path: str):
+        # append-only JSONL log of finished games, one record per line, flushed as each game ends
+        self.path = path
+        self._lock = threading.Lock()
+        self._file = open(path, 'a', encoding='utf-8')
+        self._end_partial_line()
+
+    def _end_partial_line(self):
+        # a crash mid-write leaves a line without its newline, don't glue the next record onto it
+        if self._file.tell() > 0:
+            with open(self.path, 'rb') as f:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b'\n':
+                    self._file.write('\n')
+
+    def append(self, target_pokemon_id: int, candidate_ids: List[int],
+               was_correct: bool, question_history: List[tuple] = None):
+        record = {
+            'at': time.time(),  # also keeps every segment's bytes unique, see OutcomeCompactor
+            'target': target_pokemon_id,
+            'candidates': candidate_ids,
+            'correct': was_correct,
+            'questions': [list(q) for q in (question_history or [])]
+        }
+        line = json.dumps(record, separators=(',', ':')) + '\n'
+        with self._lock:
+            # one short line per game, so a crash loses at most the game being written
+            self._file.write(line)
+            self._file.flush()
+
+    def flush(self):
+        with self._lock:
+            self._file.flush()
+
+    def rotate(self) -> Optional[str]:
+        # move the current log aside so it can be compacted while new games keep appending
+        segment_path = self.path + '.compacting'
+        with self._lock:
+            self._file.flush()
+            if os.path.exists(segment_path):
+                # left over from an interrupted compaction, finish that one first
+                return segment_path
+            if os.path.getsize(self.path) == 0:
+                return None
+            self._file.close()
+            os.replace(self.path, segment_path)
+            self._file = open(self.path, 'a', encoding='utf-8')
+        return segment_path
+
+    def close(self):
+        with self._lock:
+            self._file.close()
+
+
+def read_outcomes(path: str, rejected: List[str] = None) -> Iterator[Dict[str, Any]]:
+    # lines that don't decode (e.g. half-written by a crash) are skipped, and collected in rejected if given
+    decode = json.JSONDecoder().decode
+    with open(path, 'r', encoding='utf-8') as f:
+        while True:
+            lines = f.readlines(READ_CHUNK_BYTES)
+            if not lines:
+                break
+            # one decode call per few MB of lines is about twice as fast as one per line;
+            # a chunk with a blank or broken line is decoded line by line instead
+            try:
+                yield from decode('[' + ','.join(lines) + ']')
+                continue
+            except ValueError:
+                pass
+            for line in lines:
+                if line.isspace():
+                    continue
+                try:
+                    yield decode(line)
+                except ValueError:
+                    if rejected is not None:
+                        rejected.append(line if line.endswith('\n') else line + '\n')
+
+
+def fold_outcomes(popularity: Dict[int, float], outcomes: Iterable[Dict[str, Any]],
+                  learning_rate: float, decay_rate: float, penalty: float) -> Dict[int, float]:
+    # replay update_popularity over many games at once
+    # values are stored relative to a running decay scale, so decaying every
+    # untouched Pokemon costs O(1) per game instead of a full-table pass;
+    # each touched Pokemon is written once per game, already divided by the next scale
+    # so the decay skips it (candidate lists never repeat an ID)
+    scale = 1.0
+    stored = dict(popularity)
+    get = stored.get
+    target_step = learning_rate * 1.0
+    penalty_step = learning_rate * penalty
+
+    for outcome in outcomes:
+        target_id = outcome['target']
+        next_scale = scale * decay_rate
+
+        value = get(target_id)
+        if value is not None:
+            value = value * scale + target_step
+            stored[target_id] = (0 if value < 0 else 100 if value > 100 else value) / next_scale
+        for pid in outcome['candidates']:
+            if pid != target_id:
+                value = get(pid)
+                if value is not None:
+                    value = value * scale + penalty_step
+                    stored[pid] = (0 if value < 0 else 100 if value > 100 else value) / next_scale
+        scale = next_scale
+
+        # fold the scale back in before it underflows
+        if scale < 1e-100:
+            stored = {pid: value * scale for pid, value in stored.items()}
+            get = stored.get
+            scale = 1.0
+
+    return {pid: value * scale for pid, value in stored.items()}
 
 
 class PopularityLearner:
-    def __init__(self, db: PokemonDatabase):
+    def __init__(self, db: PokemonDatabase, outcome_log: OutcomeLog = None,
+                 index: PopularityIndex = None):
         self.db = db
         self.learning_rate = 0.1  # learning rate for popularity updates
         self.decay_rate = 0.995   # decay factor for non-candidate Pokemon popularity
+        self.penalty = -0.2       # reward for candidates that were not the answer
+        self.outcome_log = outcome_log  # when set, games are logged and compacted later
+        self.index = index  # in-memory popularity order, updated alongside the table
         
     def update_popularity(self, target_pokemon_id: int, 
                          candidates: List[Dict[str, Any]], 
-                         was_correct: bool):
+                         was_correct: bool,
+                         question_history: List[tuple] = None):
         candidate_ids = [p['ID'] for p in candidates]
         
+        if self.index is not None:
+            self._update_index(target_pokemon_id, candidate_ids)
+        
+        if self.outcome_log is not None:
+            # game path only pays for one short append
+            self.outcome_log.append(target_pokemon_id, candidate_ids, was_correct, question_history)
+            return
+        
         # update the target/correct pokemon (positive reward)
         self._adjust_popularity(target_pokemon_id, reward=1.0)
         
         # updating other candidates (negative reward)
         for candidate in candidates:
             if candidate['ID'] != target_pokemon_id:
-                self._adjust_popularity(candidate['ID'], reward=-0.2)
+                self._adjust_popularity(candidate['ID'], reward=self.penalty)
         
         # apply decay to non-candidate Pokemon (prevents runaway popularity)
         self._apply_decay(exclude_ids=[target_pokemon_id] + candidate_ids)
         
+    def _update_index(self, target_pokemon_id: int, candidate_ids: List[int]):
+        # same rewards and decay as the table update, applied to the in-memory order
+        rewards = [(target_pokemon_id, 1.0)]
+        rewards.extend((pid, self.penalty) for pid in candidate_ids if pid != target_pokemon_id)
+        for pid, reward in rewards:
+            if pid in self.index:
+                new_popularity = self.index.popularity(pid) + (self.learning_rate * reward)
+                self.index.adjust(pid, max(0, min(100, new_popularity)))
+        
+        self.index.decay([target_pokemon_id] + candidate_ids, self.decay_rate)
+        
     def _adjust_popularity(self, pokemon_id: int, reward: float):
         # get current popularity
         self.db.cursor.execute("SELECT Popularity FROM mytable WHERE ID = ?", (pokemon_id,))
@@ -46,7 +200,7 @@ class PopularityLearner:
             "UPDATE mytable SET Popularity = ? WHERE ID = ?",
             (new_popularity, pokemon_id)
         )
-        self.db.connection.commit()
+        self.db.commit()
         
     def _apply_decay(self, exclude_ids: List[int]):
         # decay popularity of all Pokemon not in exclude_ids
@@ -57,20 +211,25 @@ class PopularityLearner:
                 f"UPDATE mytable SET Popularity = Popularity * ? WHERE ID NOT IN ({placeholders})",
                 [self.decay_rate] + exclude_ids
             )
-            self.db.connection.commit()
+            self.db.commit()
     
     def get_most_popular(self, candidates: List[Dict[str, Any]], top_n: int = 1) -> List[Dict[str, Any]]:
         # return the top N most popular Pokemon from the candidates
-        # sort by popularity (highest first), then by ID for consistency
-        sorted_candidates = sorted(
-            candidates, 
-            key=lambda p: (p.get('Popularity', 0), -p['ID']),
-            reverse=True
-        )
+        # by popularity (highest first), then by ID for consistency
+        if self.index is not None:
+            by_id = {p['ID']: p for p in candidates}
+            top_ids = self.index.top_k(self.index.candidate_mask(by_id), top_n)
+            return [by_id[pid] for pid in top_ids]
         
-        return sorted_candidates[:top_n]
+        return heapq.nlargest(top_n, candidates, key=lambda p: (p.get('Popularity', 0), -p['ID']))
     
     def get_popularity_stats(self) -> Dict[str, Any]:
+        # O(1) from the index when we have one, full table scan otherwise
+        if self.index is not None:
+            return self.index.stats()
+        return self.compute_popularity_stats()
+    
+    def compute_popularity_stats(self) -> Dict[str, Any]:
         self.db.cursor.execute("""
             SELECT 
                 MIN(Popularity) as min_pop,
@@ -97,19 +256,184 @@ class PopularityLearner:
         
         return stats
     
+    def check_popularity_stats(self, tolerance: float = 1e-9) -> List[str]:
+        # compare the maintained stats against a full recompute, returns the mismatching fields
+        # (with an outcome log, compact first so the table has caught up)
+        maintained = self.get_popularity_stats()
+        recomputed = self.compute_popularity_stats()
+        
+        mismatches = [
+            key for key in ('min_pop', 'max_pop', 'avg_pop')
+            if abs(maintained[key] - recomputed[key]) > tolerance
+        ]
+        if maintained['total'] != recomputed['total']:
+            mismatches.append('total')
+        top_pairs = list(zip(maintained['top_pokemon'], recomputed['top_pokemon']))
+        if len(top_pairs) != len(recomputed['top_pokemon']) or any(
+                a['name'] != b['name'] or abs(a['popularity'] - b['popularity']) > tolerance
+                for a, b in top_pairs):
+            mismatches.append('top_pokemon')
+        return mismatches
+    
+    def apply_outcomes(self, outcomes: Iterable[Dict[str, Any]], segment_id: str = None) -> int:
+        # fold a batch of logged games into the table in one transaction;
+        # with a segment_id the batch is recorded in that same transaction and never applied twice
+        if segment_id is not None:
+            self.db.cursor.execute("""
+                CREATE TABLE IF NOT EXISTS compacted_segments (
+                    Segment_Id TEXT PRIMARY KEY,
+                    Compacted_At REAL NOT NULL
+                ) WITHOUT ROWID
+            """)
+            self.db.cursor.execute("SELECT 1 FROM compacted_segments WHERE Segment_Id = ?", (segment_id,))
+            if self.db.cursor.fetchone():
+                return 0
+        
+        self.db.cursor.execute("SELECT ID, Popularity FROM mytable")
+        popularity = {row[0]: row[1] or 0 for row in self.db.cursor.fetchall()}
+        
+        updated = fold_outcomes(popularity, outcomes, self.learning_rate,
+                                self.decay_rate, self.penalty)
+        changed = [(value, pid) for pid, value in updated.items() if value != popularity[pid]]
+        
+        self.db.cursor.executemany("UPDATE mytable SET Popularity = ? WHERE ID = ?", changed)
+        if segment_id is not None:
+            self.db.cursor.execute("INSERT INTO compacted_segments VALUES (?, ?)", (segment_id, time.time()))
+        self.db.commit()
+        return len(changed)
+    
     def reset_all_popularity(self):
         self.db.cursor.execute("UPDATE mytable SET Popularity = 0")
-        self.db.connection.commit()
+        self.db.commit()
+
+
+class OutcomeCompactor(threading.Thread):
+    def __init__(self, outcome_log: OutcomeLog, db_path: str, learner: PopularityLearner,
+                 interval: float = 30.0, archive_path: str = None):
+        super().__init__(daemon=True)
+        self.outcome_log = outcome_log
+        self.db_path = db_path
+        self.learner = learner
+        self.interval = interval
+        self.archive_path = archive_path  # keep compacted games around for replay
+        self._stop_event = threading.Event()
+        self._compact_lock = threading.Lock()
+        
+    def run(self):
+        while not self._stop_event.wait(self.interval):
+            try:
+                self.compact_now()
+            except Exception:
+                # keep the thread alive, the segment stays on disk for the next attempt
+                print("Outcome compaction failed:", file=sys.stderr)
+                traceback.print_exc()
+    
+    def compact_now(self) -> int:
+        # fold the current log segment into mytable, then drop (or archive) it;
+        # safe to crash anywhere, a segment left behind is finished on the next run without counting twice
+        with self._compact_lock:
+            segment_path = self.outcome_log.rotate()
+            if segment_path is None:
+                return 0
+            with open(segment_path, 'rb') as f:
+                segment = f.read()
+            segment_id = hashlib.sha256(segment).hexdigest()
+            
+            # own connection, sqlite connections can't be shared across threads
+            db = PokemonDatabase(self.db_path)
+            try:
+                bulk_learner = PopularityLearner(db)
+                bulk_learner.learning_rate = self.learner.learning_rate
+                bulk_learner.decay_rate = self.learner.decay_rate
+                bulk_learner.penalty = self.learner.penalty
+                rejected = []
+                outcomes = list(read_outcomes(segment_path, rejected))
+                bulk_learner.apply_outcomes(outcomes, segment_id)
+            finally:
+                db.close()
+            
+            if rejected:
+                # quarantined next to the log rather than dropped
+                self._append_once(self.outcome_log.path + '.rejected', ''.join(rejected).encode('utf-8'))
+            if self.archive_path:
+                self._append_once(self.archive_path, segment)
+            os.remove(segment_path)
+            return len(outcomes)
+    
+    @staticmethod
+    def _append_once(path: str, data: bytes):
+        # skip the append if a crash after the last one left it in place already
+        with open(path, 'ab+') as f:
+            size = f.seek(0, os.SEEK_END)
+            if size >= len(data):
+                f.seek(size - len(data))
+                if f.read(len(data)) == data:
+                    return
+            f.write(data)
+    
+    def stop(self):
+        # stop the background loop and compact whatever is left
+        self._stop_event.set()
+        if self.is_alive():
+            self.join()
+        self.compact_now()
 
 
 class AdaptiveQuestionSelector:
-    def __init__(self):
+    def __init__(self, db: PokemonDatabase = None, flush_every: int = 50):
         # initialize selector
+        # (question_type, question_detail) -> [total_reduction, count]
         self.question_effectiveness = {}  # track question effectiveness stats
+        self.db = db
+        self.flush_every = flush_every  # write dirty stats back after this many results
+        self._dirty = set()
+        
+        if self.db is not None:
+            self._create_table()
+            self.load()
+    
+    def _create_table(self):
+        # Question_Detail has no declared type so generations stay integers
+        self.db.cursor.execute("""
+            CREATE TABLE IF NOT EXISTS question_stats (
+                Question_Type   TEXT NOT NULL,
+                Question_Detail NOT NULL,
+                Total_Reduction REAL NOT NULL,
+                Times_Used      INTEGER NOT NULL,
+                PRIMARY KEY (Question_Type, Question_Detail)
+            ) WITHOUT ROWID
+        """)
+        self.db.commit()
+    
+    def load(self):
+        # read all stats once at startup
+        self.db.cursor.execute(
+            "SELECT Question_Type, Question_Detail, Total_Reduction, Times_Used FROM question_stats"
+        )
+        self.question_effectiveness = {
+            (row[0], row[1]): [row[2], row[3]] for row in self.db.cursor.fetchall()
+        }
+        self._dirty.clear()
+    
+    def flush(self):
+        # batch write every question touched since the last flush, dropping ones an undo took back to nothing
+        if self.db is None or not self._dirty:
+            return
+        self.db.cursor.executemany(
+            "INSERT OR REPLACE INTO question_stats VALUES (?, ?, ?, ?)",
+            [(key[0], key[1], *self.question_effectiveness[key])
+             for key in self._dirty if key in self.question_effectiveness]
+        )
+        self.db.cursor.executemany(
+            "DELETE FROM question_stats WHERE Question_Type = ? AND Question_Detail = ?",
+            [key for key in self._dirty if key not in self.question_effectiveness]
+        )
+        self.db.commit()
+        self._dirty.clear()
         
     def record_question_result(self, question_type: str, question_detail: Any,
                                before_count: int, after_count: int):
-        key = f"{question_type}:{question_detail}"
+        key = (question_type, question_detail)
         
         # calculate reduction ratio
         if before_count > 0:
@@ -117,25 +441,38 @@ class AdaptiveQuestionSelector:
         else:
             reduction_ratio = 0
         
-        # update running average
-        if key not in self.question_effectiveness:
-            self.question_effectiveness[key] = {
-                'total_reduction': reduction_ratio,
-                'count': 1,
-                'avg_reduction': reduction_ratio
-            }
+        # update running totals
+        stats = self.question_effectiveness.get(key)
+        if stats is None:
+            self.question_effectiveness[key] = [reduction_ratio, 1]
         else:
-            stats = self.question_effectiveness[key]
-            stats['total_reduction'] += reduction_ratio
-            stats['count'] += 1
-            stats['avg_reduction'] = stats['total_reduction'] / stats['count']
+            stats[0] += reduction_ratio
+            stats[1] += 1
+        
+        self._dirty.add(key)
+        if len(self._dirty) >= self.flush_every:
+            self.flush()
+    
+    def question_stats(self, question_type: str, question_detail: Any) -> Optional[List[float]]:
+        # a copy of [total_reduction, count], None for a question never recorded
+        stats = self.question_effectiveness.get((question_type, question_detail))
+        return list(stats) if stats is not None else None
+    
+    def restore_question_stats(self, question_type: str, question_detail: Any, stats: Optional[List[float]]):
+        # put back what question_stats returned, e.g. when an answer is undone
+        key = (question_type, question_detail)
+        if stats is None:
+            self.question_effectiveness.pop(key, None)
+        else:
+            self.question_effectiveness[key] = list(stats)
+        self._dirty.add(key)
     
     def get_question_boost(self, question_type: str, question_detail: Any) -> float:
-        key = f"{question_type}:{question_detail}"
+        stats = self.question_effectiveness.get((question_type, question_detail))
         
-        if key in self.question_effectiveness:
+        if stats is not None:
             # return small boost based on average effectiveness
-            avg_reduction = self.question_effectiveness[key]['avg_reduction']
+            avg_reduction = stats[0] / stats[1]
             return avg_reduction * 0.3  # max boost
         
         return 0.0
@@ -147,7 +484,7 @@ class AdaptiveQuestionSelector:
         # sort by effectiveness
         sorted_questions = sorted(
             self.question_effectiveness.items(),
-            key=lambda x: x[1]['avg_reduction'],
+            key=lambda x: x[1][0] / x[1][1],
             reverse=True
         )
         
@@ -155,11 +492,10 @@ class AdaptiveQuestionSelector:
             'total_questions_tracked': len(self.question_effectiveness),
             'top_questions': [
                 {
-                    'question': key,
-                    'avg_reduction': stats['avg_reduction'],
-                    'times_used': stats['count']
+                    'question': f"{key[0]}:{key[1]}",
+                    'avg_reduction': stats[0] / stats[1],
+                    'times_used': stats[1]
                 }
                 for key, stats in sorted_questions[:10]
             ]
         }
-
@@ -1,16 +1,60 @@
+import argparse
 from typing import Dict, Any
 from database_helper import PokemonDatabase
 from game_ai import TwentyQuestionsAI
-from learning import PopularityLearner
+from learning import PopularityLearner, OutcomeLog, OutcomeCompactor, AdaptiveQuestionSelector
+from metrics import MetricsRegistry, instrument
+from name_index import NameIndex
+from sprite_cache import SpriteCache, SpritePrefetcher
+
+OUTCOME_LOG_PATH = "database_files/database/game_outcomes.jsonl"
+OUTCOME_ARCHIVE_PATH = "database_files/database/game_outcomes.archive.jsonl"
 
 
 class TwentyQuestionsGame: 
-    def __init__(self):
-        self.db = PokemonDatabase()
-        self.ai = TwentyQuestionsAI(self.db, use_learning=True)
-        self.learner = PopularityLearner(self.db)
+    def __init__(self, metrics_path: str = None, trace_sql: bool = False,
+                 sprite_dir: str = None, sprite_mirror: str = None, db_path: str = None,
+                 outcome_log_path: str = OUTCOME_LOG_PATH, outcome_archive_path: str = OUTCOME_ARCHIVE_PATH,
+                 speculate: bool = False):
+        self.db = PokemonDatabase(db_path) if db_path else PokemonDatabase()
+        if trace_sql:
+            self.db.enable_tracing()
+        self.question_selector = AdaptiveQuestionSelector(self.db)
+        self.ai = TwentyQuestionsAI(self.db, use_learning=True,
+                                    question_selector=self.question_selector)
+        if speculate:
+            self.ai.enable_speculation()
+        # finished games go to an append-only log, folded into popularity in the background
+        self.outcome_log = OutcomeLog(outcome_log_path)
+        self.learner = PopularityLearner(self.db, outcome_log=self.outcome_log,
+                                         index=self.ai.popularity_index)
+        self.compactor = OutcomeCompactor(self.outcome_log, self.db.db_path, self.learner,
+                                          archive_path=outcome_archive_path)
+        self.compactor.start()
+        # forgiving lookup for the name typed at the end of a game
+        self.names = NameIndex.from_database(self.db)
+        # sprites of the likeliest guesses load in the background once candidates are few
+        self.sprites = None
+        if sprite_dir:
+            self.sprites = SpriteCache(sprite_dir, mirror=sprite_mirror)
+            self.sprite_prefetcher = SpritePrefetcher(self.sprites, self.ai)
+        # timing and per-game counters, only wired in when asked for
+        self.metrics_path = metrics_path
+        self.metrics = None
+        if metrics_path:
+            self.metrics = MetricsRegistry()
+            self.instrumentation = instrument(self.metrics, ai=self.ai, db=self.db, learner=self.learner)
         
     def start(self):
+        # session loop: every game returns here, so the stack stays the same depth however many are played
+        while True:
+            self.show_intro()
+            self.play_game()
+            if not self.play_again():
+                break
+        self.shutdown()
+    
+    def show_intro(self):
         print("=" * 60)
         print("        POKEMON 20 QUESTIONS GAME")
         print("=" * 60)
@@ -23,8 +67,6 @@ class TwentyQuestionsGame:
         if choice == 'stats':
             self.show_stats()
             input("\nPress Enter to start playing...")
-        
-        self.play_game()
     
     def play_game(self):
         self.ai.reset()
@@ -42,13 +84,17 @@ class TwentyQuestionsGame:
                 self.make_final_guess()
                 break
             
-            # Try to guess if 3 or fewer candidates remain
-            if remaining <= 3:
+            # Try to guess if 3 or fewer candidates remain, or no question can split them
+            if remaining <= 3 or self.ai.is_dead_end():
+                if remaining > 3:
+                    print(f"\nNo question I know can tell the remaining {remaining} apart, so I'll guess by popularity.")
+                    separators = self.ai.dead_end_separators()
+                    if separators:
+                        print(f"(They only differ in: {', '.join(separators)})")
                 print(f"\nI'm ready to guess! Remaining candidates: {', '.join([p['Name'] for p in self.ai.get_top_candidates()])}")
                 
                 if self.attempt_guess():
                     # Guess was correct, end the game
-                    self.play_again()
                     return
                 else:
                     # Guess was wrong, re-check remaining count
@@ -67,16 +113,30 @@ class TwentyQuestionsGame:
             
             question = self.ai.format_question(question_type, question_detail)
             print(f"\n{question}")
+            # the next question for either answer gets counted while the player decides
+            self.ai.speculate(question_type, question_detail)
             
             # get answer
+            answer_bool = None
             while True:
-                answer = input("Your answer (yes/no): ").strip().lower()
+                answer = input("Your answer (yes/no, or 'back' to take back the last one): ").strip().lower()
                 if answer in ['yes', 'y', 'no', 'n']:
                     answer_bool = answer in ['yes', 'y']
                     break
+                if answer in ['back', 'undo', 'b']:
+                    if self.ai.can_undo():
+                        break
+                    print("There's nothing to take back yet.")
+                    continue
                 print("Please answer 'yes' or 'no'")
             
+            if answer_bool is None:
+                self.take_back()
+                continue
+            
             self.ai.update_filters(question_type, question_detail, answer_bool)
+            if self.sprites is not None:
+                self.sprite_prefetcher.update()
             
             # progress
             new_remaining = self.ai.get_remaining_count()
@@ -86,8 +146,16 @@ class TwentyQuestionsGame:
         if self.ai.questions_asked >= self.ai.max_questions:
             print(f"\nI've used all {self.ai.max_questions} questions!")
             self.make_final_guess()
-        
-        self.play_again()
+    
+    def take_back(self):
+        # undo the last answer, along with any wrong guesses made after it
+        undone = self.ai.undo()
+        while undone is None and self.ai.can_undo():
+            undone = self.ai.undo()
+        if undone is not None:
+            question_type, question_detail, answer = undone
+            print(f"\nTook back: {self.ai.format_question(question_type, question_detail)} "
+                  f"({'yes' if answer else 'no'})")
     
     def attempt_guess(self) -> bool:
         # attempt guess function
@@ -106,12 +174,15 @@ class TwentyQuestionsGame:
             print(f"\nYay! I guessed {guess['Name']} correctly in {self.ai.questions_asked+1} questions!")
             self._show_pokemon_details(guess)
             # update learning: reward correct guess
-            self.learner.update_popularity(guess['ID'], candidates, was_correct=True)
+            self.learner.update_popularity(guess['ID'], candidates, was_correct=True,
+                                           question_history=self.ai.question_history)
             return True
         else:
             print(f"Not {guess['Name']}.")
             # remove the wrong guess from candidates
-            self.ai.remaining_pokemon = [p for p in self.ai.remaining_pokemon if p['ID'] != guess['ID']]
+            self.ai.eliminate(guess['ID'])
+            if self.sprites is not None:
+                self.sprite_prefetcher.update()
             return False
     
     def make_final_guess(self):
@@ -123,12 +194,10 @@ class TwentyQuestionsGame:
             print(f"\nI've got it.. Is it {guess['Name']}?")
         elif len(candidates) == 0:
             print(f"\nI couldn't narrow it down - no Pokemon match the criteria!")
-            confirm = input("\nWhat Pokemon were you thinking of? ").strip().title()
-            actual_pokemon = self.db.get_pokemon_by_name(confirm)
+            actual_pokemon = self._ask_for_pokemon("\nWhat Pokemon were you thinking of? ")
             if actual_pokemon:
-                print(f"\nFound {confirm}! Let me see its details...")
+                print(f"\nFound {actual_pokemon['Name']}! Let me see its details...")
                 self._show_pokemon_details(actual_pokemon)
-            self.play_again()
             return
         else:
             print(f"\nI have {len(candidates)} possible Pokemon left.")
@@ -146,19 +215,41 @@ class TwentyQuestionsGame:
             print(f"\nYay! I guessed {guess['Name']} correctly in {self.ai.questions_asked+1} questions!")
             self._show_pokemon_details(guess)
             # Update learning: reward correct guess
-            self.learner.update_popularity(guess['ID'], candidates, was_correct=True)
+            self.learner.update_popularity(guess['ID'], candidates, was_correct=True,
+                                           question_history=self.ai.question_history)
         else:
             print(f"\nOh no! I was wrong.")
-            actual = input("What Pokemon were you thinking of? ").strip().title()
-            actual_pokemon = self.db.get_pokemon_by_name(actual)
+            actual_pokemon = self._ask_for_pokemon("What Pokemon were you thinking of? ")
             if actual_pokemon:
-                print(f"\nAh, {actual}! Let me see its details...")
+                print(f"\nAh, {actual_pokemon['Name']}! Let me see its details...")
                 self._show_pokemon_details(actual_pokemon)
                 print(f"\nI'll learn from this for next time!")
                 # update learning: learn from mistake
-                self.learner.update_popularity(actual_pokemon['ID'], candidates, was_correct=False)
+                self.learner.update_popularity(actual_pokemon['ID'], candidates, was_correct=False,
+                                               question_history=self.ai.question_history)
             else:
-                print(f"\nI couldn't find '{actual}' in the database.")
+                print(f"\nI couldn't find that Pokemon in the database.")
+    
+    def _ask_for_pokemon(self, prompt: str) -> Dict[str, Any]:
+        # read a Pokemon name, offering close matches for typos instead of giving up
+        text = input(prompt).strip()
+        while text:
+            match = self.names.lookup(text)
+            if match:
+                return self.db.get_pokemon_by_id(match['ID'])
+            
+            suggestions = self.names.suggest(text)
+            if not suggestions:
+                print(f"I couldn't find '{text}'.")
+                return None
+            print(f"I couldn't find '{text}'. Did you mean:")
+            for i, (pokemon, _) in enumerate(suggestions, 1):
+                print(f"  {i}. {pokemon['Name']}")
+            
+            text = input("Pick a number, type the name again, or press Enter to skip: ").strip()
+            if text.isdigit() and 1 <= int(text) <= len(suggestions):
+                return self.db.get_pokemon_by_id(suggestions[int(text) - 1][0]['ID'])
+        return None
     
     def _show_pokemon_details(self, pokemon: Dict[str, Any]):
         # display detailed information about a Pokemon
@@ -188,6 +279,9 @@ class TwentyQuestionsGame:
         
         if special:
             print(f"Special: {', '.join(special)}")
+        # only if it's already loaded, showing a guess never waits on the network
+        if self.sprites is not None and self.sprites.peek(pokemon['Sprite_Default']) is not None:
+            print(f"Sprite: {self.sprites.path_for(pokemon['Sprite_Default'])}")
         print('-' * 60)
     
     def show_stats(self):
@@ -208,47 +302,96 @@ class TwentyQuestionsGame:
         
         print("\n" + "=" * 60)
     
-    def play_again(self):
+    def play_again(self) -> bool:
         # play again?
         print("\n" + "=" * 60)
         play_again = input("\nPlay again? (yes/no): ").strip().lower()
         
         if play_again in ['yes', 'y']:
             print("\n")
-            self.start()
-        else:
-            print("\nThanks for playing!")
+            return True
+        print("\nThanks for playing!")
+        return False
+    
+    def shutdown(self):
+        # fold any pending games into the database before closing it
+        try:
+            self.question_selector.flush()
+            self.compactor.stop()
+        finally:
+            # a failed compaction leaves its segment for next time, everything still gets closed
+            self.outcome_log.close()
+            if self.db.tracer is not None:
+                print("\nSQL queries this session:")
+                print(self.db.query_report())
+            self.ai.close()
             self.db.close()
+            if self.sprites is not None:
+                self.sprites.close()
+            if self.metrics is not None:
+                self.instrumentation.end_game()
+                self.metrics.dump(self.metrics_path)
+                print(f"Metrics written to {self.metrics_path}")
 
 
 def main():
-    game = TwentyQuestionsGame()
+    parser = argparse.ArgumentParser(description="Pokemon 20 Questions")
+    parser.add_argument('--metrics', default=None, metavar='PATH',
+                        help="record timings and counters, written to PATH on exit (.json or Prometheus text)")
+    parser.add_argument('--trace-sql', action='store_true',
+                        help="time every query by statement shape and print their query plans on exit")
+    parser.add_argument('--sprite-cache', default=None, metavar='DIR',
+                        help="cache sprites in DIR, prefetching the likeliest guesses")
+    parser.add_argument('--sprite-mirror', default=None, metavar='URL',
+                        help="fetch sprites from this host instead, e.g. 'python sprite_cache.py serve'")
+    parser.add_argument('--speculate', action='store_true',
+                        help="work out the next question for both answers while waiting for one")
+    args = parser.parse_args()
+    
+    game = TwentyQuestionsGame(metrics_path=args.metrics, trace_sql=args.trace_sql,
+                               sprite_dir=args.sprite_cache, sprite_mirror=args.sprite_mirror,
+                               speculate=args.speculate)
     try:
         game.start()
     except KeyboardInterrupt:
         print("\n\nGame interrupted. Thanks for playing!")
-        game.db.close()
+        game.shutdown()
     except Exception as e:
         print(f"\nAn error occurred: {e}")
         import traceback
         traceback.print_exc()
-        game.db.close()
+        game.shutdown()
 
 
 if __name__ == "__main__":
     main()
 def main():
-    game = TwentyQuestionsGame()
+    parser = argparse.ArgumentParser(description="Pokemon 20 Questions")
+    parser.add_argument('--metrics', default=None, metavar='PATH',
+                        help="record timings and counters, written to PATH on exit (.json or Prometheus text)")
+    parser.add_argument('--trace-sql', action='store_true',
+                        help="time every query by statement shape and print their query plans on exit")
+    parser.add_argument('--sprite-cache', default=None, metavar='DIR',
+                        help="cache sprites in DIR, prefetching the likeliest guesses")
+    parser.add_argument('--sprite-mirror', default=None, metavar='URL',
+                        help="fetch sprites from this host instead, e.g. 'python sprite_cache.py serve'")
+    parser.add_argument('--speculate', action='store_true',
+                        help="work out the next question for both answers while waiting for one")
+    args = parser.parse_args()
+    
+    game = TwentyQuestionsGame(metrics_path=args.metrics, trace_sql=args.trace_sql,
+                               sprite_dir=args.sprite_cache, sprite_mirror=args.sprite_mirror,
+                               speculate=args.speculate)
     try:
         game.start()
     except KeyboardInterrupt:
         print("\n\nGame interrupted. Thanks for playing!")
-        game.db.close()
+        game.shutdown()
     except Exception as e:
         print(f"\nAn error occurred: {e}")
         import traceback
         traceback.print_exc()
-        game.db.close()
+        game.shutdown()
 
 
 if __name__ == "__main__":
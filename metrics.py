@@ -0,0 +1,233 @@
+import bisect
+import json
+import math
+import threading
+import time
+from typing import Dict, Any, List, Tuple, Callable
+
+# seconds, from sub-millisecond lookups up to a slow full-table load
+TIME_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+CANDIDATE_BUCKETS = (1, 2, 3, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 10000)
+QUESTION_BUCKETS = (1, 3, 5, 8, 10, 12, 15, 20, 25)
+COMMIT_BUCKETS = (0, 1, 2, 5, 10, 25, 50, 100)
+
+
+def _label_key(labels: Dict[str, Any]) -> Tuple:
+    return tuple(sorted((name, str(value)) for name, value in labels.items()))
+
+
+def _format_labels(key: Tuple, extra: Tuple = ()) -> str:
+    pairs = list(key) + list(extra)
+    if not pairs:
+        return ''
+    return '{' + ','.join(f'{name}="{value}"' for name, value in pairs) + '}'
+
+
+def _format_number(value: float) -> str:
+    if value == math.inf:
+        return '+Inf'
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class Counter:
+    def __init__(self, name: str, help_text: str):
+        self.name = name
+        self.help_text = help_text
+        self.values = {}  # label key -> value
+
+    def inc(self, amount: float = 1, **labels):
+        key = _label_key(labels)
+        self.values[key] = self.values.get(key, 0) + amount
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'type': 'counter',
+            'help': self.help_text,
+            'series': [{'labels': dict(key), 'value': value} for key, value in self.values.items()]
+        }
+
+    def to_prometheus(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} counter"]
+        for key, value in self.values.items():
+            lines.append(f"{self.name}{_format_labels(key)} {_format_number(value)}")
+        return lines
+
+
+class Histogram:
+    def __init__(self, name: str, help_text: str, buckets: Tuple = TIME_BUCKETS):
+        self.name = name
+        self.help_text = help_text
+        self.buckets = tuple(sorted(buckets))
+        self.series = {}  # label key -> [per-bucket counts (+Inf last), sum, count]
+
+    def observe(self, value: float, **labels):
+        key = _label_key(labels)
+        series = self.series.get(key)
+        if series is None:
+            series = self.series[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+        # first bucket whose upper bound is >= value, the last slot is +Inf
+        series[0][bisect.bisect_left(self.buckets, value)] += 1
+        series[1] += value
+        series[2] += 1
+
+    def _cumulative(self, counts: List[int]) -> List[Tuple[float, int]]:
+        running = 0
+        cumulative = []
+        for bound, count in zip(self.buckets + (math.inf,), counts):
+            running += count
+            cumulative.append((bound, running))
+        return cumulative
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'type': 'histogram',
+            'help': self.help_text,
+            'series': [{
+                'labels': dict(key),
+                'buckets': {_format_number(bound): count for bound, count in self._cumulative(counts)},
+                'sum': total,
+                'count': count
+            } for key, (counts, total, count) in self.series.items()]
+        }
+
+    def to_prometheus(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} histogram"]
+        for key, (counts, total, count) in self.series.items():
+            for bound, running in self._cumulative(counts):
+                lines.append(f"{self.name}_bucket{_format_labels(key, (('le', _format_number(bound)),))} {running}")
+            lines.append(f"{self.name}_sum{_format_labels(key)} {_format_number(total)}")
+            lines.append(f"{self.name}_count{_format_labels(key)} {count}")
+        return lines
+
+
+class MetricsRegistry:
+    def __init__(self):
+        # in-process registry, metrics are created on first use
+        self.metrics = {}
+        self._lock = threading.Lock()
+
+    def counter(self, name: str, help_text: str = '') -> Counter:
+        with self._lock:
+            if name not in self.metrics:
+                self.metrics[name] = Counter(name, help_text)
+            return self.metrics[name]
+
+    def histogram(self, name: str, help_text: str = '', buckets: Tuple = TIME_BUCKETS) -> Histogram:
+        with self._lock:
+            if name not in self.metrics:
+                self.metrics[name] = Histogram(name, help_text, buckets)
+            return self.metrics[name]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {name: metric.to_dict() for name, metric in sorted(self.metrics.items())}
+
+    def to_json(self) -> str:
+        return json.dumps(self.to_dict(), indent=4)
+
+    def to_prometheus(self) -> str:
+        lines = []
+        for _, metric in sorted(self.metrics.items()):
+            lines.extend(metric.to_prometheus())
+        return '\n'.join(lines) + '\n'
+
+    def dump(self, path: str):
+        # .json gets JSON, anything else the Prometheus text format
+        text = self.to_json() if path.endswith('.json') else self.to_prometheus()
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(text)
+
+
+def _wrap_timed(obj: Any, method_name: str, histogram: Histogram,
+                after: Callable[[Any], None] = None, **labels):
+    # replaces the method on this instance only, so nothing is paid when not instrumented
+    original = getattr(obj, method_name)
+
+    def timed(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return original(*args, **kwargs)
+        finally:
+            histogram.observe(time.perf_counter() - start, **labels)
+            if after is not None:
+                after(obj)
+
+    setattr(obj, method_name, timed)
+
+
+class GameInstrumentation:
+    def __init__(self, registry: MetricsRegistry):
+        # per-game tallies, observed as histograms when the next game starts
+        self.registry = registry
+        self._game_questions = 0
+        self._game_commits = 0
+
+        self.turn_seconds = registry.histogram(
+            'ai_seconds', "Time spent in TwentyQuestionsAI calls")
+        self.db_seconds = registry.histogram(
+            'db_seconds', "Time spent in PokemonDatabase calls")
+        self.learner_seconds = registry.histogram(
+            'learner_seconds', "Time spent in PopularityLearner calls")
+        self.candidates = registry.histogram(
+            'candidates_after_turn', "Candidates left after each answered question", CANDIDATE_BUCKETS)
+        self.questions_per_game = registry.histogram(
+            'questions_per_game', "Questions asked per game", QUESTION_BUCKETS)
+        self.commits_per_game = registry.histogram(
+            'db_commits_per_game', "Database commits per game", COMMIT_BUCKETS)
+        self.questions_total = registry.counter('questions_total', "Questions answered")
+        self.commits_total = registry.counter('db_commits_total', "Database commits")
+        self.games_total = registry.counter('games_total', "Games played")
+
+    def attach_ai(self, ai):
+        for method_name in ('find_best_question', 'make_guess', 'get_top_candidates'):
+            _wrap_timed(ai, method_name, self.turn_seconds, method=method_name)
+        _wrap_timed(ai, 'update_filters', self.turn_seconds, after=self._after_turn, method='update_filters')
+
+        # reset() starts a new game, which is when the previous one gets counted
+        original_reset = ai.reset
+
+        def reset():
+            self.end_game()
+            original_reset()
+
+        ai.reset = reset
+
+    def attach_db(self, db):
+        for method_name in ('get_all_pokemon', 'get_pokemon_by_name', 'filter_pokemon_multi',
+                            'get_evolution_stages'):
+            _wrap_timed(db, method_name, self.db_seconds, method=method_name)
+        _wrap_timed(db, 'commit', self.db_seconds, after=self._after_commit, method='commit')
+
+    def attach_learner(self, learner):
+        for method_name in ('update_popularity', 'get_popularity_stats'):
+            _wrap_timed(learner, method_name, self.learner_seconds, method=method_name)
+
+    def _after_turn(self, ai):
+        self._game_questions += 1
+        self.questions_total.inc()
+        self.candidates.observe(ai.get_remaining_count())
+
+    def _after_commit(self, db):
+        self._game_commits += 1
+        self.commits_total.inc()
+
+    def end_game(self):
+        # nothing to record if no question was asked and nothing was written
+        if not self._game_questions and not self._game_commits:
+            return
+        self.games_total.inc()
+        self.questions_per_game.observe(self._game_questions)
+        self.commits_per_game.observe(self._game_commits)
+        self._game_questions = 0
+        self._game_commits = 0
+
+
+def instrument(registry: MetricsRegistry, ai=None, db=None, learner=None) -> GameInstrumentation:
+    # wraps whichever objects are given, leave it uncalled to run with no overhead
+    instrumentation = GameInstrumentation(registry)
+    if ai is not None:
+        instrumentation.attach_ai(ai)
+    if db is not None:
+        instrumentation.attach_db(db)
+    if learner is not None:
+        instrumentation.attach_learner(learner)
+    return instrumentation
@@ -0,0 +1,133 @@
+import argparse
+import heapq
+import time
+import unicodedata
+from collections import defaultdict
+from typing import Dict, Any, List, Optional, Tuple
+
+# symbols players type for the gendered Nidoran forms
+SYMBOLS = {'♀': 'f', '♂': 'm'}
+
+# how many trigram-ranked names get the exact edit distance check
+SHORTLIST_SIZE = 12
+
+
+def normalize_name(text: str) -> str:
+    # "Mr. Mime", "mr-mime" and "MR MIME" all become "mrmime", accents are dropped too
+    for symbol, letter in SYMBOLS.items():
+        text = text.replace(symbol, letter)
+    text = unicodedata.normalize('NFKD', text)
+    return ''.join(ch for ch in text.lower() if ch.isalnum())
+
+
+def trigrams(key: str) -> List[str]:
+    # padded so short names and first letters still count
+    padded = f"$${key}$"
+    return [padded[i:i + 3] for i in range(len(padded) - 2)]
+
+
+def edit_distance(a: str, b: str, limit: int = None) -> int:
+    # Levenshtein distance, gives up with limit + 1 once every path is past limit
+    if len(a) < len(b):
+        a, b = b, a
+    if limit is not None and len(a) - len(b) > limit:
+        return limit + 1
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        current = [i]
+        for j, cb in enumerate(b, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (ca != cb)))
+        if limit is not None and min(current) > limit:
+            return limit + 1
+        previous = current
+    return previous[-1]
+
+
+class NameIndex:
+    def __init__(self, pokemon: List[Dict[str, Any]]):
+        # normalized names for exact hits, a trigram index to shortlist near misses
+        self.pokemon = {}       # normalized key -> Pokemon
+        self.postings = defaultdict(list)   # trigram -> keys containing it
+
+        for p in pokemon:
+            key = normalize_name(p['Name'])
+            if key and key not in self.pokemon:
+                self.pokemon[key] = p
+
+        # "deoxys" for "Deoxys-normal": the part before a form suffix, if no other Pokemon shares it
+        bases = defaultdict(list)
+        for p in self.pokemon.values():
+            if '-' in p['Name']:
+                bases[normalize_name(p['Name'].split('-', 1)[0])].append(p)
+        for base, forms in bases.items():
+            if len(forms) == 1 and base and base not in self.pokemon:
+                self.pokemon[base] = forms[0]
+
+        for key in self.pokemon:
+            for gram in set(trigrams(key)):
+                self.postings[gram].append(key)
+
+    @classmethod
+    def from_database(cls, db) -> 'NameIndex':
+        db.cursor.execute("SELECT ID, Name FROM mytable")
+        return cls([dict(row) for row in db.cursor.fetchall()])
+
+    def __len__(self) -> int:
+        return len(self.pokemon)
+
+    def lookup(self, text: str) -> Optional[Dict[str, Any]]:
+        # exact match once case, spacing and punctuation are ignored
+        return self.pokemon.get(normalize_name(text))
+
+    def suggest(self, text: str, n: int = 5, max_distance: int = None) -> List[Tuple[Dict[str, Any], int]]:
+        # closest names as (Pokemon, edit distance), best first; an exact hit comes back alone
+        key = normalize_name(text)
+        if not key:
+            return []
+        if key in self.pokemon:
+            return [(self.pokemon[key], 0)]
+        if max_distance is None:
+            max_distance = max(2, len(key) // 3)
+
+        grams = trigrams(key)
+        shared = defaultdict(int)
+        for gram in set(grams):
+            for candidate in self.postings.get(gram, ()):
+                shared[candidate] += 1
+        shortlist = heapq.nlargest(SHORTLIST_SIZE, shared.items(), key=lambda item: item[1])
+
+        ranked = {}
+        for candidate, overlap in shortlist:
+            distance = edit_distance(key, candidate, max_distance)
+            if distance > max_distance:
+                continue
+            p = self.pokemon[candidate]
+            # a base name and its full form point at the same Pokemon, keep the closer one
+            if p['ID'] not in ranked or (distance, -overlap) < ranked[p['ID']][:2]:
+                ranked[p['ID']] = (distance, -overlap, p['Name'], p)
+        return [(p, distance) for distance, _, _, p in sorted(ranked.values(), key=lambda r: r[:3])[:n]]
+
+
+def main():
+    from database_helper import PokemonDatabase
+
+    parser = argparse.ArgumentParser(description="Look up Pokemon names the way the end-of-game prompt does")
+    parser.add_argument('names', nargs='+')
+    parser.add_argument('--db', default="database_files/database/pokemon_database.db")
+    parser.add_argument('-n', type=int, default=5)
+    args = parser.parse_args()
+
+    db = PokemonDatabase(args.db)
+    index = NameIndex.from_database(db)
+    db.close()
+
+    for name in args.names:
+        start = time.perf_counter()
+        suggestions = index.suggest(name, args.n)
+        elapsed = (time.perf_counter() - start) * 1000
+        found = ', '.join(f"{p['Name']} ({distance})" for p, distance in suggestions) or 'no match'
+        print(f"{name!r}: {found}  [{elapsed:.3f} ms]")
+
+
+if __name__ == "__main__":
+    main()
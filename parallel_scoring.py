@@ -0,0 +1,182 @@
+import os
+import threading
+from array import array
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from itertools import compress
+from multiprocessing import shared_memory
+from typing import Dict, Any, List, Tuple, Set
+from question_families import QuestionRegistry, BooleanFamily
+
+# below this many candidates a turn is scored in-process, shipping work to the pool costs more
+DEFAULT_MIN_CANDIDATES = 10000
+
+# worker-side views of the shared catalog, set up once per process by _attach_worker
+_worker = {}
+
+
+class ColumnarCatalog:
+    def __init__(self, pokemon: List[Dict[str, Any]], questions: QuestionRegistry):
+        # every column the question families read, dictionary-encoded into one shared memory block
+        self.size = len(pokemon)
+        self.row_of = {p['ID']: row for row, p in enumerate(pokemon)}
+        self.columns = []
+        for family in questions:
+            for column in family.columns:
+                if column not in self.columns:
+                    self.columns.append(column)
+
+        self.values = {}   # column -> [value for each code]
+        encoded = {}
+        for column in self.columns:
+            codes = {}
+            self.values[column] = []
+            column_codes = []
+            for p in pokemon:
+                value = p.get(column)
+                code = codes.get(value)
+                if code is None:
+                    code = codes[value] = len(self.values[column])
+                    self.values[column].append(value)
+                column_codes.append(code)
+            encoded[column] = array('H' if len(codes) <= 0xFFFF else 'I', column_codes)
+
+        # layout: column -> (byte offset, typecode), followed by one byte per row for the candidate mask
+        self.layout = {}
+        offset = 0
+        for column in self.columns:
+            self.layout[column] = (offset, encoded[column].typecode)
+            offset += len(encoded[column]) * encoded[column].itemsize
+        self.mask_offset = offset
+
+        self.shm = shared_memory.SharedMemory(create=True, size=max(1, offset + self.size))
+        for column in self.columns:
+            start, _ = self.layout[column]
+            data = encoded[column].tobytes()
+            self.shm.buf[start:start + len(data)] = data
+
+    def write_mask(self, candidates: List[Dict[str, Any]]) -> bool:
+        # flag the candidate rows for the workers, False if a candidate isn't in the catalog
+        mask = bytearray(self.size)
+        row_of = self.row_of
+        for p in candidates:
+            row = row_of.get(p['ID'])
+            if row is None:
+                return False
+            mask[row] = 1
+        self.shm.buf[self.mask_offset:self.mask_offset + self.size] = mask
+        return True
+
+    def close(self):
+        self.shm.close()
+        self.shm.unlink()
+
+
+def _attach_worker(shm_name: str, size: int, layout: Dict[str, Tuple[int, str]], mask_offset: int,
+                   family_columns: List[Tuple[str, Tuple[str, ...], bool]]):
+    shm = shared_memory.SharedMemory(name=shm_name)
+    columns = {}
+    for column, (offset, typecode) in layout.items():
+        itemsize = array(typecode).itemsize
+        columns[column] = shm.buf[offset:offset + size * itemsize].cast(typecode)
+    _worker.update({
+        'shm': shm,
+        'columns': columns,
+        'mask': shm.buf[mask_offset:mask_offset + size],
+        'families': family_columns
+    })
+
+
+def _count_slice(start: int, end: int, skip_columns: Set[str]) -> Dict[str, Counter]:
+    # code histograms for the candidate rows in [start, end), all C-level compress/Counter passes
+    columns = _worker['columns']
+    mask = _worker['mask'][start:end]
+    counts = {}
+    for name, family_columns, boolean in _worker['families']:
+        if boolean:
+            counts[name] = {column: Counter(compress(columns[column][start:end], mask))
+                            for column in family_columns if column not in skip_columns}
+        elif len(family_columns) == 1:
+            counts[name] = Counter(compress(columns[family_columns[0]][start:end], mask))
+        else:
+            counts[name] = Counter(zip(*(compress(columns[column][start:end], mask)
+                                         for column in family_columns)))
+    return counts
+
+
+class ParallelScorer:
+    def __init__(self, pokemon: List[Dict[str, Any]], questions: QuestionRegistry,
+                 workers: int = None, min_candidates: int = DEFAULT_MIN_CANDIDATES):
+        # persistent pool sharing one read-only catalog, per turn only the row mask changes
+        self.questions = questions
+        self.workers = workers or os.cpu_count() or 1
+        self.min_candidates = min_candidates
+        self.catalog = ColumnarCatalog(pokemon, questions)
+        self._lock = threading.Lock()  # one turn at a time owns the shared mask
+        family_columns = [(family.name, family.columns, isinstance(family, BooleanFamily))
+                          for family in questions]
+        self.pool = ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=_attach_worker,
+            initargs=(self.catalog.shm.name, self.catalog.size, self.catalog.layout,
+                      self.catalog.mask_offset, family_columns)
+        )
+
+    def should_handle(self, candidates: List[Dict[str, Any]]) -> bool:
+        return len(candidates) >= self.min_candidates
+
+    def count_histograms(self, candidates: List[Dict[str, Any]],
+                         asked: Dict[str, Set[Any]]) -> Dict[str, Dict[Any, int]]:
+        # same result as TwentyQuestionsAI.count_histograms, or None if this catalog can't answer
+        skip_columns = set()
+        for family in self.questions:
+            if isinstance(family, BooleanFamily):
+                skip_columns.update(asked.get(family.name, ()))
+
+        size = self.catalog.size
+        chunk = -(-size // self.workers)
+        with self._lock:
+            if not self.catalog.write_mask(candidates):
+                return None
+            futures = [self.pool.submit(_count_slice, start, min(start + chunk, size), skip_columns)
+                       for start in range(0, size, chunk)]
+            partials = [future.result() for future in futures]
+
+        return {family.name: self._decode(family, [partial[family.name] for partial in partials],
+                                          asked.get(family.name, ()))
+                for family in self.questions}
+
+    def _decode(self, family, partials: List[Any], asked: Set[Any]) -> Dict[Any, int]:
+        # merge the workers' code counts and turn them back into {detail: yes count}
+        values = self.catalog.values
+        if isinstance(family, BooleanFamily):
+            counts = {}
+            for column in family.columns:
+                if column in asked:
+                    continue
+                codes = Counter()
+                for partial in partials:
+                    codes.update(partial.get(column, {}))
+                n = sum(count for code, count in codes.items() if values[column][code] == 'true')
+                if n:
+                    counts[column] = n
+            return counts
+
+        merged = Counter()
+        for partial in partials:
+            merged.update(partial)
+        counts = Counter()
+        if len(family.columns) == 1:
+            column_values = values[family.columns[0]]
+            for code, n in merged.items():
+                counts[column_values[code]] += n
+        else:
+            for combination, n in merged.items():
+                decoded = {values[column][code] for column, code in zip(family.columns, combination)}
+                for value in decoded:
+                    counts[value] += n
+        return {value: n for value, n in counts.items() if value and value not in asked}
+
+    def close(self):
+        self.pool.shutdown()
+        self.catalog.close()
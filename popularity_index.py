@@ -0,0 +1,96 @@
+import bisect
+import math
+from typing import Dict, Any, List, Iterable
+
+
+class PopularityIndex:
+    def __init__(self, pokemon: List[Dict[str, Any]]):
+        # popularity-ordered index of every Pokemon, kept up to date as learning happens
+        # values are stored relative to a shared decay scale so decaying everyone is O(1)
+        self._scale = 1.0
+        self._stored = {p['ID']: p.get('Popularity') or 0 for p in pokemon}
+        self._names = {p['ID']: p.get('Name') for p in pokemon}
+        self._stored_sum = math.fsum(self._stored.values())  # running total for the average
+        # sorted (-stored popularity, ID): most popular first, lowest ID wins ties
+        self._order = sorted((-value, pid) for pid, value in self._stored.items())
+        self._rank = {}
+        self._rank_version = -1
+        self.version = 0  # bumped whenever the order changes
+
+    def __contains__(self, pokemon_id: int) -> bool:
+        return pokemon_id in self._stored
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def popularity(self, pokemon_id: int) -> float:
+        return self._stored[pokemon_id] * self._scale
+
+    def adjust(self, pokemon_id: int, new_popularity: float):
+        # move one Pokemon to its new position, O(log n) search + one memmove
+        old_key = (-self._stored[pokemon_id], pokemon_id)
+        del self._order[bisect.bisect_left(self._order, old_key)]
+
+        stored = new_popularity / self._scale
+        self._stored_sum += stored - self._stored[pokemon_id]
+        self._stored[pokemon_id] = stored
+        bisect.insort(self._order, (-stored, pokemon_id))
+        self.version += 1
+
+    def decay(self, exclude_ids: Iterable[int], decay_rate: float):
+        # decay everyone except exclude_ids without touching the other entries
+        exclude_ids = [pid for pid in set(exclude_ids) if pid in self._stored]
+        self._scale *= decay_rate
+        for pid in exclude_ids:
+            self.adjust(pid, self._stored[pid] * self._scale / decay_rate)
+
+        if self._scale < 1e-100:
+            # fold the scale back in before it underflows
+            self._stored = {pid: value * self._scale for pid, value in self._stored.items()}
+            self._order = [(key * self._scale, pid) for key, pid in self._order]
+            self._stored_sum = math.fsum(self._stored.values())
+            self._scale = 1.0
+        self.version += 1
+
+    def _ranks(self) -> Dict[int, int]:
+        # ID -> position in popularity order, rebuilt lazily after the order changes
+        if self._rank_version != self.version:
+            self._rank = {pid: rank for rank, (_, pid) in enumerate(self._order)}
+            self._rank_version = self.version
+        return self._rank
+
+    def candidate_mask(self, pokemon_ids: Iterable[int]) -> int:
+        # bitmask with bit r set when the r-th most popular Pokemon is a candidate
+        ranks = self._ranks()
+        mask = 0
+        for pid in pokemon_ids:
+            mask |= 1 << ranks[pid]
+        return mask
+
+    def full_mask(self) -> int:
+        return (1 << len(self._order)) - 1
+
+    def top_k(self, mask: int, k: int) -> List[int]:
+        # IDs of the k most popular candidates in mask, lowest set bits first
+        top = []
+        while mask and len(top) < k:
+            lowest = mask & -mask
+            top.append(self._order[lowest.bit_length() - 1][1])
+            mask ^= lowest
+        return top
+
+    def stats(self, top_n: int = 10) -> Dict[str, Any]:
+        # same shape as the full-table query in PopularityLearner, without scanning anything
+        if not self._order:
+            return {'min_pop': None, 'max_pop': None, 'avg_pop': None, 'total': 0, 'top_pokemon': []}
+
+        return {
+            'min_pop': -self._order[-1][0] * self._scale,
+            'max_pop': -self._order[0][0] * self._scale,
+            'avg_pop': self._stored_sum * self._scale / len(self._order),
+            'total': len(self._order),
+            'top_pokemon': [
+                {'name': self._names[pid], 'popularity': -key * self._scale}
+                for key, pid in self._order[:top_n]
+            ]
+        }
@@ -0,0 +1,148 @@
+from collections import Counter, defaultdict
+from operator import itemgetter
+from typing import Dict, Any, List, Tuple, Iterable, Iterator, Set
+
+# yes/no wording for the boolean columns, anything else falls back to "Is the X true?"
+ATTRIBUTE_TEMPLATES = {
+    'Lengendary': "Is it a legendary Pokemon?",
+    'Mythical': "Is it a mythical Pokemon?",
+    'Baby': "Is it a baby Pokemon?",
+    'Fossile': "Is it a fossil Pokemon?",
+    'Starter': "Is it a starter Pokemon?",
+    'Mega_Evolve': "Can it mega evolve?",
+    'Gigantamax': "Can it Gigantamax?",
+    'Evolves': "Does it evolve into another Pokemon?",
+    'Evolves_from_stone': "Is it evolved from a stone? (e.g. Raichu = yes)",
+    'Evolves_from_trading': "Does it evolve through trading? (e.g. Gengar = yes)"
+}
+
+STAGE_TEMPLATES = {
+    1: "Is it a basic Pokemon that hasn't evolved from anything?",
+    2: "Is it a first evolution? (e.g. Ivysaur = yes)",
+    3: "Is it a second evolution? (e.g. Venusaur = yes)"
+}
+
+# families asked as "is it <value>?", in the order they're tried:
+# (question type, columns any of which may hold the value, template, per-value templates)
+VALUE_FAMILIES = [
+    ('type', ('Type_1', 'Type_2'), "Is it a {}-type Pokemon?", None),
+    ('color', ('Primay_Color',), "Is it {} in color? (Pokedex color)", None),
+    ('region', ('Region',), "Is it from the {} region?", None),
+    ('generation', ('Generation',), "Is it from Generation {}?", None),
+    ('stage', ('Evolution_Stage',), "Is it at evolution stage {}?", STAGE_TEMPLATES),
+]
+
+
+class QuestionFamily:
+    def __init__(self, name: str, columns: Tuple[str, ...], template: str,
+                 detail_templates: Dict[Any, str] = None):
+        # one kind of question, e.g. 'color' asks "is Primay_Color == value?" for each value
+        self.name = name
+        self.columns = tuple(columns)
+        self.template = template
+        self.detail_templates = detail_templates or {}
+        self._getter = itemgetter(*self.columns)
+
+    def matches(self, pokemon: Dict[str, Any], detail: Any) -> bool:
+        return any(pokemon.get(column) == detail for column in self.columns)
+
+    def count(self, candidates: List[Dict[str, Any]], asked: Set[Any]) -> Dict[Any, int]:
+        # candidates matching each value not yet asked about, one C-level counting pass
+        if len(self.columns) == 1:
+            counts = Counter(map(self._getter, candidates))
+        else:
+            # count value combinations first, then credit each distinct value once per row
+            counts = Counter()
+            for combination, n in Counter(map(self._getter, candidates)).items():
+                for value in set(combination):
+                    counts[value] += n
+        return {value: n for value, n in counts.items() if value and value not in asked}
+
+    def popularity(self, candidates: List[Dict[str, Any]], asked: Set[Any]) -> Dict[Any, float]:
+        # learned popularity of the candidates matching each value, credited once per row like count
+        sums = defaultdict(float)
+        getter = self._getter
+        for p in candidates:
+            weight = p['Popularity']
+            if weight:
+                values = getter(p)
+                for value in (set(values) if len(self.columns) > 1 else (values,)):
+                    sums[value] += weight
+        return {value: total for value, total in sums.items() if value and value not in asked}
+
+    def filter(self, candidates: List[Dict[str, Any]], detail: Any, answer: bool) -> List[Dict[str, Any]]:
+        if len(self.columns) == 1:
+            column = self.columns[0]
+            if answer:
+                return [p for p in candidates if p[column] == detail]
+            return [p for p in candidates if p[column] != detail]
+        return [p for p in candidates if self.matches(p, detail) == answer]
+
+    def format(self, detail: Any) -> str:
+        return self.detail_templates.get(detail, self.template.format(detail))
+
+
+class BooleanFamily(QuestionFamily):
+    def __init__(self, name: str, columns: Iterable[str], detail_templates: Dict[Any, str] = None):
+        # one question per 'true'/'false' column, the detail is the column name
+        super().__init__(name, tuple(columns), "Is the {} true?", detail_templates)
+
+    def matches(self, pokemon: Dict[str, Any], detail: Any) -> bool:
+        return pokemon[detail] == 'true'
+
+    def count(self, candidates: List[Dict[str, Any]], asked: Set[Any]) -> Dict[Any, int]:
+        # 'true' count per column, columns with no 'true' left can't split anything
+        counts = {}
+        for column in self.columns:
+            if column not in asked:
+                n = Counter(map(itemgetter(column), candidates))['true']
+                if n:
+                    counts[column] = n
+        return counts
+
+    def popularity(self, candidates: List[Dict[str, Any]], asked: Set[Any]) -> Dict[Any, float]:
+        sums = {}
+        for column in self.columns:
+            if column not in asked:
+                total = sum(p['Popularity'] for p in candidates if p['Popularity'] and p[column] == 'true')
+                if total:
+                    sums[column] = total
+        return sums
+
+    def filter(self, candidates: List[Dict[str, Any]], detail: Any, answer: bool) -> List[Dict[str, Any]]:
+        value = 'true' if answer else 'false'
+        return [p for p in candidates if p[detail] == value]
+
+
+class QuestionRegistry:
+    def __init__(self, families: List[QuestionFamily]):
+        # question families by question type, iterated in the order questions are tried
+        self.families = {family.name: family for family in families}
+
+    @classmethod
+    def from_columns(cls, boolean_columns: Iterable[str]) -> 'QuestionRegistry':
+        families = [BooleanFamily('attribute', boolean_columns, ATTRIBUTE_TEMPLATES)]
+        for name, columns, template, detail_templates in VALUE_FAMILIES:
+            families.append(QuestionFamily(name, columns, template, detail_templates))
+        return cls(families)
+
+    @classmethod
+    def from_database(cls, db) -> 'QuestionRegistry':
+        # every 'true'/'false' column in the schema becomes a yes/no attribute question
+        return cls.from_columns(db.get_queryable_attributes())
+
+    def __getitem__(self, name: str) -> QuestionFamily:
+        return self.families[name]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.families
+
+    def __iter__(self) -> Iterator[QuestionFamily]:
+        return iter(self.families.values())
+
+    def names(self) -> List[str]:
+        return list(self.families)
+
+
+# the stock families, for answering questions without a database at hand
+DEFAULT_REGISTRY = QuestionRegistry.from_columns(ATTRIBUTE_TEMPLATES)
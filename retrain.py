@@ -0,0 +1,78 @@
+import argparse
+import time
+from typing import Dict, List, Iterator, Any
+from database_helper import PokemonDatabase
+from learning import PopularityLearner, read_outcomes, fold_outcomes
+
+
+def iter_logged_games(log_paths: List[str]) -> Iterator[Dict[str, Any]]:
+    # logs are replayed in the order given (archive first, then the live log)
+    for path in log_paths:
+        yield from read_outcomes(path)
+
+
+def retrain_popularity(db: PokemonDatabase, log_paths: List[str],
+                       learning_rate: float, decay_rate: float, penalty: float,
+                       from_current: bool = False, dry_run: bool = False) -> Dict[str, Any]:
+    # recompute the popularity vector from logged games and write it back in one transaction
+    db.cursor.execute("SELECT ID, Popularity FROM mytable")
+    rows = db.cursor.fetchall()
+    if from_current:
+        popularity = {row[0]: row[1] or 0 for row in rows}
+    else:
+        popularity = {row[0]: 0.0 for row in rows}
+
+    games = 0
+
+    def counted(outcomes):
+        nonlocal games
+        for outcome in outcomes:
+            games += 1
+            yield outcome
+
+    start = time.perf_counter()
+    retrained = fold_outcomes(popularity, counted(iter_logged_games(log_paths)),
+                              learning_rate, decay_rate, penalty)
+    elapsed = time.perf_counter() - start
+
+    if not dry_run:
+        db.cursor.executemany(
+            "UPDATE mytable SET Popularity = ? WHERE ID = ?",
+            [(value, pid) for pid, value in retrained.items()]
+        )
+        db.commit()
+
+    top = sorted(retrained.items(), key=lambda item: (-item[1], item[0]))[:10]
+    return {'games': games, 'seconds': elapsed, 'top': top}
+
+
+def main():
+    defaults = PopularityLearner(None)
+
+    parser = argparse.ArgumentParser(description="Recompute Pokemon popularity from logged games")
+    parser.add_argument('logs', nargs='+', help="outcome log files, oldest first")
+    parser.add_argument('--db', default="database_files/database/pokemon_database.db")
+    parser.add_argument('--learning-rate', type=float, default=defaults.learning_rate)
+    parser.add_argument('--decay-rate', type=float, default=defaults.decay_rate)
+    parser.add_argument('--penalty', type=float, default=defaults.penalty)
+    parser.add_argument('--from-current', action='store_true',
+                        help="start from the stored popularity instead of zero")
+    parser.add_argument('--dry-run', action='store_true', help="don't write the result back")
+    args = parser.parse_args()
+
+    db = PokemonDatabase(args.db)
+    try:
+        result = retrain_popularity(db, args.logs, args.learning_rate, args.decay_rate,
+                                    args.penalty, args.from_current, args.dry_run)
+    finally:
+        db.close()
+
+    rate = result['games'] / result['seconds'] if result['seconds'] else 0
+    print(f"Replayed {result['games']} games in {result['seconds']:.2f}s ({rate:,.0f} games/s)")
+    print("\nTop 10 after retraining:")
+    for i, (pid, value) in enumerate(result['top'], 1):
+        print(f"  {i:2d}. #{pid:<5d} {value:.4f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,236 @@
+import heapq
+import multiprocessing
+from collections import Counter, defaultdict
+from typing import Dict, Any, List, Tuple, Set
+from database_helper import PokemonDatabase
+from game_ai import TwentyQuestionsAI
+from learning import AdaptiveQuestionSelector
+from question_families import QuestionRegistry
+
+
+def _popularity_order(p: Dict[str, Any]) -> Tuple[float, int]:
+    # most popular first, lowest ID wins ties (same order as PopularityIndex)
+    return (-(p.get('Popularity') or 0), p['ID'])
+
+
+def _shard_main(connection, db_path: str, id_range: Tuple[int, int], boolean_columns: List[str]):
+    # one worker process owning the rows with IDs in id_range, answering coordinator commands
+    low, high = id_range
+    db = PokemonDatabase(db_path)
+    db.cursor.execute("SELECT * FROM mytable WHERE ID BETWEEN ? AND ?", (low, high))
+    rows = [dict(row) for row in db.cursor.fetchall()]
+    # stages need the whole evolution chain, so the coordinator works them out and sends this shard's
+    stages = connection.recv()
+    for p in rows:
+        p['Evolution_Stage'] = stages.get(p['ID'])
+    del stages
+    by_id = {p['ID']: p for p in rows}
+
+    questions = QuestionRegistry.from_columns(boolean_columns)
+    remaining = rows
+    previous = []  # earlier remaining lists, popped by 'undo'
+
+    while True:
+        command, args = connection.recv()
+
+        if command == 'count':
+            asked, = args
+            histograms = {family.name: family.count(remaining, asked.get(family.name, ()))
+                          for family in questions}
+            popular = [p for p in remaining if p['Popularity']]
+            popularity = {family.name: family.popularity(popular, asked.get(family.name, ()))
+                          for family in questions}
+            connection.send((histograms, len(remaining), sum(p['Popularity'] for p in popular), popularity))
+        elif command == 'filter':
+            question_type, question_detail, answer = args
+            previous.append(remaining)
+            remaining = questions[question_type].filter(remaining, question_detail, answer)
+            connection.send(len(remaining))
+        elif command == 'eliminate':
+            pokemon_id, = args
+            previous.append(remaining)
+            remaining = [p for p in remaining if p['ID'] != pokemon_id]
+            connection.send(len(remaining))
+        elif command == 'undo':
+            remaining = previous.pop()
+            connection.send(len(remaining))
+        elif command == 'reset':
+            # pick up popularity learned since the last game
+            db.cursor.execute("SELECT ID, Popularity FROM mytable WHERE ID BETWEEN ? AND ?", (low, high))
+            for pokemon_id, popularity in db.cursor.fetchall():
+                if pokemon_id in by_id:
+                    by_id[pokemon_id]['Popularity'] = popularity
+            remaining = rows
+            previous = []
+            connection.send(len(remaining))
+        elif command == 'top':
+            n, = args
+            connection.send(heapq.nsmallest(n, remaining, key=_popularity_order))
+        elif command == 'head':
+            n, = args
+            connection.send(remaining[:n])
+        elif command == 'rows':
+            connection.send(remaining)
+        elif command == 'close':
+            break
+
+    db.close()
+    connection.close()
+
+
+class ShardedQuestionsAI(TwentyQuestionsAI):
+    # Same interface as TwentyQuestionsAI, but the rows live in worker processes split by ID range;
+    # this process only keeps per-game bookkeeping and merges the shards' partial histograms.
+    # The shards already count in parallel, so enable_parallel_scoring and enable_speculation do
+    # nothing here, and without an in-process class index is_dead_end never reports a dead end.
+
+    def __init__(self, db: PokemonDatabase, shards: int = 2, use_learning: bool = True,
+                 question_selector: AdaptiveQuestionSelector = None):
+        # the base constructor would load every row into this process, only its session state is shared
+        self._init_session(db, use_learning, question_selector)
+        self.popularity_index = None  # popularity lives in the shards, the learner uses the table
+
+        db.cursor.execute("SELECT MIN(ID), MAX(ID) FROM mytable")
+        low, high = db.cursor.fetchone()
+        self.id_ranges = self._split_ids(low or 0, high or 0, shards)
+
+        stages = db.get_evolution_stages()
+        self._connections = []
+        self._processes = []
+        for id_range in self.id_ranges:
+            parent_end, child_end = multiprocessing.Pipe()
+            process = multiprocessing.Process(
+                target=_shard_main,
+                args=(child_end, db.db_path, id_range, self.questions['attribute'].columns),
+                daemon=True
+            )
+            process.start()
+            child_end.close()
+            parent_end.send({pokemon_id: stage for pokemon_id, stage in stages.items()
+                             if id_range[0] <= pokemon_id <= id_range[1]})
+            self._connections.append(parent_end)
+            self._processes.append(process)
+        del stages
+
+        self._remaining_count = sum(self._scatter('reset'))
+
+    @staticmethod
+    def _split_ids(low: int, high: int, shards: int) -> List[Tuple[int, int]]:
+        # contiguous, roughly equal ID ranges covering [low, high]
+        shards = max(1, shards)
+        width = (high - low + 1) / shards
+        bounds = [low + round(width * i) for i in range(shards)] + [high + 1]
+        return [(bounds[i], bounds[i + 1] - 1) for i in range(shards) if bounds[i] <= bounds[i + 1] - 1]
+
+    def _scatter(self, command: str, *args) -> List[Any]:
+        # send to every shard first so they work at the same time, then gather in shard order
+        for connection in self._connections:
+            connection.send((command, args))
+        return [connection.recv() for connection in self._connections]
+
+    @property
+    def remaining_pokemon(self) -> List[Dict[str, Any]]:
+        # gathers every remaining row, fine for small sets or one-off use
+        rows = []
+        for shard_rows in self._scatter('rows'):
+            rows.extend(shard_rows)
+        return rows
+
+    def reset(self):
+        self.current_filters = {}
+        self.questions_asked = 0
+        self.question_history = []
+        self.asked = {name: set() for name in self.questions.names()}
+        self._turns = []
+        self._remaining_count = sum(self._scatter('reset'))
+
+    def get_remaining_count(self) -> int:
+        return self._remaining_count
+
+    def _snapshot(self) -> int:
+        # the shards keep their own earlier candidate lists
+        return self._remaining_count
+
+    def _restore(self, snapshot: int):
+        self._remaining_count = sum(self._scatter('undo'))
+
+    def eliminate(self, pokemon_id: int):
+        self._turns.append((self._snapshot(), None, None, None))
+        self._remaining_count = sum(self._scatter('eliminate', pokemon_id))
+
+    def count_histograms(self, candidates, asked: Dict[str, Set[Any]]) -> Dict[str, Dict[Any, int]]:
+        # shards count their own remaining rows, candidates is ignored
+        return self._gather_histograms(asked)[0]
+
+    def _gather_histograms(self, asked: Dict[str, Set[Any]]) -> Tuple[Dict[str, Dict[Any, int]], int,
+                                                                       Tuple[float, Dict[str, Dict[Any, float]]]]:
+        # popularity sums add up across shards the same way the counts do
+        merged = {name: Counter() for name in self.questions.names()}
+        merged_popularity = {name: defaultdict(float) for name in self.questions.names()}
+        total = 0
+        total_popularity = 0
+        for histograms, count, shard_popularity, popularity in self._scatter('count', asked):
+            for name, counts in histograms.items():
+                merged[name].update(counts)
+            for name, sums in popularity.items():
+                for value, weight in sums.items():
+                    merged_popularity[name][value] += weight
+            total += count
+            total_popularity += shard_popularity
+        return merged, total, (total_popularity, merged_popularity)
+
+    def find_best_question(self) -> Tuple[str, Any]:
+        if not self._remaining_count:
+            return None, None
+        histograms, total, popularity = self._gather_histograms(self.asked)
+        learned = self.use_learning and popularity[0] > 0
+        return self.score_histograms(total, histograms, popularity if learned else None)
+
+    def _filter_candidates(self, question_type: str, question_detail: Any, answer: bool) -> Tuple[int, int]:
+        before_count = self._remaining_count
+        self._remaining_count = sum(self._scatter('filter', question_type, question_detail, answer))
+        return before_count, self._remaining_count
+
+    def make_guess(self) -> Dict[str, Any]:
+        candidates = self.get_top_candidates(1)
+        return candidates[0] if candidates else None
+
+    def get_top_candidates(self, n: int = 5) -> List[Dict[str, Any]]:
+        if self.use_learning:
+            # each shard's local top n, merged
+            tops = []
+            for shard_top in self._scatter('top', n):
+                tops.extend(shard_top)
+            return heapq.nsmallest(n, tops, key=_popularity_order)
+        heads = []
+        for shard_head in self._scatter('head', n):
+            heads.extend(shard_head)
+        return heads[:n]
+
+    def is_dead_end(self) -> bool:
+        # classes aren't tracked across shards, questions run until none is left
+        return False
+
+    def dead_end_separators(self) -> List[str]:
+        return []
+
+    def enable_parallel_scoring(self, workers: int = None, min_candidates: int = 0):
+        # the shards are already the parallel scorer
+        return None
+
+    def enable_speculation(self):
+        # each turn is already a parallel count across the shards
+        return None
+
+    def close(self):
+        for connection in self._connections:
+            try:
+                connection.send(('close', ()))
+            except (BrokenPipeError, OSError):
+                pass
+        for process in self._processes:
+            process.join(timeout=5)
+        for connection in self._connections:
+            connection.close()
+        self._connections = []
+        self._processes = []
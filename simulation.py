@@ -0,0 +1,102 @@
+import argparse
+import random
+import statistics
+from typing import Dict, Any, List
+from database_helper import PokemonDatabase
+from game_ai import TwentyQuestionsAI, pokemon_matches
+from learning import AdaptiveQuestionSelector
+
+
+def play_simulated_game(ai: TwentyQuestionsAI, target: Dict[str, Any]) -> Dict[str, Any]:
+    # plays one game the same way main.py does, answering truthfully for target
+    ai.reset()
+    guesses = 0
+    solved = False
+
+    while ai.questions_asked < ai.max_questions:
+        remaining = ai.get_remaining_count()
+
+        if remaining <= 1:
+            break
+
+        if remaining <= 3:
+            guess = ai.get_top_candidates(3)[0]
+            guesses += 1
+            if guess['ID'] == target['ID']:
+                solved = True
+                break
+            ai.eliminate(guess['ID'])
+            continue
+
+        question_type, question_detail = ai.ask_question()
+        if question_type is None:
+            break
+
+        ai.update_filters(question_type, question_detail,
+                          pokemon_matches(target, question_type, question_detail))
+
+    if not solved:
+        # final guess
+        candidates = ai.get_top_candidates(10)
+        guesses += 1
+        solved = bool(candidates) and candidates[0]['ID'] == target['ID']
+
+    return {
+        'target': target['ID'],
+        'questions': ai.questions_asked,
+        'guesses': guesses,
+        'solved': solved
+    }
+
+
+def run_self_play(ai: TwentyQuestionsAI, targets: List[Dict[str, Any]]) -> Dict[str, Any]:
+    results = [play_simulated_game(ai, target) for target in targets]
+    questions = [r['questions'] + r['guesses'] for r in results]
+    return {
+        'games': len(results),
+        'avg_questions': statistics.mean(questions),
+        'max_questions': max(questions),
+        'solve_rate': sum(r['solved'] for r in results) / len(results)
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Self-play comparison of question selection")
+    parser.add_argument('--db', default="database_files/database/pokemon_database.db")
+    parser.add_argument('--limit', type=int, default=None, help="only play against this many targets")
+    parser.add_argument('--use-learning', action='store_true', help="enable the popularity bias")
+    parser.add_argument('--training-passes', type=int, default=1,
+                        help="games played to warm up the adaptive selector before measuring")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    db = PokemonDatabase(args.db)
+    baseline_ai = TwentyQuestionsAI(db, use_learning=args.use_learning)
+
+    # targets come from the AI so they carry derived columns like Evolution_Stage
+    targets = list(baseline_ai.remaining_pokemon)
+    rng = random.Random(args.seed)
+    rng.shuffle(targets)
+    if args.limit:
+        targets = targets[:args.limit]
+
+    baseline = run_self_play(baseline_ai, targets)
+
+    # in-memory selector, self-play never touches the stored stats
+    selector = AdaptiveQuestionSelector()
+    adaptive_ai = TwentyQuestionsAI(db, use_learning=args.use_learning, question_selector=selector)
+    for _ in range(args.training_passes):
+        training_targets = list(targets)
+        rng.shuffle(training_targets)
+        run_self_play(adaptive_ai, training_targets)
+    adaptive = run_self_play(adaptive_ai, targets)
+    db.close()
+
+    print(f"{'strategy':<12} {'games':>6} {'avg q':>7} {'max q':>6} {'solved':>7}")
+    for name, result in (('baseline', baseline), ('adaptive', adaptive)):
+        print(f"{name:<12} {result['games']:>6} {result['avg_questions']:>7.2f} "
+              f"{result['max_questions']:>6} {result['solve_rate']:>7.1%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+import argparse
+import builtins
+import contextlib
+import os
+import random
+import resource
+import shutil
+import sqlite3
+import sys
+import tempfile
+import time
+from typing import Dict, Any
+from game_ai import pokemon_matches
+from main import TwentyQuestionsGame
+
+
+def stack_depth() -> int:
+    depth = 0
+    frame = sys._getframe(1)
+    while frame is not None:
+        depth += 1
+        frame = frame.f_back
+    return depth
+
+
+def resident_mb() -> float:
+    # current RSS where /proc has it, otherwise the peak (which can only show growth, never a drop)
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / 2 ** 20
+    except (OSError, ValueError):
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak / 2 ** 20 if sys.platform == 'darwin' else peak / 1024
+
+
+class ScriptedPlayer:
+    def __init__(self, game: TwentyQuestionsGame, games: int, seed: int, sample_every: int):
+        # answers every prompt of the real game loop truthfully for a rotating target,
+        # noting the stack depth at each prompt and RSS every sample_every games
+        self.game = game
+        self.games = games
+        self.sample_every = sample_every
+        self.targets = list(game.ai.remaining_pokemon)
+        random.Random(seed).shuffle(self.targets)
+        self.target = None
+        self.question = None
+        self.played = 0
+        self.solved = 0
+        self.depths = []   # deepest prompt of each game
+        self.samples = []  # (games played, RSS in MB)
+        self._depth = 0
+
+        # the game doesn't say which question it's waiting on, so remember what the AI asked
+        ask_question = game.ai.ask_question
+
+        def remember_question():
+            self.question = ask_question()
+            return self.question
+        game.ai.ask_question = remember_question
+
+    def input(self, prompt: str = '') -> str:
+        self._depth = max(self._depth, stack_depth())
+
+        if prompt == '':
+            # the intro's "press Enter to play", a new game starts
+            self.target = self.targets[self.played % len(self.targets)]
+            return ''
+        if 'Play again?' in prompt:
+            self.played += 1
+            self.depths.append(self._depth)
+            self._depth = 0
+            if self.played % self.sample_every == 0:
+                self.samples.append((self.played, resident_mb()))
+            return 'yes' if self.played < self.games else 'no'
+        if 'Your answer' in prompt:
+            question_type, question_detail = self.question
+            return 'yes' if pokemon_matches(self.target, question_type, question_detail) else 'no'
+        if '(yes/no)' in prompt:
+            # the game always guesses its top candidate
+            guess = self.game.ai.get_top_candidates(1)[0]
+            correct = guess['ID'] == self.target['ID']
+            self.solved += correct
+            return 'yes' if correct else 'no'
+        if 'What Pokemon' in prompt:
+            return self.target['Name']
+        return ''
+
+
+def run_soak(db_path: str, games: int, seed: int, sample_every: int, warmup: int) -> Dict[str, Any]:
+    # plays through TwentyQuestionsGame.start() on a scratch copy of the database
+    workdir = tempfile.mkdtemp(prefix='soak-')
+    try:
+        scratch_db = os.path.join(workdir, 'pokemon_database.db')
+        source = sqlite3.connect(db_path)
+        target = sqlite3.connect(scratch_db)
+        source.backup(target)
+        source.close()
+        target.close()
+
+        game = TwentyQuestionsGame(db_path=scratch_db,
+                                   outcome_log_path=os.path.join(workdir, 'outcomes.jsonl'),
+                                   outcome_archive_path=os.path.join(workdir, 'outcomes.archive.jsonl'))
+        player = ScriptedPlayer(game, games, seed, sample_every)
+        real_input = builtins.input
+        builtins.input = player.input
+        start = time.perf_counter()
+        try:
+            with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+                game.start()
+        finally:
+            builtins.input = real_input
+        elapsed = time.perf_counter() - start
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    settled = [mb for played, mb in player.samples if played > warmup] or [mb for _, mb in player.samples]
+    return {
+        'games': player.played,
+        'solved': player.solved,
+        'seconds': elapsed,
+        'first_depth': player.depths[0] if player.depths else 0,
+        'max_depth': max(player.depths, default=0),
+        'rss_start_mb': settled[0] if settled else 0.0,
+        'rss_end_mb': settled[-1] if settled else 0.0,
+        'rss_peak_mb': max(settled, default=0.0),
+        'samples': player.samples
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Play many games in one session and check nothing grows")
+    parser.add_argument('--db', default="database_files/database/pokemon_database.db",
+                        help="copied to a scratch directory first, the original is never written")
+    parser.add_argument('--games', type=int, default=100000)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--sample-every', type=int, default=1000, help="games between RSS samples")
+    parser.add_argument('--warmup', type=int, default=5000, help="games before RSS counts as settled")
+    parser.add_argument('--rss-tolerance-mb', type=float, default=16.0,
+                        help="allowed RSS growth between the first settled sample and the last")
+    args = parser.parse_args()
+
+    result = run_soak(args.db, args.games, args.seed, min(args.sample_every, args.games), args.warmup)
+    growth = result['rss_end_mb'] - result['rss_start_mb']
+    print(f"{result['games']} games in {result['seconds']:.0f}s, {result['solved']} solved")
+    print(f"stack depth at prompts: {result['first_depth']} in the first game, {result['max_depth']} deepest")
+    print(f"RSS after warm-up: {result['rss_start_mb']:.1f} MB -> {result['rss_end_mb']:.1f} MB "
+          f"(peak {result['rss_peak_mb']:.1f} MB, growth {growth:+.1f} MB)")
+
+    failures = []
+    if result['games'] != args.games:
+        failures.append(f"session ended after {result['games']} of {args.games} games")
+    if result['max_depth'] > result['first_depth']:
+        failures.append("stack depth grew across games")
+    if growth > args.rss_tolerance_mb:
+        failures.append(f"RSS grew by {growth:.1f} MB")
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+from concurrent.futures import ThreadPoolExecutor, Future
+from typing import Dict, Any, List, Tuple, Optional
+
+
+class SpeculativeCounter:
+    def __init__(self, ai):
+        # while the player thinks, count the next turn's histograms for both answers;
+        # only the counting is done ahead, scoring still sees the selector as it is once the answer is in
+        self.ai = ai
+        self.pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix='speculate')
+        self._pending = None   # (candidates asked from, question_type, question_detail, {answer: Future})
+        self.stats = {'hits': 0, 'misses': 0}
+
+    def start(self, question_type: str, question_detail: Any):
+        # called once the question is on screen, before waiting for the answer
+        self.cancel()
+        ai = self.ai
+        candidates = ai.remaining_pokemon  # replaced, never mutated, by filtering
+        asked = {name: set(values) for name, values in ai.asked.items()}
+        asked[question_type].add(question_detail)
+        family = ai.questions[question_type]
+        futures = {answer: self.pool.submit(self._count_branch, family, candidates, question_detail, answer, asked)
+                   for answer in (True, False)}
+        self._pending = (candidates, question_type, question_detail, futures)
+
+    def _count_branch(self, family, candidates: List[Dict[str, Any]], question_detail: Any, answer: bool,
+                      asked: Dict[str, set]) -> Tuple[int, Dict[str, Dict[Any, int]], Optional[tuple]]:
+        return self.ai.count_candidates(family.filter(candidates, question_detail, answer), asked)
+
+    def take(self) -> Optional[Tuple[int, Dict[str, Dict[Any, int]], Optional[tuple]]]:
+        # the counts for the turn the AI is now on, or None if the game went somewhere else (e.g. an undo)
+        if self._pending is None:
+            return None
+        candidates, question_type, question_detail, futures = self._pending
+        self._pending = None
+
+        ai = self.ai
+        matches = (ai.question_history and ai._turns
+                   and ai.question_history[-1][:2] == (question_type, question_detail)
+                   and ai._turns[-1][1] is not None and ai._turns[-1][0][0] is candidates)
+        if not matches:
+            self._cancel(futures)
+            self.stats['misses'] += 1
+            return None
+
+        answer = ai.question_history[-1][2]
+        futures[not answer].cancel()
+        self.stats['hits'] += 1
+        return futures[answer].result()
+
+    def cancel(self):
+        if self._pending is not None:
+            self._cancel(self._pending[3])
+            self._pending = None
+
+    @staticmethod
+    def _cancel(futures: Dict[bool, Future]):
+        for future in futures.values():
+            future.cancel()
+
+    def close(self):
+        self.cancel()
+        self.pool.shutdown(wait=True)
@@ -0,0 +1,310 @@
+import argparse
+import hashlib
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, Future
+from functools import partial
+from http.server import ThreadingHTTPServer, SimpleHTTPRequestHandler
+from typing import Dict, Any, List, Optional
+from urllib.parse import urlsplit
+
+import requests
+
+SPRITE_CACHE_DIR = "database_files/sprites"
+
+
+class SpriteStore:
+    def __init__(self, store_dir: str):
+        # content-addressed: bodies/ holds each image once under its sha256,
+        # urls/ maps the sha256 of a URL to the body it last returned
+        self.store_dir = store_dir
+        os.makedirs(os.path.join(store_dir, 'bodies'), exist_ok=True)
+        os.makedirs(os.path.join(store_dir, 'urls'), exist_ok=True)
+
+    def _url_path(self, url: str) -> str:
+        digest = hashlib.sha256(url.encode('utf-8')).hexdigest()
+        return os.path.join(self.store_dir, 'urls', digest[:2], digest)
+
+    def body_path(self, digest: str) -> str:
+        return os.path.join(self.store_dir, 'bodies', digest[:2], digest + '.png')
+
+    def _write_atomic(self, path: str, data: bytes):
+        # temp file and rename, so a reader never sees half an image
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path))
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+    def path_for(self, url: str) -> Optional[str]:
+        try:
+            with open(self._url_path(url), 'r') as f:
+                path = self.body_path(f.read().strip())
+        except OSError:
+            return None
+        return path if os.path.exists(path) else None
+
+    def load(self, url: str) -> Optional[bytes]:
+        path = self.path_for(url)
+        if path is None:
+            return None
+        try:
+            with open(path, 'rb') as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def store(self, url: str, body: bytes) -> str:
+        digest = hashlib.sha256(body).hexdigest()
+        path = self.body_path(digest)
+        if not os.path.exists(path):
+            self._write_atomic(path, body)
+        self._write_atomic(self._url_path(url), digest.encode('utf-8'))
+        return path
+
+
+class SpriteCache:
+    def __init__(self, store_dir: str = SPRITE_CACHE_DIR, capacity: int = 64, mirror: str = None,
+                 workers: int = 4, timeout: float = 10.0):
+        # memory LRU in front of the disk store in front of the network;
+        # mirror swaps the scheme and host of every sprite URL, e.g. for a local stand-in server
+        self.store = SpriteStore(store_dir)
+        self.capacity = capacity
+        self.mirror = mirror.rstrip('/') if mirror else None
+        self.timeout = timeout
+        self.session = requests.Session()
+        self.pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='sprite')
+        self._memory = OrderedDict()   # URL -> image bytes, least recently used first
+        self._pending = {}             # URL -> Future of a fetch already under way
+        self._lock = threading.Lock()
+        self.stats = {'memory_hits': 0, 'disk_hits': 0, 'fetches': 0, 'errors': 0, 'prefetched': 0}
+
+    def resolve(self, url: str) -> str:
+        if not self.mirror:
+            return url
+        parts = urlsplit(url)
+        return self.mirror + parts.path + (f"?{parts.query}" if parts.query else '')
+
+    def _remember(self, url: str, body: bytes):
+        # caller holds the lock
+        self._memory[url] = body
+        self._memory.move_to_end(url)
+        while len(self._memory) > self.capacity:
+            self._memory.popitem(last=False)
+
+    def peek(self, url: str) -> Optional[bytes]:
+        # memory only, never blocks on I/O; None means the sprite isn't ready yet
+        with self._lock:
+            body = self._memory.get(url)
+            if body is not None:
+                self._memory.move_to_end(url)
+                self.stats['memory_hits'] += 1
+            return body
+
+    def get(self, url: str) -> Optional[bytes]:
+        # the sprite's bytes, waiting on disk or the network if it has to
+        if not url:
+            return None
+        body = self.peek(url)
+        if body is not None:
+            return body
+        return self._load_or_fetch(url).result()
+
+    def prefetch(self, urls: List[str]):
+        # start loading sprites in the background, skipping ones in memory or already on the way
+        for url in urls:
+            if not url:
+                continue
+            with self._lock:
+                if url in self._memory or url in self._pending:
+                    continue
+                self.stats['prefetched'] += 1
+            self._load_or_fetch(url)
+
+    def _load_or_fetch(self, url: str) -> Future:
+        # one load per URL at a time, later callers share the first one's future
+        with self._lock:
+            future = self._pending.get(url)
+            if future is not None:
+                return future
+            future = self._pending[url] = self.pool.submit(self._load, url)
+        return future
+
+    def _load(self, url: str) -> Optional[bytes]:
+        try:
+            body = self.store.load(url)
+            if body is not None:
+                stat = 'disk_hits'
+            else:
+                body = self._fetch(url)
+                stat = 'fetches' if body is not None else 'errors'
+            with self._lock:
+                self.stats[stat] += 1
+                if body is not None:
+                    self._remember(url, body)
+            return body
+        finally:
+            with self._lock:
+                self._pending.pop(url, None)
+
+    def _fetch(self, url: str) -> Optional[bytes]:
+        try:
+            response = self.session.get(self.resolve(url), timeout=self.timeout)
+        except requests.RequestException:
+            return None
+        if response.status_code != 200:
+            return None
+        self.store.store(url, response.content)
+        return response.content
+
+    def path_for(self, url: str) -> Optional[str]:
+        return self.store.path_for(url) if url else None
+
+    def close(self):
+        self.pool.shutdown(wait=True)
+        self.session.close()
+
+
+class SpritePrefetcher:
+    def __init__(self, cache: SpriteCache, ai, threshold: int = 20, lookahead: int = 5):
+        # once the candidates are down to threshold, the likeliest guesses start loading
+        self.cache = cache
+        self.ai = ai
+        self.threshold = threshold
+        self.lookahead = lookahead
+
+    def update(self):
+        # call after every answer or wrong guess; cheap when there are still too many candidates
+        if self.ai.get_remaining_count() > self.threshold:
+            return
+        self.cache.prefetch([p.get('Sprite_Default') for p in self.ai.get_top_candidates(self.lookahead)])
+
+
+def record_sprites(db_path: str, mirror_dir: str):
+    # download every sprite into mirror_dir, laid out by URL path so serve_mirror can stand in for the host
+    from database_helper import PokemonDatabase
+
+    db = PokemonDatabase(db_path)
+    db.cursor.execute("SELECT Sprite_Default FROM mytable WHERE Sprite_Default IS NOT NULL")
+    urls = [row[0] for row in db.cursor.fetchall()]
+    db.close()
+
+    session = requests.Session()
+    for url in urls:
+        path = os.path.join(mirror_dir, urlsplit(url).path.lstrip('/'))
+        if os.path.exists(path):
+            continue
+        response = session.get(url, timeout=30)
+        if response.status_code != 200:
+            print(f"skipped {url} ({response.status_code})")
+            continue
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'wb') as f:
+            f.write(response.content)
+    print(f"{len(urls)} sprites in {mirror_dir}")
+
+
+def make_mirror_server(mirror_dir: str, port: int = 0, latency: float = 0.0) -> ThreadingHTTPServer:
+    # static file server over a recorded mirror, latency added to every response
+    class Handler(SimpleHTTPRequestHandler):
+        def do_GET(self):
+            if latency:
+                time.sleep(latency)
+            super().do_GET()
+
+        def log_message(self, format, *args):
+            pass
+
+    return ThreadingHTTPServer(('127.0.0.1', port), partial(Handler, directory=mirror_dir))
+
+
+def simulate(db_path: str, cache: SpriteCache, games: int, threshold: int, think_time: float) -> Dict[str, Any]:
+    # self-play with the prefetcher on: how often was the guessed sprite already in memory?
+    from database_helper import PokemonDatabase
+    from game_ai import TwentyQuestionsAI, pokemon_matches
+
+    db = PokemonDatabase(db_path)
+    ai = TwentyQuestionsAI(db, use_learning=True)
+    prefetcher = SpritePrefetcher(cache, ai, threshold)
+    targets = list(ai.remaining_pokemon)[:games]
+    ready = waited = 0
+    wait_ms = []
+
+    for target in targets:
+        ai.reset()
+        while ai.questions_asked < ai.max_questions and ai.get_remaining_count() > 1:
+            question_type, question_detail = ai.ask_question()
+            if question_type is None:
+                break
+            ai.update_filters(question_type, question_detail,
+                              pokemon_matches(target, question_type, question_detail))
+            prefetcher.update()
+            time.sleep(think_time)  # the player reading the next question
+
+        guess = ai.make_guess()
+        if guess is None:
+            continue
+        if cache.peek(guess['Sprite_Default']) is not None:
+            ready += 1
+        else:
+            start = time.perf_counter()
+            cache.get(guess['Sprite_Default'])
+            wait_ms.append((time.perf_counter() - start) * 1000)
+            waited += 1
+    db.close()
+
+    return {
+        'guesses': ready + waited,
+        'ready': ready,
+        'waited': waited,
+        'max_wait_ms': max(wait_ms, default=0.0),
+        'stats': dict(cache.stats)
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sprite cache tools")
+    subcommands = parser.add_subparsers(dest='command', required=True)
+
+    record = subcommands.add_parser('record', help="download every sprite into a mirror directory")
+    record.add_argument('mirror_dir')
+    record.add_argument('--db', default="database_files/database/pokemon_database.db")
+
+    serve = subcommands.add_parser('serve', help="serve a mirror directory as a stand-in sprite host")
+    serve.add_argument('mirror_dir')
+    serve.add_argument('--port', type=int, default=8766)
+    serve.add_argument('--latency-ms', type=float, default=0.0)
+
+    sim = subcommands.add_parser('simulate', help="self-play with prefetching and report display waits")
+    sim.add_argument('--db', default="database_files/database/pokemon_database.db")
+    sim.add_argument('--mirror', default=None, help="base URL that stands in for the sprite host")
+    sim.add_argument('--cache-dir', default=SPRITE_CACHE_DIR)
+    sim.add_argument('--games', type=int, default=50)
+    sim.add_argument('--threshold', type=int, default=20)
+    sim.add_argument('--think-ms', type=float, default=50.0, help="pause between questions")
+
+    args = parser.parse_args()
+
+    if args.command == 'record':
+        record_sprites(args.db, args.mirror_dir)
+    elif args.command == 'serve':
+        server = make_mirror_server(args.mirror_dir, args.port, args.latency_ms / 1000)
+        print(f"Serving {args.mirror_dir} on http://127.0.0.1:{server.server_port}")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+    else:
+        cache = SpriteCache(args.cache_dir, mirror=args.mirror)
+        result = simulate(args.db, cache, args.games, args.threshold, args.think_ms / 1000)
+        cache.close()
+        print(f"{result['ready']} of {result['guesses']} guesses had their sprite ready, "
+              f"{result['waited']} waited (worst {result['max_wait_ms']:.1f} ms)")
+        print(', '.join(f"{key}: {value}" for key, value in result['stats'].items()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,185 @@
+import argparse
+import re
+import sqlite3
+import time
+from typing import Dict, Any, List
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_PLACEHOLDER_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_sql(sql: str) -> str:
+    # one shape per statement: literals become ?, IN (?, ?, ...) lists collapse
+    shape = _STRING_LITERAL.sub('?', sql)
+    shape = _NUMBER_LITERAL.sub('?', shape)
+    shape = _PLACEHOLDER_LIST.sub('(...)', shape)
+    return _WHITESPACE.sub(' ', shape).strip()
+
+
+class QueryTracer:
+    def __init__(self):
+        # normalized SQL -> {'count', 'seconds', 'rows', 'sql'}
+        self.queries = {}
+
+    def _entry(self, sql: str) -> Dict[str, Any]:
+        shape = normalize_sql(sql)
+        entry = self.queries.get(shape)
+        if entry is None:
+            entry = self.queries[shape] = {'count': 0, 'seconds': 0.0, 'rows': 0, 'sql': sql}
+        return entry
+
+    def record(self, sql: str, seconds: float, executions: int = 1):
+        entry = self._entry(sql)
+        entry['count'] += executions
+        entry['seconds'] += seconds
+
+    def record_rows(self, sql: str, rows: int, seconds: float):
+        entry = self._entry(sql)
+        entry['rows'] += rows
+        entry['seconds'] += seconds
+
+    def reset(self):
+        self.queries = {}
+
+    def explain(self, connection: sqlite3.Connection, sql: str) -> List[str]:
+        # plan details for one statement; values don't change the plan, so NULLs are bound
+        statement = sql.strip().rstrip(';')
+        parameters = [None] * statement.count('?')
+        try:
+            rows = connection.execute(f"EXPLAIN QUERY PLAN {statement}", parameters).fetchall()
+        except sqlite3.Error as e:
+            return [f"(no plan: {e})"]
+        return [row[-1] for row in rows]
+
+    def report(self, connection: sqlite3.Connection = None) -> List[Dict[str, Any]]:
+        # slowest shapes first; with a connection each one gets its plan and a full-scan flag
+        report = []
+        for shape, entry in sorted(self.queries.items(), key=lambda item: -item[1]['seconds']):
+            row = {'shape': shape, 'count': entry['count'], 'seconds': entry['seconds'],
+                   'rows': entry['rows']}
+            if connection is not None and shape.split(' ', 1)[0].upper() in ('SELECT', 'UPDATE', 'DELETE'):
+                plan = self.explain(connection, entry['sql'])
+                row['plan'] = plan
+                row['full_scan'] = any(is_full_scan(detail) for detail in plan)
+            report.append(row)
+        return report
+
+    def format_report(self, connection: sqlite3.Connection = None) -> str:
+        lines = [f"{'count':>7} {'total ms':>10} {'rows':>9}  statement"]
+        for row in self.report(connection):
+            flag = '  [FULL SCAN]' if row.get('full_scan') else ''
+            lines.append(f"{row['count']:>7} {row['seconds'] * 1000:>10.2f} {row['rows']:>9}  {row['shape']}{flag}")
+            for detail in row.get('plan', []):
+                lines.append(f"{'':>30}{detail}")
+        return '\n'.join(lines)
+
+
+def is_full_scan(plan_detail: str) -> bool:
+    # 'SCAN mytable' reads every row, 'SCAN ... USING (COVERING) INDEX' and 'SEARCH' don't
+    return plan_detail.startswith('SCAN') and 'INDEX' not in plan_detail
+
+
+class TracingCursor:
+    def __init__(self, cursor: sqlite3.Cursor, tracer: QueryTracer):
+        # stands in for a sqlite3 cursor, timing every statement and counting fetched rows
+        self._cursor = cursor
+        self._tracer = tracer
+        self._last_sql = None
+
+    def execute(self, sql: str, parameters=()):
+        start = time.perf_counter()
+        self._cursor.execute(sql, parameters)
+        self._tracer.record(sql, time.perf_counter() - start)
+        self._last_sql = sql
+        return self
+
+    def executemany(self, sql: str, seq_of_parameters):
+        start = time.perf_counter()
+        self._cursor.executemany(sql, seq_of_parameters)
+        self._tracer.record(sql, time.perf_counter() - start, max(self._cursor.rowcount, 1))
+        self._last_sql = sql
+        return self
+
+    def _fetched(self, rows: int, start: float):
+        if self._last_sql is not None:
+            self._tracer.record_rows(self._last_sql, rows, time.perf_counter() - start)
+
+    def fetchone(self):
+        start = time.perf_counter()
+        row = self._cursor.fetchone()
+        self._fetched(1 if row is not None else 0, start)
+        return row
+
+    def fetchmany(self, size: int = None):
+        start = time.perf_counter()
+        rows = self._cursor.fetchmany(size if size is not None else self._cursor.arraysize)
+        self._fetched(len(rows), start)
+        return rows
+
+    def fetchall(self):
+        start = time.perf_counter()
+        rows = self._cursor.fetchall()
+        self._fetched(len(rows), start)
+        return rows
+
+    def __iter__(self):
+        # time each step of the underlying cursor, including the last one that finds no row
+        rows = iter(self._cursor)
+        while True:
+            start = time.perf_counter()
+            try:
+                row = next(rows)
+            except StopIteration:
+                self._fetched(0, start)
+                return
+            self._fetched(1, start)
+            yield row
+
+    def __getattr__(self, name: str):
+        return getattr(self._cursor, name)
+
+
+def exercise_queries(db_path: str, tracer: QueryTracer) -> sqlite3.Connection:
+    # runs every dynamic query shape once on an in-memory copy, so the real table is untouched
+    from database_helper import PokemonDatabase
+    from learning import PopularityLearner
+
+    db = PokemonDatabase(':memory:')
+    source = sqlite3.connect(db_path)
+    source.backup(db.connection)
+    source.close()
+    db.enable_tracing(tracer)
+
+    sample = db.get_pokemon_by_id(25) or db.get_all_pokemon()[0]
+    db.get_pokemon_by_name(sample['Name'])
+    db.get_pokemon_count()
+    db.filter_pokemon('Region', sample['Region'])
+    db.filter_pokemon_multi({'Region': sample['Region'], 'Evolves': sample['Evolves']})
+    db.get_attribute_distribution('Primay_Color')
+    db.get_attribute_distribution('Primay_Color', {'Region': sample['Region']})
+    db.has_type({'Region': sample['Region']}, sample['Type_1'])
+    db.get_all_types()
+    db.get_evolution_stages()
+
+    learner = PopularityLearner(db)
+    candidates = db.filter_pokemon('Type_1', sample['Type_1'])[:5]
+    learner.update_popularity(sample['ID'], candidates, was_correct=True)
+    learner.get_popularity_stats()
+    return db.connection
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Trace PokemonDatabase queries and show their query plans")
+    parser.add_argument('--db', default="database_files/database/pokemon_database.db")
+    args = parser.parse_args()
+
+    tracer = QueryTracer()
+    connection = exercise_queries(args.db, tracer)
+    print(tracer.format_report(connection))
+    connection.close()
+
+
+if __name__ == "__main__":
+    main()
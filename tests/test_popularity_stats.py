@@ -0,0 +1,41 @@
+import random
+from database_helper import PokemonDatabase
+from learning import PopularityLearner, OutcomeLog, OutcomeCompactor
+from popularity_index import PopularityIndex
+
+
+def play_games(learner, pokemon_ids, games, seed=0):
+    # random targets with a few random candidates each, like finished games
+    rng = random.Random(seed)
+    for _ in range(games):
+        candidate_ids = rng.sample(pokemon_ids, rng.randint(1, 5))
+        target = rng.choice(candidate_ids) if rng.random() < 0.8 else rng.choice(pokemon_ids)
+        learner.update_popularity(target, [{'ID': pid} for pid in candidate_ids], target in candidate_ids)
+
+
+def test_direct_updates_keep_stats_in_step(db_path):
+    db = PokemonDatabase(db_path)
+    index = PopularityIndex(db.get_all_pokemon())
+    learner = PopularityLearner(db, index=index)
+
+    play_games(learner, list(range(1, 1026)), games=200)
+
+    assert learner.check_popularity_stats() == []
+    db.close()
+
+
+def test_compacted_outcomes_keep_stats_in_step(db_path, tmp_path):
+    db = PokemonDatabase(db_path)
+    index = PopularityIndex(db.get_all_pokemon())
+    log = OutcomeLog(str(tmp_path / 'outcomes.jsonl'))
+    learner = PopularityLearner(db, outcome_log=log, index=index)
+    compactor = OutcomeCompactor(log, db_path, learner)
+
+    # several compactions, each folding its segment with apply_outcomes
+    for seed in range(3):
+        play_games(learner, list(range(1, 1026)), games=500, seed=seed)
+        compactor.compact_now()
+
+    assert learner.check_popularity_stats() == []
+    log.close()
+    db.close()
@@ -0,0 +1,35 @@
+import sqlite3
+from database_helper import PokemonDatabase
+from game_ai import TwentyQuestionsAI
+
+# all first-stage Kanto Pokemon, so "stage 1?" says nothing about which of them it is
+POPULAR_IDS = (1, 4, 7, 10, 13, 16, 19, 21, 23, 27, 29)
+
+
+def set_popularity(db_path, popular_ids):
+    connection = sqlite3.connect(db_path)
+    connection.execute("UPDATE mytable SET Popularity = 0")
+    connection.executemany("UPDATE mytable SET Popularity = 0.5 WHERE ID = ?", [(pid,) for pid in popular_ids])
+    connection.commit()
+    connection.close()
+
+
+def test_learning_changes_the_first_question(db_path):
+    set_popularity(db_path, POPULAR_IDS)
+    db = PokemonDatabase(db_path)
+
+    baseline = TwentyQuestionsAI(db, use_learning=False).find_best_question()
+    learned = TwentyQuestionsAI(db, use_learning=True).find_best_question()
+
+    assert baseline == ('stage', 1)
+    assert learned != baseline
+    db.close()
+
+
+def test_without_popularity_learning_asks_the_same(db_path):
+    set_popularity(db_path, ())
+    db = PokemonDatabase(db_path)
+
+    assert (TwentyQuestionsAI(db, use_learning=True).find_best_question()
+            == TwentyQuestionsAI(db, use_learning=False).find_best_question())
+    db.close()
@@ -0,0 +1,125 @@
+import json
+import os
+import random
+import sys
+import threading
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                'database_files', 'database_construction', 'code_to_get_data'))
+
+import api
+from fixture_server import API_BASE_URL, fixture_path, make_server
+from rate_limiter import AdaptiveTokenBucket, RetryPolicy
+
+NAMES = {1: 'bulbasaur', 2: 'ivysaur', 3: 'venusaur', 4: 'charmander', 5: 'charmeleon', 6: 'charizard'}
+
+
+class RecordingBucket(AdaptiveTokenBucket):
+    # the rate after every success or throttle, in order
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.rates = []
+        self.throttles = 0
+
+    def on_success(self):
+        super().on_success()
+        self.rates.append(self.rate)
+
+    def on_throttle(self, retry_after=None):
+        super().on_throttle(retry_after)
+        self.rates.append(self.rate)
+        self.throttles += 1
+
+
+def chain_link(first_id, stage=0):
+    # first_id -> first_id + 1 -> first_id + 2
+    species_id = first_id + stage
+    return {
+        'species': {'name': NAMES[species_id], 'url': f"{API_BASE_URL}pokemon-species/{species_id}/"},
+        'evolution_details': [{'trigger': {'name': 'level-up'}, 'item': None}] if stage else [],
+        'evolves_to': [chain_link(first_id, stage + 1)] if stage < 2 else []
+    }
+
+
+def write_fixtures(fixture_dir):
+    # just enough of each response for build_pokemon_entry, two three-stage chains in generation I
+    responses = {'generation/1/': {'main_region': {'name': 'kanto'}}}
+    for chain_id, first_id in ((1, 1), (2, 4)):
+        responses[f"evolution-chain/{chain_id}/"] = {'id': chain_id, 'chain': chain_link(first_id)}
+        for species_id in range(first_id, first_id + 3):
+            name = NAMES[species_id]
+            responses[f"pokemon/{species_id}"] = {
+                'name': name,
+                'types': [{'type': {'name': 'grass' if chain_id == 1 else 'fire'}}],
+                'sprites': {'front_default': None}
+            }
+            responses[f"pokemon-species/{species_id}"] = {
+                'egg_groups': [{'name': 'monster'}],
+                'is_legendary': False, 'is_mythical': False, 'is_baby': False,
+                'evolves_from_species': {'name': NAMES[species_id - 1]} if species_id != first_id else None,
+                'generation': {'name': 'generation-i', 'url': f"{API_BASE_URL}generation/1/"},
+                'color': {'name': 'green' if chain_id == 1 else 'red'},
+                'gender_rate': 1,
+                'varieties': [{'is_default': True, 'pokemon': {'name': name}}],
+                'evolution_chain': {'url': f"{API_BASE_URL}evolution-chain/{chain_id}/"}
+            }
+    for api_path, body in responses.items():
+        path = fixture_path(fixture_dir, api_path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w') as f:
+            json.dump(body, f)
+
+
+@pytest.fixture
+def fixture_server(tmp_path, monkeypatch):
+    # returns a function that starts a misbehaving server and points api.py at it
+    # run-wide state in api.py starts fresh for each test
+    monkeypatch.setattr(api, 'http_stats', api.HttpStats())
+    monkeypatch.setattr(api, 'shared_lookups', api.SingleFlight())
+    monkeypatch.setattr(api, 'evolution_graph', api.EvolutionGraph())
+    write_fixtures(str(tmp_path))
+    servers = []
+
+    def start(max_rps=None, error_rate=0.0, limiter=None, retries=None):
+        server = make_server(str(tmp_path), max_rps=max_rps, error_rate=error_rate)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+        api.configure_http(pool_size=4, base_url=f"http://127.0.0.1:{server.server_port}/api/v2/",
+                           limiter=limiter, retries=retries)
+        return server
+
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+    api.configure_http()
+
+
+def test_throttled_flaky_server_still_gives_every_id(fixture_server):
+    random.seed(0)
+    # starts well above what the server allows, so the first burst is throttled
+    limiter = RecordingBucket(rate=20.0, burst=10)
+    fixture_server(max_rps=4, error_rate=0.2, limiter=limiter,
+                   retries=RetryPolicy(max_retries=20, base_delay=0.05, max_delay=0.5))
+
+    results = list(api.collect_pokemon(list(NAMES), workers=4))
+
+    assert [(pokemon_id, failure) for pokemon_id, _, failure in results] == [(i, None) for i in NAMES]
+    assert [entry['Name'] for _, entry, _ in results] == [name.capitalize() for name in NAMES.values()]
+    assert results[1][1]['Evolves_from'] == 'Bulbasaur' and results[1][1]['Evolves']
+    assert api.http_stats.throttled > 0 and limiter.throttles > 0
+
+    # halved on a 429, then climbing back on the successes that followed
+    lowest = min(limiter.rates)
+    assert lowest < 20.0
+    assert limiter.rates[-1] > lowest
+
+
+def test_retries_stop_at_the_policy_limit(fixture_server):
+    fixture_server(error_rate=1.0, retries=RetryPolicy(max_retries=3, base_delay=0.01))
+
+    assert api.call_pokemon_api(1) is None
+    assert api.http_stats.requests == 4
+    assert api.http_stats.retries == 3
+    assert api.http_stats.server_errors == 3
@@ -0,0 +1,13 @@
+from tournament import CONFIGURATIONS, run_tournament
+
+
+def test_adaptive_results_do_not_depend_on_the_workers(db_path):
+    configurations = [('adaptive', CONFIGURATIONS['adaptive'])]
+    distributions = {'uniform': list(range(1, 61))}
+
+    runs = [run_tournament(db_path, configurations, distributions, workers=workers, chunk_size=15)
+            for workers in (1, 3)]
+
+    for summaries in runs:
+        del summaries['uniform']['adaptive']['cpu_ms_per_game']
+    assert runs[0] == runs[1]
@@ -0,0 +1,35 @@
+import copy
+from database_helper import PokemonDatabase
+from game_ai import TwentyQuestionsAI
+from learning import AdaptiveQuestionSelector
+
+
+def stored_stats(db):
+    db.cursor.execute("SELECT Question_Type, Question_Detail, Total_Reduction, Times_Used FROM question_stats")
+    return sorted(tuple(row) for row in db.cursor.fetchall())
+
+
+def test_undo_then_reanswer_records_the_question_once(db_path):
+    db = PokemonDatabase(db_path)
+    # flushing after every result puts the database through the undo as well
+    selector = AdaptiveQuestionSelector(db, flush_every=1)
+    ai = TwentyQuestionsAI(db, use_learning=False, question_selector=selector)
+
+    ai.update_filters(*ai.find_best_question(), True)
+    before = copy.deepcopy(selector.question_effectiveness)
+    question = ai.find_best_question()
+
+    ai.update_filters(*question, False)
+    answered = copy.deepcopy(selector.question_effectiveness)
+    answered_rows = stored_stats(db)
+
+    assert ai.undo() == (*question, False)
+    selector.flush()
+    assert selector.question_effectiveness == before
+    assert question not in {row[:2] for row in stored_stats(db)}
+
+    ai.update_filters(*question, False)
+    selector.flush()
+    assert selector.question_effectiveness == answered
+    assert stored_stats(db) == answered_rows
+    db.close()
@@ -0,0 +1,158 @@
+import argparse
+import json
+import os
+import random
+import statistics
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Any, List, Tuple
+from database_helper import PokemonDatabase
+from game_ai import TwentyQuestionsAI, POPULARITY_SMOOTHING
+from learning import AdaptiveQuestionSelector
+from simulation import play_simulated_game
+
+# named TwentyQuestionsAI setups; 'adaptive' gets an in-memory question selector
+# that learns as a chunk's games go, so it never touches the stored stats
+CONFIGURATIONS = {
+    'baseline': {'use_learning': False, 'adaptive': False},
+    'learning': {'use_learning': True, 'adaptive': False},
+    'adaptive': {'use_learning': False, 'adaptive': True},
+    'adaptive+learning': {'use_learning': True, 'adaptive': True},
+}
+
+# one AI per (database, use_learning, adaptive) in each worker process, reused across chunks
+_worker_ais = {}
+
+
+def parse_configuration(text: str) -> Tuple[str, Dict[str, Any]]:
+    # 'name' for a built-in, or 'name:use_learning=1,adaptive=0' for a custom one
+    if ':' not in text:
+        if text not in CONFIGURATIONS:
+            raise ValueError(f"unknown configuration '{text}', choose from {', '.join(CONFIGURATIONS)}")
+        return text, dict(CONFIGURATIONS[text])
+
+    name, settings = text.split(':', 1)
+    config = {'use_learning': False, 'adaptive': False}
+    for setting in filter(None, settings.split(',')):
+        key, value = setting.split('=', 1)
+        if key not in config:
+            raise ValueError(f"unknown setting '{key}' in '{text}'")
+        config[key] = value.strip().lower() in ('1', 'true', 'yes', 'on')
+    return name, config
+
+
+def _get_ai(db_path: str, config: Dict[str, Any]) -> Tuple[TwentyQuestionsAI, Dict[int, Dict[str, Any]]]:
+    # keyed by the settings, not the display name, so a custom name for a built-in shares its AI
+    key = (db_path, config['use_learning'], config['adaptive'])
+    if key not in _worker_ais:
+        db = PokemonDatabase(db_path)
+        ai = TwentyQuestionsAI(db, use_learning=config['use_learning'])
+        # targets come from the AI so they carry derived columns like Evolution_Stage
+        _worker_ais[key] = (ai, {p['ID']: p for p in ai.remaining_pokemon})
+    return _worker_ais[key]
+
+
+def play_chunk(db_path: str, config: Dict[str, Any], target_ids: List[int]) -> List[Dict[str, Any]]:
+    # runs in a worker process: one game per target, with the CPU time each game took
+    ai, targets = _get_ai(db_path, config)
+    # a fresh selector per chunk, so what it learns can't depend on which chunks a worker ran before
+    ai.question_selector = AdaptiveQuestionSelector() if config['adaptive'] else None
+    results = []
+    for target_id in target_ids:
+        start = time.process_time()
+        result = play_simulated_game(ai, targets[target_id])
+        result['cpu_seconds'] = time.process_time() - start
+        results.append(result)
+    return results
+
+
+def summarize(results: List[Dict[str, Any]]) -> Dict[str, Any]:
+    questions = sorted(r['questions'] + r['guesses'] for r in results)
+    return {
+        'games': len(results),
+        'mean_questions': statistics.mean(questions),
+        'p95_questions': questions[min(len(questions) - 1, int(len(questions) * 0.95))],
+        'solve_rate': sum(r['solved'] for r in results) / len(results),
+        'cpu_ms_per_game': statistics.mean(r['cpu_seconds'] for r in results) * 1000
+    }
+
+
+def target_distributions(db_path: str, weighted_games: int, smoothing: float,
+                         seed: int) -> Dict[str, List[int]]:
+    # every Pokemon once, and optionally a sample weighted by learned popularity
+    db = PokemonDatabase(db_path)
+    db.cursor.execute("SELECT ID, Popularity FROM mytable ORDER BY ID")
+    rows = db.cursor.fetchall()
+    db.close()
+
+    distributions = {'uniform': [row[0] for row in rows]}
+    if weighted_games:
+        weights = [max(row[1] or 0, 0) + smoothing for row in rows]
+        rng = random.Random(seed)
+        distributions['popularity'] = rng.choices([row[0] for row in rows], weights=weights, k=weighted_games)
+    return distributions
+
+
+def run_tournament(db_path: str, configurations: List[Tuple[str, Dict[str, Any]]],
+                   distributions: Dict[str, List[int]], workers: int = None,
+                   chunk_size: int = 100) -> Dict[str, Dict[str, Dict[str, Any]]]:
+    # distribution -> configuration -> summary, every chunk of every pairing on the pool
+    jobs = {}
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for distribution, target_ids in distributions.items():
+            for name, config in configurations:
+                jobs[(distribution, name)] = [
+                    pool.submit(play_chunk, db_path, config, target_ids[i:i + chunk_size])
+                    for i in range(0, len(target_ids), chunk_size)
+                ]
+
+        summaries = {}
+        for (distribution, name), futures in jobs.items():
+            results = []
+            for future in futures:
+                results.extend(future.result())
+            summaries.setdefault(distribution, {})[name] = summarize(results)
+    return summaries
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Play AI configurations against each other on every target")
+    parser.add_argument('--db', default="database_files/database/pokemon_database.db")
+    parser.add_argument('--configs', default='baseline,learning',
+                        help="comma separated built-ins (" + ', '.join(CONFIGURATIONS) + ")")
+    parser.add_argument('--config', action='append', default=[], metavar='NAME:KEY=VALUE,...',
+                        help="extra custom configuration, e.g. 'mine:use_learning=1,adaptive=1'")
+    parser.add_argument('--weighted-games', type=int, default=0,
+                        help="also play this many targets drawn by popularity")
+    parser.add_argument('--smoothing', type=float, default=POPULARITY_SMOOTHING,
+                        help="added to every popularity weight so unplayed Pokemon still come up")
+    parser.add_argument('--workers', type=int, default=None, help="process pool size (default: CPU count)")
+    parser.add_argument('--chunk-size', type=int, default=100, help="games per pool task")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', default=None, help="also write the results as JSON")
+    args = parser.parse_args()
+
+    configurations = [parse_configuration(name) for name in args.configs.split(',') if name]
+    configurations += [parse_configuration(text) for text in args.config]
+
+    distributions = target_distributions(args.db, args.weighted_games, args.smoothing, args.seed)
+    start = time.perf_counter()
+    summaries = run_tournament(args.db, configurations, distributions, args.workers, args.chunk_size)
+    elapsed = time.perf_counter() - start
+
+    print(f"{'targets':<11} {'configuration':<18} {'games':>6} {'mean q':>7} {'p95 q':>6} "
+          f"{'solved':>7} {'cpu/game':>9}")
+    for distribution, by_config in summaries.items():
+        for name, summary in by_config.items():
+            print(f"{distribution:<11} {name:<18} {summary['games']:>6} {summary['mean_questions']:>7.2f} "
+                  f"{summary['p95_questions']:>6} {summary['solve_rate']:>7.1%} "
+                  f"{summary['cpu_ms_per_game']:>7.1f}ms")
+    print(f"\n{elapsed:.1f}s on {args.workers or os.cpu_count()} worker(s)")
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(summaries, f, indent=4)
+
+
+if __name__ == "__main__":
+    main()